@@ -1,39 +1,219 @@
+import argparse
+import asyncio
+import hashlib
+import json
 import os
+import sys
+import tempfile
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from logging import INFO, basicConfig, getLogger
-from uuid import UUID
+from urllib.parse import urlsplit
 
-import requests
+from requests import Response, Session
 
-from src.models.agent.agent import Agent, AgentUUID
-from src.models.game_map.game_map import GameMap, MapUUID
-from valorant_client.client import ValorantClient
+from src.models.agent.agent import Agent
+from src.models.game_map.game_map import GameMap
+from valorant_client.async_client import AsyncValorantClient
+from valorant_client.cache import DiskResponseCache, conditional_headers
+from valorant_client.client import ValorantClient, create_session
+from valorant_client.metrics import NULL_METRICS, Metrics, MetricsRecorder
+from valorant_client.sync import fetch_bulk
+from valorant_client.throttle import (
+    UNTHROTTLED,
+    Throttle,
+    add_throttle_arguments,
+    throttle_from_args,
+)
 
 basicConfig(level=INFO)
 logger = getLogger(__name__)
 
 
+@dataclass
+class AssetResult:
+    url: str
+    path: str
+    success: bool
+    size: int = 0
+    error: str | None = None
+    unchanged: bool = False
+
+
+@dataclass
+class ManifestEntry:
+    url: str
+    size: int
+    sha256: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        return conditional_headers(self.etag, self.last_modified)
+
+
+class AssetManifest:
+    FILE_NAME = "manifest.json"
+
+    def __init__(self, path: str, entries: dict[str, ManifestEntry] | None = None):
+        self.path = path
+        self.entries = entries if entries is not None else {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str) -> "AssetManifest":
+        if not os.path.isfile(path):
+            return cls(path)
+        with open(path) as file:
+            data = json.load(file)
+        return cls(path, {name: ManifestEntry(**entry) for name, entry in data.get("assets", {}).items()})
+
+    def save(self) -> None:
+        with self._lock:
+            data = {"assets": {name: asdict(self.entries[name]) for name in sorted(self.entries)}}
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=directory, suffix=".tmp", delete=False) as file:
+            json.dump(data, file, indent=2)
+            file.write("\n")
+        os.replace(file.name, self.path)
+
+    def get(self, name: str) -> ManifestEntry | None:
+        with self._lock:
+            return self.entries.get(name)
+
+    def set(self, name: str, entry: ManifestEntry) -> None:
+        with self._lock:
+            self.entries[name] = entry
+
+    def remove(self, name: str) -> None:
+        with self._lock:
+            self.entries.pop(name, None)
+
+    @staticmethod
+    def file_digest(path: str) -> tuple[int, str]:
+        digest = hashlib.sha256()
+        size = 0
+        with open(path, "rb") as file:
+            while chunk := file.read(AssetDownloader.CHUNK_SIZE):
+                digest.update(chunk)
+                size += len(chunk)
+        return size, digest.hexdigest()
+
+    def matches(self, name: str, path: str, url: str) -> bool:
+        entry = self.get(name)
+        if entry is None or entry.url != url or not os.path.isfile(path):
+            return False
+        if os.path.getsize(path) != entry.size:
+            return False
+        return self.file_digest(path)[1] == entry.sha256
+
+
 class AssetDownloader:
     DEFAULT_MAP_ASSET_TYPES = ["display_icon", "list_view_icon", "splash"]
     DEFAULT_AGENT_ASSET_TYPES = ["display_icon", "display_icon_small"]
+    DEFAULT_MAX_WORKERS = 8
+    CHUNK_SIZE = 64 * 1024
 
-    def __init__(self, base_directory: str):
+    def __init__(
+        self,
+        base_directory: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        session: Session | None = None,
+        manifest: AssetManifest | None = None,
+        revalidate: bool = True,
+        asset_base_url: str | None = None,
+        throttle: Throttle | None = None,
+        metrics: Metrics = NULL_METRICS,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
         self.base_directory = base_directory
+        self.max_workers = max_workers
+        self.session = session if session is not None else create_session(max_workers)
+        self.manifest = manifest
+        self.revalidate = revalidate
+        self.asset_base_url = asset_base_url.rstrip("/") if asset_base_url else None
+        self.throttle = throttle if throttle is not None else UNTHROTTLED
+        self.metrics = metrics
+        self.results: list[AssetResult] = []
 
-    @staticmethod
-    def _download_asset(url: str, path: str) -> None:
+    def _manifest_name(self, path: str) -> str:
+        return os.path.relpath(path, self.base_directory).replace(os.sep, "/")
+
+    def resolve_url(self, url: str) -> str:
+        # Keeps the media path but swaps the host, so manifests stay keyed by the canonical URL
+        if self.asset_base_url is None:
+            return url
+        parts = urlsplit(url)
+        return f"{self.asset_base_url}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+
+    def _download_asset(self, url: str, path: str) -> AssetResult:
         os.makedirs(os.path.dirname(path), exist_ok=True)
+        name = self._manifest_name(path)
+        entry = None
+        if self.manifest is not None and self.manifest.matches(name, path, url):
+            entry = self.manifest.get(name)
+
         try:
-            logger.info(f"Downloading asset from {url}")
-            response = requests.get(url)
-            response.raise_for_status()
-            with open(path, "wb") as file:
-                file.write(response.content)
+            if entry is not None and not self.revalidate:
+                logger.info(f"Skipping unchanged asset {path}")
+                self.metrics.cache_hit("assets")
+                return AssetResult(url=url, path=path, success=True, size=entry.size, unchanged=True)
+
+            source_url = self.resolve_url(url)
+            logger.info(f"Downloading asset from {source_url}")
+            headers = entry.conditional_headers() if entry is not None else None
+            with self.throttle.request(
+                self.session, source_url, self.metrics, "assets", stream=True, headers=headers
+            ) as response:
+                if response.status_code == 304 and entry is not None:
+                    logger.info(f"Asset {path} is up to date")
+                    self.metrics.cache_hit("assets")
+                    return AssetResult(url=url, path=path, success=True, size=entry.size, unchanged=True)
+                response.raise_for_status()
+                size, sha256 = self._write_atomic(response, path)
+                self.metrics.bytes_received("assets", size)
+                if self.manifest is not None:
+                    self.metrics.cache_miss("assets")
+                    self.manifest.set(
+                        name,
+                        ManifestEntry(
+                            url=url,
+                            size=size,
+                            sha256=sha256,
+                            etag=response.headers.get("ETag"),
+                            last_modified=response.headers.get("Last-Modified"),
+                        ),
+                    )
             logger.info(f"Saved asset to {path}")
+            return AssetResult(url=url, path=path, success=True, size=size)
         except Exception as e:
             logger.exception(f"Error downloading asset: {e}")
+            return AssetResult(url=url, path=path, success=False, error=str(e))
+
+    def _write_atomic(self, response: Response, path: str) -> tuple[int, str]:
+        # Stream into a sibling temp file so readers never observe a partially written asset
+        directory, filename = os.path.split(path)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{filename}.", suffix=".part")
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as file:
+                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                    file.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
             raise
+        return size, digest.hexdigest()
 
-    def _save_assets(self, obj: GameMap | Agent, asset_types: list[str]) -> None:
+    def _asset_jobs(self, obj: GameMap | Agent, asset_types: list[str]) -> list[tuple[str, str]]:
         if isinstance(obj, GameMap):
             assets = {
                 "display_icon": obj.display_icon,
@@ -50,44 +230,148 @@ class AssetDownloader:
         else:
             raise TypeError("Unsupported object type for asset downloading")
 
+        jobs = []
         for asset_name in asset_types:
             url = assets.get(asset_name)
             if url:
                 filename = f"{asset_name}.png"
-                path = os.path.join(directory, filename)
-                self._download_asset(url, path)
+                jobs.append((url, os.path.join(directory, filename)))
             else:
                 logger.warning(f"No URL found for asset type: {asset_name} in {type(obj).__name__}")
+        return jobs
 
-    def save_map_assets(self, game_map: GameMap, asset_types: list[str] | None = None) -> None:
-        if asset_types is None:
-            asset_types = self.DEFAULT_MAP_ASSET_TYPES
-        self._save_assets(game_map, asset_types)
+    def _download_all(self, jobs: list[tuple[str, str]]) -> list[AssetResult]:
+        if self.max_workers == 1 or len(jobs) <= 1:
+            results = [self._download_asset(url, path) for url, path in jobs]
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="asset-downloader") as executor:
+                results = list(executor.map(lambda job: self._download_asset(*job), jobs))
+        self.results.extend(results)
+        return results
 
-    def save_agent_assets(self, agent: Agent, asset_types: list[str] | None = None) -> None:
-        if asset_types is None:
-            asset_types = self.DEFAULT_AGENT_ASSET_TYPES
-        self._save_assets(agent, asset_types)
+    def save_map_assets(self, game_map: GameMap, asset_types: list[str] | None = None) -> list[AssetResult]:
+        return self.save_assets([(game_map, asset_types)])
 
+    def save_agent_assets(self, agent: Agent, asset_types: list[str] | None = None) -> list[AssetResult]:
+        return self.save_assets([(agent, asset_types)])
 
-if __name__ == "__main__":
-    client = ValorantClient()
-    asset_manager = AssetDownloader(base_directory=os.path.join("src", "assets"))
+    def save_assets(self, items: Iterable[tuple[GameMap | Agent, list[str] | None]]) -> list[AssetResult]:
+        jobs = []
+        for obj, asset_types in items:
+            if asset_types is None:
+                is_map = isinstance(obj, GameMap)
+                asset_types = self.DEFAULT_MAP_ASSET_TYPES if is_map else self.DEFAULT_AGENT_ASSET_TYPES
+            jobs.extend(self._asset_jobs(obj, asset_types))
+        return self._download_all(jobs)
 
-    for map_uuid in MapUUID:
-        map_name = map_uuid.name.lower()
-        try:
-            map_data = client.get_map_by_uuid(UUID(map_uuid.value))
-            game_map = GameMap.from_dict(map_data.get("data", {}))
-            asset_manager.save_map_assets(game_map, ["display_icon"])
-        except Exception as e:
-            logger.exception(f"Error downloading data for {map_name}: {e}")
+    def prune_orphans(self) -> list[str]:
+        # Only meaningful after a full, successful sync: anything this run did not ask for is considered stale
+        expected = {self._manifest_name(result.path) for result in self.results}
+        removed: list[str] = []
+        if not expected:
+            logger.warning("Nothing was synced, refusing to prune assets")
+            return removed
+        if any(not result.success for result in self.results):
+            logger.warning("Some assets failed to sync, refusing to prune assets")
+            return removed
 
-    for agent_uuid in AgentUUID:
-        agent_name = agent_uuid.name.lower()
-        try:
-            agent_data = client.get_agent_by_uuid(UUID(agent_uuid.value))
-            agent = Agent.from_dict(agent_data.get("data", {}))
-            asset_manager.save_agent_assets(agent, ["display_icon_small"])
-        except Exception as e:
-            logger.exception(f"Error downloading data for {agent_name}: {e}")
+        if self.manifest is not None:
+            for name in list(self.manifest.entries):
+                if name not in expected:
+                    self.manifest.remove(name)
+
+        for directory, _, filenames in os.walk(self.base_directory, topdown=False):
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                if filename.endswith((".png", ".part")) and self._manifest_name(path) not in expected:
+                    os.remove(path)
+                    removed.append(path)
+                    logger.info(f"Removed orphaned asset {path}")
+            if directory != self.base_directory and not os.listdir(directory):
+                os.rmdir(directory)
+        return removed
+
+    def save_manifest(self) -> None:
+        if self.manifest is not None:
+            self.manifest.save()
+            logger.info(f"Saved asset manifest to {self.manifest.path}")
+
+    def log_summary(self) -> None:
+        failures = [result for result in self.results if not result.success]
+        unchanged = [result for result in self.results if result.unchanged]
+        for result in self.results:
+            if not result.success:
+                logger.error(f"FAILED    {result.path} from {result.url}: {result.error}")
+            elif result.unchanged:
+                logger.info(f"UNCHANGED {result.path} ({result.size} bytes)")
+            else:
+                logger.info(f"OK        {result.path} ({result.size} bytes)")
+        downloaded_size = sum(result.size for result in self.results if result.success and not result.unchanged)
+        logger.info(
+            f"Downloaded {len(self.results) - len(failures) - len(unchanged)}/{len(self.results)} assets "
+            f"({downloaded_size} bytes), {len(unchanged)} unchanged, {len(failures)} failed"
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+
+async def fetch_objects(client: ValorantClient) -> tuple[list[GameMap], list[Agent]]:
+    async with AsyncValorantClient(client) as async_client:
+        game_maps, agents, _ = await fetch_bulk(async_client)
+    return game_maps, agents
+
+
+def parse_args(argv: list[str] | None = None, prog: str | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog=prog, description="Download agent and map assets from Valorant API")
+    parser.add_argument(
+        "--workers", type=int, default=AssetDownloader.DEFAULT_MAX_WORKERS, help="Number of parallel downloads"
+    )
+    parser.add_argument(
+        "--no-revalidate", action="store_true", help="Skip assets matching the manifest without asking the server"
+    )
+    parser.add_argument("--prune", action="store_true", help="Delete assets that are no longer requested")
+    parser.add_argument(
+        "--base-url", default=ValorantClient.DEFAULT_BASE_URL, help="API root, e.g. a local stub server"
+    )
+    parser.add_argument("--asset-base-url", help="Fetch media from this root instead of the URLs in the API data")
+    add_throttle_arguments(parser)
+    parser.add_argument("--metrics", help="Write request metrics here, Prometheus text for .prom files, else JSON")
+    return parser.parse_args(argv)
+
+
+def main(args: argparse.Namespace) -> int:
+    # One throttle for both, so API and media requests share the in-flight cap
+    throttle = throttle_from_args(args)
+    metrics = MetricsRecorder()
+    client = ValorantClient(cache=DiskResponseCache(), base_url=args.base_url, throttle=throttle, metrics=metrics)
+    base_directory = os.path.join("src", "assets")
+    asset_manager = AssetDownloader(
+        base_directory=base_directory,
+        max_workers=args.workers,
+        manifest=AssetManifest.load(os.path.join(base_directory, AssetManifest.FILE_NAME)),
+        revalidate=not args.no_revalidate,
+        asset_base_url=args.asset_base_url,
+        throttle=throttle,
+        metrics=metrics,
+    )
+
+    game_maps, agents = asyncio.run(fetch_objects(client))
+    asset_manager.save_assets(
+        [(game_map, ["display_icon"]) for game_map in game_maps] + [(agent, ["display_icon_small"]) for agent in agents]
+    )
+    # Pruning is opt-in: a map or agent that failed to parse never gets a result, so its assets would look orphaned
+    if args.prune:
+        asset_manager.prune_orphans()
+    asset_manager.save_manifest()
+    asset_manager.log_summary()
+    asset_manager.close()
+    if args.metrics:
+        metrics.write(args.metrics)
+        logger.info(f"Saved request metrics to {args.metrics}")
+
+    return 1 if any(not result.success for result in asset_manager.results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args()))
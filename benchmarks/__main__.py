@@ -0,0 +1,63 @@
+import argparse
+import importlib
+import os
+import sys
+from datetime import datetime
+from logging import INFO, WARNING, basicConfig, getLogger
+
+from benchmarks.runner import BenchmarkConfig, compare, load_results, write_results
+
+# Per-request INFO logging from the client and downloader would dominate the timings
+basicConfig(level=WARNING)
+logger = getLogger("benchmarks")
+logger.setLevel(INFO)
+
+SUITES = {
+    "models": "benchmarks.bench_models",
+    "view": "benchmarks.bench_view",
+    "client": "benchmarks.bench_client",
+}
+RESULTS_DIRECTORY = os.path.join(".cache", "benchmarks")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the offline benchmark suite")
+    parser.add_argument("suites", nargs="*", help=f"Suites to run ({', '.join(SUITES)}), defaults to all")
+    parser.add_argument("--repeat", type=int, default=BenchmarkConfig.repeat, help="Timed repeats per benchmark")
+    parser.add_argument(
+        "--frames", type=int, nargs="+", default=[10_000, 100_000], help="Synthetic replay sizes, up to 10000000"
+    )
+    parser.add_argument("--requests", type=int, default=BenchmarkConfig.requests, help="Requests per client run")
+    parser.add_argument("--output", help=f"Results JSON, defaults to a timestamped file in {RESULTS_DIRECTORY}")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=1.2, help="Slowdown ratio against the baseline that counts as a regression"
+    )
+    args = parser.parse_args(argv)
+    unknown = [suite for suite in args.suites if suite not in SUITES]
+    if unknown:
+        parser.error(f"unknown suites: {', '.join(unknown)}")
+    return args
+
+
+def main(args: argparse.Namespace) -> int:
+    config = BenchmarkConfig(repeat=args.repeat, frames=args.frames, requests=args.requests)
+    results = []
+    for suite in args.suites or SUITES:
+        logger.info(f"Running {suite} benchmarks")
+        results.extend(importlib.import_module(SUITES[suite]).run(config))
+
+    output = args.output or os.path.join(RESULTS_DIRECTORY, f"{datetime.now():%Y%m%d-%H%M%S}.json")
+    write_results(results, output)
+    logger.info(f"Saved {len(results)} benchmark results to {output}")
+
+    if args.compare:
+        regressions = compare(results, load_results(args.compare), args.threshold)
+        for key, ratio in regressions:
+            logger.error(f"REGRESSION {key}: {ratio:.2f}x slower than {args.compare}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args()))
@@ -0,0 +1,100 @@
+import asyncio
+import tempfile
+from uuid import UUID
+
+from asset_downloader import AssetDownloader
+from benchmarks.runner import (
+    BenchmarkConfig,
+    BenchmarkResult,
+    measure,
+    measure_latencies,
+)
+from src.models.game_map.game_map import GameMap, MapUUID
+from valorant_client.async_client import AsyncValorantClient
+from valorant_client.client import ValorantClient
+from valorant_client.stub_server import StubServer
+from valorant_client.throttle import Throttle
+
+ASSET_COUNT = 64
+LOAD_LATENCY = 0.002
+LOAD_JITTER = 0.008
+LOAD_CONCURRENCY = 16
+# The stub never throttles unless asked to, so the client-side rate limit would only measure itself
+UNLIMITED = Throttle(rate=None, max_in_flight=LOAD_CONCURRENCY)
+
+
+async def fetch_maps_concurrently(client: ValorantClient, map_uuids: list[UUID]) -> None:
+    async with AsyncValorantClient(client) as async_client:
+        await async_client.get_maps_by_uuid(map_uuids)
+
+
+def run(config: BenchmarkConfig) -> list[BenchmarkResult]:
+    results = []
+    with StubServer() as server:
+        client = ValorantClient(base_url=server.base_url, throttle=UNLIMITED)
+        map_uuids = [UUID(uuid) for uuid in server.entries["maps"]]
+        requested = [map_uuids[index % len(map_uuids)] for index in range(config.requests)]
+
+        results.append(
+            measure(
+                "client.get_map_by_uuid",
+                lambda: [client.get_map_by_uuid(map_uuid) for map_uuid in requested],
+                repeat=config.repeat,
+                items=len(requested),
+            )
+        )
+        results.append(
+            measure(
+                "client.get_all_agents",
+                client.get_all_agents,
+                repeat=config.repeat,
+                number=20,
+            )
+        )
+        results.append(
+            measure(
+                "async_client.get_maps_by_uuid",
+                lambda: asyncio.run(fetch_maps_concurrently(client, requested)),
+                repeat=config.repeat,
+                items=len(requested),
+            )
+        )
+        client.close()
+
+        game_maps = [
+            GameMap(uuid=MapUUID.ASCENT, name=f"map{index}", display_icon=server.asset_url(f"{index}.png"))
+            for index in range(ASSET_COUNT)
+        ]
+        for workers in (1, AssetDownloader.DEFAULT_MAX_WORKERS):
+            results.append(
+                measure(
+                    "asset_downloader.save_assets",
+                    lambda: download_assets(game_maps, workers),
+                    repeat=config.repeat,
+                    items=len(game_maps) * len(server.synthetic_asset),
+                    params={"workers": workers},
+                )
+            )
+
+    # Tail latency under concurrent load against a server with injected, jittered latency
+    with StubServer(latency=LOAD_LATENCY, jitter=LOAD_JITTER, seed=0) as server:
+        with ValorantClient(pool_size=LOAD_CONCURRENCY, base_url=server.base_url, throttle=UNLIMITED) as client:
+            results.append(
+                measure_latencies(
+                    "client.load",
+                    lambda index: client.get_map_by_uuid(requested[index % len(requested)]),
+                    calls=config.requests,
+                    concurrency=LOAD_CONCURRENCY,
+                    params={"latency": LOAD_LATENCY, "jitter": LOAD_JITTER},
+                )
+            )
+    return results
+
+
+def download_assets(game_maps: list[GameMap], workers: int) -> None:
+    with tempfile.TemporaryDirectory(prefix="valostats-bench-") as directory:
+        downloader = AssetDownloader(directory, max_workers=workers, throttle=UNLIMITED)
+        downloader.save_assets([(game_map, ["display_icon"]) for game_map in game_maps])
+        downloader.close()
+        if not all(result.success for result in downloader.results):
+            raise RuntimeError("Asset download failed during the benchmark")
@@ -0,0 +1,102 @@
+import glob
+import json
+import os
+import tempfile
+
+from benchmarks.runner import BenchmarkConfig, BenchmarkResult, measure
+from src.models.agent.agent import Agent
+from src.models.catalog import DATA_DIRECTORY, Catalog
+from src.models.game_map.game_map import GameMap
+
+# ViewMap.convert_coordinates and other per-point callers use the scalar transform, so it is tracked on its own
+SCALAR_POINTS = [(float(x), float(-x)) for x in range(0, 10_000, 10)]
+
+
+def data_paths(kind: str) -> list[str]:
+    return sorted(glob.glob(os.path.join(DATA_DIRECTORY, kind, "*.json")))
+
+
+def load_payloads(kind: str) -> list[dict]:
+    payloads = []
+    for path in data_paths(kind):
+        with open(path) as file:
+            payloads.append(json.load(file))
+    return payloads
+
+
+def run(config: BenchmarkConfig) -> list[BenchmarkResult]:
+    # The committed src/data snapshot is the realistic payload: every map with its callouts, every agent
+    map_payloads = load_payloads("maps")
+    agent_payloads = load_payloads("agents")
+    game_maps = [GameMap.from_dict(payload) for payload in map_payloads]
+    game_map = game_maps[0]
+    agents = [Agent.from_dict(payload) for payload in agent_payloads]
+    map_paths = data_paths("maps")
+    # A warm catalog, so every lookup is a cache hit and should cost less than parsing the file again
+    catalog = Catalog()
+    for game_map in game_maps:
+        catalog.get_map(game_map.uuid)
+    number = 20
+
+    results = [
+        measure(
+            "models.game_map_from_dict",
+            lambda: [GameMap.from_dict(payload) for payload in map_payloads],
+            repeat=config.repeat,
+            number=number,
+            items=len(map_payloads),
+        ),
+        measure(
+            "models.game_map_to_dict",
+            lambda: [game_map.to_dict() for game_map in game_maps],
+            repeat=config.repeat,
+            number=number,
+            items=len(game_maps),
+        ),
+        measure(
+            "models.game_map_from_json",
+            lambda: [GameMap.from_json(path) for path in map_paths],
+            repeat=config.repeat,
+            number=number,
+            items=len(map_paths),
+        ),
+        measure(
+            "models.catalog_get_map",
+            lambda: [catalog.get_map(game_map.uuid) for game_map in game_maps],
+            repeat=config.repeat,
+            number=number,
+            items=len(game_maps),
+        ),
+        measure(
+            "models.world_point_to_image",
+            lambda: [game_map.world_point_to_image(x, y) for x, y in SCALAR_POINTS],
+            repeat=config.repeat,
+            number=number,
+            items=len(SCALAR_POINTS),
+        ),
+        measure(
+            "models.agent_from_dict",
+            lambda: [Agent.from_dict(payload) for payload in agent_payloads],
+            repeat=config.repeat,
+            number=number,
+            items=len(agent_payloads),
+        ),
+    ]
+
+    with tempfile.TemporaryDirectory(prefix="valostats-bench-") as directory:
+        paths = [os.path.join(directory, f"{index}.json") for index in range(len(game_maps) + len(agents))]
+        models = [*game_maps, *agents]
+
+        def write_all() -> None:
+            for model, path in zip(models, paths):
+                model.to_json(path)
+
+        results.append(
+            measure(
+                "models.to_json",
+                write_all,
+                repeat=config.repeat,
+                items=len(models),
+            )
+        )
+    return results
@@ -0,0 +1,81 @@
+import os
+import tempfile
+
+import numpy as np
+from matplotlib import colormaps
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from benchmarks.runner import BenchmarkConfig, BenchmarkResult, measure
+from src.replay.columnar import write_replay
+from src.replay.frames import PLAYER_COUNT, ReplayFrames
+from src.view.ViewMap import ViewMap
+
+MAP_NAME = "ascent"
+SCALAR_SAMPLE = 100_000
+
+
+def synthetic_frames(frame_count: int, seed: int = 0) -> ReplayFrames:
+    rng = np.random.default_rng(seed)
+    positions = np.empty((frame_count, PLAYER_COUNT, 2), dtype=np.float32)
+    positions[..., 0] = rng.uniform(-5000, 5000, (frame_count, PLAYER_COUNT))
+    positions[..., 1] = rng.uniform(-8000, 0, (frame_count, PLAYER_COUNT))
+    # A few percent of dead or missing players, like real replays
+    positions[rng.random((frame_count, PLAYER_COUNT)) < 0.05] = np.nan
+    round_length = max(1, frame_count // 24)
+    return ReplayFrames(
+        positions=positions,
+        round_numbers=(np.arange(frame_count) // round_length + 1).astype(np.int32),
+        phase_codes=((np.arange(frame_count) % round_length) > round_length // 4).astype(np.uint8),
+        phases=["buy", "combat"],
+    )
+
+
+def run_frames(config: BenchmarkConfig, frame_count: int, directory: str) -> list[BenchmarkResult]:
+    replay_path = os.path.join(directory, f"synthetic-{frame_count}.replay")
+    write_replay(synthetic_frames(frame_count), replay_path)
+    view_map = ViewMap(MAP_NAME, replay_path)
+    params = {"frames": frame_count}
+
+    points = view_map.frames.positions.reshape(-1, 2)[:SCALAR_SAMPLE].tolist()
+    results = [
+        measure(
+            "view.convert_coordinates",
+            lambda: [view_map.convert_coordinates(x, y, view_map.selected_map) for x, y in points],
+            repeat=config.repeat,
+            items=len(points),
+            params=params,
+        ),
+        measure(
+            "view.convert_replay_coordinates",
+            lambda: view_map.convert_replay_coordinates(view_map.frames.positions, view_map.selected_map),
+            repeat=config.repeat,
+            items=frame_count,
+            params=params,
+        ),
+    ]
+
+    fig = Figure(figsize=(10, 10), dpi=100)
+    FigureCanvasAgg(fig)
+    ax = fig.add_axes((0, 0, 1, 1))
+    players = ax.scatter(np.zeros(PLAYER_COUNT), np.zeros(PLAYER_COUNT), c=colormaps["tab10"](np.arange(PLAYER_COUNT)))
+    title = ax.text(0.5, 0.99, "", transform=ax.transAxes)
+    update_frames = range(min(frame_count, config.update_frames))
+    results.append(
+        measure(
+            "view.update",
+            lambda: [view_map.update(frame, players, title) for frame in update_frames],
+            repeat=config.repeat,
+            items=len(update_frames),
+            params=params,
+        )
+    )
+    return results
+
+
+def run(config: BenchmarkConfig) -> list[BenchmarkResult]:
+    results = []
+    with tempfile.TemporaryDirectory(prefix="valostats-bench-") as directory:
+        for frame_count in config.frames:
+            results.extend(run_frames(config, frame_count, directory))
+    return results
@@ -0,0 +1,185 @@
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from logging import getLogger
+from typing import Any
+
+logger = getLogger(__name__)
+
+RESULTS_FORMAT_VERSION = 1
+
+
+@dataclass
+class BenchmarkConfig:
+    repeat: int = 5
+    frames: list[int] = field(default_factory=lambda: [10_000, 100_000])
+    update_frames: int = 10_000
+    requests: int = 200
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    timings: list[float]
+    number: int = 1
+    items: int = 1
+    params: dict[str, Any] = field(default_factory=dict)
+    latencies: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        suffix = ",".join(f"{name}={value}" for name, value in sorted(self.params.items()))
+        return f"{self.name}[{suffix}]" if suffix else self.name
+
+    @property
+    def best(self) -> float:
+        return min(self.timings) / self.number
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.timings) / self.number
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "params": self.params,
+            "repeat": len(self.timings),
+            "number": self.number,
+            "items": self.items,
+            "best": self.best,
+            "median": self.median,
+            "mean": statistics.fmean(self.timings) / self.number,
+            "items_per_second": self.items / self.best if self.best else None,
+            "timings": self.timings,
+            "latencies": self.latencies,
+        }
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    repeat: int = 5,
+    number: int = 1,
+    items: int = 1,
+    params: dict[str, Any] | None = None,
+    setup: Callable[[], Any] | None = None,
+) -> BenchmarkResult:
+    # Same approach as timeit: best of several repeats with the collector paused, so runs are comparable
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            timings.append(time.perf_counter() - start)
+        finally:
+            if gc_enabled:
+                gc.enable()
+    result = BenchmarkResult(name=name, timings=timings, number=number, items=items, params=params or {})
+    logger.info(f"{result.key}: best {result.best * 1e3:.3f} ms, median {result.median * 1e3:.3f} ms")
+    return result
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def measure_latencies(
+    name: str,
+    func: Callable[[int], Any],
+    calls: int,
+    concurrency: int,
+    params: dict[str, Any] | None = None,
+) -> BenchmarkResult:
+    # One timed pass of `calls` requests from `concurrency` threads: throughput from the wall time, tail latency
+    # from the individual calls
+    def timed(index: int) -> float:
+        start = time.perf_counter()
+        func(index)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(timed, range(calls)))
+    elapsed = time.perf_counter() - start
+
+    result = BenchmarkResult(
+        name=name,
+        timings=[elapsed],
+        items=calls,
+        params={**(params or {}), "concurrency": concurrency},
+        latencies={
+            "p50": percentile(latencies, 0.5),
+            "p95": percentile(latencies, 0.95),
+            "p99": percentile(latencies, 0.99),
+            "max": max(latencies),
+        },
+    )
+    logger.info(
+        f"{result.key}: {calls / elapsed:.1f} calls/s, p50 {result.latencies['p50'] * 1e3:.1f} ms, "
+        f"p99 {result.latencies['p99'] * 1e3:.1f} ms"
+    )
+    return result
+
+
+def git_commit() -> str | None:
+    try:
+        completed = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def write_results(results: list[BenchmarkResult], path: str) -> None:
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    document = {
+        "version": RESULTS_FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": {result.key: result.to_dict() for result in results},
+    }
+    with tempfile.NamedTemporaryFile("w", dir=directory, suffix=".part", delete=False) as file:
+        json.dump(document, file, indent=2)
+    os.replace(file.name, path)
+
+
+def load_results(path: str) -> dict[str, dict[str, Any]]:
+    with open(path) as file:
+        document = json.load(file)
+    if document.get("version") != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark results version: {document.get('version')}")
+    return document["results"]
+
+
+def compare(
+    results: list[BenchmarkResult], baseline: dict[str, dict[str, Any]], threshold: float
+) -> list[tuple[str, float]]:
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.key)
+        if previous is None or not previous["best"]:
+            continue
+        ratio = result.best / previous["best"]
+        logger.info(f"{result.key}: {ratio:.2f}x baseline")
+        if ratio > threshold:
+            regressions.append((result.key, ratio))
+    return regressions
@@ -1,43 +1,122 @@
+import argparse
+import asyncio
 import os
 from logging import INFO, basicConfig, getLogger
 from uuid import UUID
 
 from src.models.agent.agent import Agent, AgentUUID
+from src.models.bundle import BUNDLE_FILE_NAME, DataBundle
 from src.models.game_map.game_map import GameMap, MapUUID
+from valorant_client.async_client import AsyncValorantClient
+from valorant_client.cache import DiskResponseCache
 from valorant_client.client import ValorantClient
+from valorant_client.metrics import MetricsRecorder
+from valorant_client.sync import SyncReport, fetch_bulk
+from valorant_client.throttle import add_throttle_arguments, throttle_from_args
 
 basicConfig(level=INFO)
 logger = getLogger(__name__)
 
 
-if __name__ == "__main__":
-    client = ValorantClient()
-    base_directory = os.path.join("src", "data")
+def save_map(game_map: GameMap, base_directory: str) -> None:
+    path = os.path.join(base_directory, "maps", f"{game_map.uuid.name.lower()}.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    game_map.to_json(path)
+    logger.info(f"Saved map to {path}")
+
+
+def save_agent(agent: Agent, base_directory: str) -> None:
+    path = os.path.join(base_directory, "agents", f"{agent.uuid.name.lower()}.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    agent.to_json(path)
+    logger.info(f"Saved agent to {path}")
+
+
+def save_bundle(base_directory: str) -> DataBundle:
+    bundle = DataBundle.from_directory(base_directory)
+    path = os.path.join(base_directory, BUNDLE_FILE_NAME)
+    bundle.write(path)
+    logger.info(f"Saved {len(bundle.maps)} maps and {len(bundle.agents)} agents to {path}")
+    return bundle
 
-    for map_uuid in MapUUID:
-        map_name = map_uuid.name.lower()
-        logger.info(f"Downloading data for {map_name}")
+
+async def download_data(client: AsyncValorantClient, base_directory: str) -> None:
+    map_uuids = list(MapUUID)
+    agent_uuids = list(AgentUUID)
+    logger.info(f"Downloading data for {len(map_uuids)} maps and {len(agent_uuids)} agents")
+
+    maps_data, agents_data = await asyncio.gather(
+        client.get_maps_by_uuid([UUID(map_uuid.value) for map_uuid in map_uuids], return_exceptions=True),
+        client.get_agents_by_uuid([UUID(agent_uuid.value) for agent_uuid in agent_uuids], return_exceptions=True),
+    )
+
+    for map_uuid, map_data in zip(map_uuids, maps_data):
         try:
-            map_data = client.get_map_by_uuid(UUID(map_uuid.value))
-            game_map = GameMap.from_dict(map_data.get("data", {}))
-            file_name = f"{map_name}.json"
-            path = os.path.join(base_directory, "maps", file_name)
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            game_map.to_json(path)
-            logger.info(f"Saved map to {path}")
+            if isinstance(map_data, BaseException):
+                raise map_data
+            save_map(GameMap.from_dict(map_data.get("data", {})), base_directory)
         except Exception as e:
-            logger.exception(f"Error downloading data for {map_name}: {e}")
+            logger.exception(f"Error downloading data for {map_uuid.name.lower()}: {e}")
 
-    for agent_uuid in AgentUUID:
-        agent_name = agent_uuid.name.lower()
-        logger.info(f"Downloading data for {agent_name}")
+    for agent_uuid, agent_data in zip(agent_uuids, agents_data):
         try:
-            agent_data = client.get_agent_by_uuid(UUID(agent_uuid.value))
-            agent = Agent.from_dict(agent_data.get("data", {}))
-            file_name = f"{agent_name}.json"
-            path = os.path.join(base_directory, "agents", file_name)
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            agent.to_json(path)
-            logger.info(f"Saved agent to {path}")
+            if isinstance(agent_data, BaseException):
+                raise agent_data
+            save_agent(Agent.from_dict(agent_data.get("data", {})), base_directory)
         except Exception as e:
-            logger.exception(f"Error downloading data for {agent_name}: {e}")
+            logger.exception(f"Error downloading data for {agent_uuid.name.lower()}: {e}")
+
+
+async def download_data_bulk(client: AsyncValorantClient, base_directory: str) -> SyncReport:
+    logger.info("Downloading data for all maps and agents from the collection endpoints")
+    game_maps, agents, report = await fetch_bulk(client)
+
+    for game_map in game_maps:
+        save_map(game_map, base_directory)
+    for agent in agents:
+        save_agent(agent, base_directory)
+
+    report.log()
+    return report
+
+
+def parse_args(argv: list[str] | None = None, prog: str | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog=prog, description="Download agents and maps data from Valorant API")
+    parser.add_argument(
+        "--bulk", action="store_true", help="Sync from the two collection endpoints and report enum drift"
+    )
+    parser.add_argument("--offline", action="store_true", help="Serve every response from the local cache")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the local response cache")
+    parser.add_argument(
+        "--base-url", default=ValorantClient.DEFAULT_BASE_URL, help="API root, e.g. a local stub server"
+    )
+    add_throttle_arguments(parser)
+    parser.add_argument("--metrics", help="Write request metrics here, Prometheus text for .prom files, else JSON")
+    return parser.parse_args(argv)
+
+
+async def main(args: argparse.Namespace) -> None:
+    cache = None if args.no_cache else DiskResponseCache()
+    metrics = MetricsRecorder()
+    client = ValorantClient(
+        pool_size=AsyncValorantClient.DEFAULT_MAX_CONCURRENCY,
+        cache=cache,
+        offline=args.offline,
+        base_url=args.base_url,
+        throttle=throttle_from_args(args),
+        metrics=metrics,
+    )
+    async with AsyncValorantClient(client) as async_client:
+        base_directory = os.path.join("src", "data")
+        if args.bulk:
+            await download_data_bulk(async_client, base_directory)
+        else:
+            await download_data(async_client, base_directory)
+        save_bundle(base_directory)
+    if args.metrics:
+        metrics.write(args.metrics)
+        logger.info(f"Saved request metrics to {args.metrics}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
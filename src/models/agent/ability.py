@@ -10,7 +10,7 @@ class AbilitySlot(Enum):
     _SLOT = "Passive"
 
 
-@dataclass
+@dataclass(slots=True)
 class Ability:
     slot: AbilitySlot
     name: str
@@ -21,3 +21,15 @@ class Ability:
 
     def to_dict(self) -> dict[str, str]:
         return {"slot": self.slot.value, "displayName": self.name}
+
+    def freeze(self) -> "FrozenAbility":
+        return FrozenAbility(self.slot, self.name)
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenAbility:
+    slot: AbilitySlot
+    name: str
+
+    def to_dict(self) -> dict[str, str]:
+        return {"slot": self.slot.value, "displayName": self.name}
@@ -1,10 +1,9 @@
-import json
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
-from src.models.agent.ability import Ability
-from src.models.agent.role import Role
+from src.models.agent.ability import Ability, FrozenAbility
+from src.models.agent.role import FrozenRole, Role
 from src.models.serializable import Serializable
 
 
@@ -35,7 +34,7 @@ class AgentUUID(Enum):
     YORU = "7f94d92c-4234-0a36-9646-3a87eb8b5c89"
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent(Serializable):
     uuid: AgentUUID
     name: str
@@ -55,11 +54,35 @@ class Agent(Serializable):
             abilities=[Ability.from_dict(ability) for ability in agent_data["abilities"]],
         )
 
-    @classmethod
-    def from_json(cls, path: str) -> "Agent":
-        with open(path) as file:
-            data = json.load(file)
-        return cls.from_dict(data)
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "uuid": str(self.uuid.value),
+            "displayName": self.name,
+            "displayIcon": self.display_icon,
+            "displayIconSmall": self.display_icon_small,
+            "role": self.role.to_dict(),
+            "abilities": [ability.to_dict() for ability in self.abilities],
+        }
+
+    def freeze(self) -> "FrozenAgent":
+        return FrozenAgent(
+            self.uuid,
+            self.name,
+            self.display_icon,
+            self.display_icon_small,
+            self.role.freeze(),
+            tuple(ability.freeze() for ability in self.abilities),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenAgent:
+    uuid: AgentUUID
+    name: str
+    display_icon: str
+    display_icon_small: str
+    role: FrozenRole
+    abilities: tuple[FrozenAbility, ...]
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -9,7 +9,7 @@ class RoleUUID(Enum):
     SENTINEL = "5fc02f99-4091-4486-a531-98459a3e95e9"
 
 
-@dataclass
+@dataclass(slots=True)
 class Role:
     uuid: RoleUUID
     name: str
@@ -20,3 +20,15 @@ class Role:
 
     def to_dict(self) -> dict[str, str]:
         return {"uuid": str(self.uuid.value), "displayName": self.name}
+
+    def freeze(self) -> "FrozenRole":
+        return FrozenRole(self.uuid, self.name)
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenRole:
+    uuid: RoleUUID
+    name: str
+
+    def to_dict(self) -> dict[str, str]:
+        return {"uuid": str(self.uuid.value), "displayName": self.name}
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.models.agent.agent import Agent, AgentUUID
+from src.models.codec import get_codec
+from src.models.game_map.game_map import GameMap, MapUUID
+
+BUNDLE_FORMAT = "valostats-bundle"
+BUNDLE_VERSION = 3
+BUNDLE_FILE_NAME = "data.bundle"
+
+
+class BundleError(ValueError):
+    pass
+
+
+def file_sha256(path: str) -> str:
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+@dataclass
+class DataBundle:
+    maps: dict[MapUUID, GameMap] = field(default_factory=dict)
+    agents: dict[AgentUUID, Agent] = field(default_factory=dict)
+    # Source file name relative to the data directory, e.g. "maps/ascent.json" -> sha256 of its contents
+    sources: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_directory(cls, base_directory: str) -> "DataBundle":
+        bundle = cls()
+        for map_uuid in MapUUID:
+            name = f"maps/{map_uuid.name.lower()}.json"
+            path = os.path.join(base_directory, *name.split("/"))
+            if os.path.isfile(path):
+                bundle.maps[map_uuid] = GameMap.from_json(path)
+                bundle.sources[name] = file_sha256(path)
+        for agent_uuid in AgentUUID:
+            name = f"agents/{agent_uuid.name.lower()}.json"
+            path = os.path.join(base_directory, *name.split("/"))
+            if os.path.isfile(path):
+                bundle.agents[agent_uuid] = Agent.from_json(path)
+                bundle.sources[name] = file_sha256(path)
+        return bundle
+
+    def to_bytes(self, codec: str | None = None) -> bytes:
+        payload_codec = get_codec(codec)
+        payload = payload_codec.encode(
+            {
+                "maps": [game_map.to_dict() for game_map in self.maps.values()],
+                "agents": [agent.to_dict() for agent in self.agents.values()],
+            }
+        )
+        # The header sits on its own line so readers can check version and integrity before parsing the payload
+        header = {
+            "format": BUNDLE_FORMAT,
+            "version": BUNDLE_VERSION,
+            "codec": payload_codec.name,
+            "size": len(payload),
+            "sha256": hashlib.sha256(payload).hexdigest(),
+            "maps": len(self.maps),
+            "agents": len(self.agents),
+            "sources": self.sources,
+        }
+        return json.dumps(header, separators=(",", ":")).encode() + b"\n" + payload + b"\n"
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "DataBundle":
+        header_line, _, payload = data.partition(b"\n")
+        try:
+            header: dict[str, Any] = json.loads(header_line)
+        except ValueError:
+            raise BundleError("Bundle header is not valid JSON")
+        if header.get("format") != BUNDLE_FORMAT:
+            raise BundleError("Not a data bundle")
+        if header.get("version") != BUNDLE_VERSION:
+            raise BundleError(f"Unsupported bundle version: {header.get('version')}")
+        # Binary payloads may contain newlines, so the size rather than the trailing newline delimits the payload
+        size = header.get("size")
+        if not isinstance(size, int):
+            raise BundleError("Bundle header has no payload size")
+        payload = payload[:size]
+        sources = header.get("sources")
+        if not isinstance(sources, dict):
+            raise BundleError("Bundle header has no source hashes")
+        if hashlib.sha256(payload).hexdigest() != header.get("sha256"):
+            raise BundleError("Bundle payload does not match its hash")
+
+        try:
+            records = get_codec(header.get("codec")).decode(payload)
+            game_maps = [GameMap.from_dict(map_data) for map_data in records["maps"]]
+            agents = [Agent.from_dict(agent_data) for agent_data in records["agents"]]
+        except (ValueError, KeyError, TypeError, RuntimeError) as e:
+            # Covers undecodable payloads, codecs that are not installed and UUIDs this version does not know
+            raise BundleError(f"Bundle payload could not be loaded: {e!r}") from e
+        return cls(
+            maps={game_map.uuid: game_map for game_map in game_maps},
+            agents={agent.uuid: agent for agent in agents},
+            sources=sources,
+        )
+
+    def write(self, path: str, codec: str | None = None) -> None:
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=directory, suffix=".part", delete=False) as file:
+            file.write(self.to_bytes(codec))
+        os.chmod(file.name, 0o644)
+        os.replace(file.name, path)
+
+    @classmethod
+    def read(cls, path: str) -> "DataBundle":
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
@@ -0,0 +1,245 @@
+import functools
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from enum import Enum
+from logging import getLogger
+from typing import Any, TypeVar
+
+from src.models.agent.ability import Ability, AbilitySlot
+from src.models.agent.agent import Agent, AgentUUID
+from src.models.agent.role import RoleUUID
+from src.models.bundle import BUNDLE_FILE_NAME, DataBundle, file_sha256
+from src.models.codec import get_codec
+from src.models.game_map.game_map import GameMap, MapUUID
+
+logger = getLogger(__name__)
+
+DATA_DIRECTORY = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data"))
+DEFAULT_CACHE_SIZE = 64
+
+E = TypeVar("E", bound=Enum)
+T = TypeVar("T")
+
+
+def _normalize(name: str) -> str:
+    return "".join(character for character in name.upper() if character.isalnum())
+
+
+def read_record(path: str) -> dict[str, Any]:
+    with open(path, "rb") as file:
+        return get_codec("orjson").decode(file.read())
+
+
+@functools.cache
+def _names(enum_type: type[E]) -> dict[str, E]:
+    names = {_normalize(member.name): member for member in enum_type}
+    names.update((member.value, member) for member in enum_type)
+    return names
+
+
+def resolve(key: E | str, enum_type: type[E]) -> E:
+    if isinstance(key, enum_type):
+        return key
+    if isinstance(key, str):
+        # Accept the UUID itself, the enum member name or a display name such as "KAY/O"
+        names = _names(enum_type)
+        member = names.get(key) or names.get(_normalize(key))
+        if member is not None:
+            return member
+    raise ValueError(f"Unknown {enum_type.__name__}: {key}")
+
+
+class Catalog:
+    def __init__(
+        self, data_directory: str = DATA_DIRECTORY, max_size: int = DEFAULT_CACHE_SIZE, use_bundle: bool = True
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.data_directory = data_directory
+        self.max_size = max_size
+        self.bundle_path = os.path.join(data_directory, BUNDLE_FILE_NAME) if use_bundle else None
+        # (mtime_ns, bundle or None if unreadable, its records by UUID), so a broken bundle is only retried after it
+        # changes
+        self._bundle: tuple[int, DataBundle | None, dict[Enum, dict[str, Any]]] | None = None
+        self.hits = 0
+        self.misses = 0
+        # path -> (mtime_ns, decoded record), least recently used first. Records rather than models are cached, since
+        # building a model from a record is cheaper than copying one and callers may mutate what they get back
+        self._cache: OrderedDict[str, tuple[int, object]] = OrderedDict()
+        self._lock = threading.RLock()
+        # path -> ((bundle mtime_ns, file mtime_ns), whether the file matches its source hash in the bundle)
+        self._verified: dict[str, tuple[tuple[int, int], bool]] = {}
+        self._agent_index_key: tuple[tuple[str, int | None, int | None], ...] | None = None
+        self._agents_by_role: dict[RoleUUID, list[AgentUUID]] = {}
+        self._abilities_by_slot: dict[AbilitySlot, list[tuple[AgentUUID, int]]] = {}
+
+    def map_path(self, map_uuid: MapUUID) -> str:
+        return os.path.join(self.data_directory, "maps", f"{map_uuid.name.lower()}.json")
+
+    def agent_path(self, agent_uuid: AgentUUID) -> str:
+        return os.path.join(self.data_directory, "agents", f"{agent_uuid.name.lower()}.json")
+
+    def _load(self, path: str, loader: Callable[[str], T]) -> T:
+        mtime = self._file_mtime(path)
+        if mtime is None:
+            raise FileNotFoundError(f"Catalog entry not found: {path}")
+        with self._lock:
+            cached = self._cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                self._cache.move_to_end(path)
+                self.hits += 1
+                return cached[1]  # type: ignore[return-value]
+
+            self.misses += 1
+            loaded = loader(path)
+            self._cache[path] = (mtime, loaded)
+            self._cache.move_to_end(path)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+            return loaded
+
+    def bundle(self) -> DataBundle | None:
+        if self.bundle_path is None:
+            return None
+        mtime = self._file_mtime(self.bundle_path)
+        if mtime is None:
+            return None
+        with self._lock:
+            if self._bundle is None or self._bundle[0] != mtime:
+                try:
+                    bundle = DataBundle.read(self.bundle_path)
+                except (OSError, ValueError, KeyError) as e:
+                    logger.warning(f"Ignoring unreadable data bundle {self.bundle_path}: {e}")
+                    self._bundle = (mtime, None, {})
+                else:
+                    records: dict[Enum, dict[str, Any]] = {
+                        game_map.uuid: game_map.to_dict() for game_map in bundle.maps.values()
+                    }
+                    records.update((agent.uuid, agent.to_dict()) for agent in bundle.agents.values())
+                    self._bundle = (mtime, bundle, records)
+            return self._bundle[1]
+
+    def _file_mtime(self, path: str) -> int | None:
+        try:
+            return os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _bundled(self, path: str) -> bool:
+        # The bundle is trusted for a JSON file that is missing or older than the bundle. A newer file is hashed and
+        # compared with the source hash in the bundle, since a git checkout writes files in arbitrary order, so hand
+        # edits to a data file win until the bundle is rebuilt
+        loaded = self._bundle
+        if loaded is None or loaded[1] is None:
+            return False
+        mtime = self._file_mtime(path)
+        if mtime is None or mtime <= loaded[0]:
+            return True
+        key = (loaded[0], mtime)
+        with self._lock:
+            verified = self._verified.get(path)
+            if verified is None or verified[0] != key:
+                name = os.path.relpath(path, self.data_directory).replace(os.sep, "/")
+                try:
+                    matches = loaded[1].sources.get(name) == file_sha256(path)
+                except OSError:
+                    matches = False
+                verified = self._verified[path] = (key, matches)
+            return verified[1]
+
+    def _record(self, key: MapUUID | AgentUUID, path: str) -> dict[str, Any]:
+        loaded = self._bundle if self.bundle() is not None else None
+        if loaded is not None and key in loaded[2] and self._bundled(path):
+            return loaded[2][key]
+        return self._load(path, read_record)
+
+    def get_map(self, key: MapUUID | str) -> GameMap:
+        map_uuid = resolve(key, MapUUID)
+        return GameMap.from_dict(self._record(map_uuid, self.map_path(map_uuid)))
+
+    def get_agent(self, key: AgentUUID | str) -> Agent:
+        agent_uuid = resolve(key, AgentUUID)
+        return Agent.from_dict(self._record(agent_uuid, self.agent_path(agent_uuid)))
+
+    def map_uuids(self) -> list[MapUUID]:
+        bundle = self.bundle()
+        bundled = bundle.maps if bundle is not None else {}
+        return [map_uuid for map_uuid in MapUUID if map_uuid in bundled or os.path.isfile(self.map_path(map_uuid))]
+
+    def agent_uuids(self) -> list[AgentUUID]:
+        bundle = self.bundle()
+        bundled = bundle.agents if bundle is not None else {}
+        return [
+            agent_uuid
+            for agent_uuid in AgentUUID
+            if agent_uuid in bundled or os.path.isfile(self.agent_path(agent_uuid))
+        ]
+
+    def _source_mtimes(self, agent_uuid: AgentUUID) -> tuple[int | None, int | None]:
+        bundle = self.bundle()
+        bundle_mtime = self._bundle[0] if bundle is not None and self._bundle is not None else None
+        return bundle_mtime, self._file_mtime(self.agent_path(agent_uuid))
+
+    def maps(self) -> list[GameMap]:
+        return [self.get_map(map_uuid) for map_uuid in self.map_uuids()]
+
+    def agents(self) -> list[Agent]:
+        return [self.get_agent(agent_uuid) for agent_uuid in self.agent_uuids()]
+
+    def _refresh_agent_indexes(self) -> None:
+        agent_uuids = self.agent_uuids()
+        index_key = tuple((agent_uuid.value, *self._source_mtimes(agent_uuid)) for agent_uuid in agent_uuids)
+        with self._lock:
+            if index_key == self._agent_index_key:
+                return
+            # Indexes hold UUIDs rather than agents so the LRU bound still applies to parsed objects
+            agents_by_role: dict[RoleUUID, list[AgentUUID]] = {}
+            abilities_by_slot: dict[AbilitySlot, list[tuple[AgentUUID, int]]] = {}
+            for agent_uuid in agent_uuids:
+                agent = self.get_agent(agent_uuid)
+                agents_by_role.setdefault(agent.role.uuid, []).append(agent_uuid)
+                for position, ability in enumerate(agent.abilities):
+                    abilities_by_slot.setdefault(ability.slot, []).append((agent_uuid, position))
+            self._agents_by_role = agents_by_role
+            self._abilities_by_slot = abilities_by_slot
+            self._agent_index_key = index_key
+
+    def agents_by_role(self, role: RoleUUID | str) -> list[Agent]:
+        self._refresh_agent_indexes()
+        return [self.get_agent(agent_uuid) for agent_uuid in self._agents_by_role.get(resolve(role, RoleUUID), [])]
+
+    def abilities_by_slot(self, slot: AbilitySlot | str) -> list[tuple[Agent, Ability]]:
+        self._refresh_agent_indexes()
+        abilities = []
+        for agent_uuid, position in self._abilities_by_slot.get(resolve(slot, AbilitySlot), []):
+            agent = self.get_agent(agent_uuid)
+            abilities.append((agent, agent.abilities[position]))
+        return abilities
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._bundle = None
+            self._verified.clear()
+            self._agent_index_key = None
+
+
+_catalog = Catalog()
+
+
+def get_map(key: MapUUID | str) -> GameMap:
+    return _catalog.get_map(key)
+
+
+def get_agent(key: AgentUUID | str) -> Agent:
+    return _catalog.get_agent(key)
+
+
+def agents_by_role(role: RoleUUID | str) -> list[Agent]:
+    return _catalog.agents_by_role(role)
+
+
+def abilities_by_slot(slot: AbilitySlot | str) -> list[tuple[Agent, Ability]]:
+    return _catalog.abilities_by_slot(slot)
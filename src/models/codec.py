@@ -0,0 +1,97 @@
+import importlib
+import json
+from abc import ABC, abstractmethod
+from logging import getLogger
+from types import ModuleType
+from typing import Any
+
+logger = getLogger(__name__)
+
+DEFAULT_CODEC = "orjson"
+
+
+def _import_optional(module_name: str) -> ModuleType | None:
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+
+class Codec(ABC):
+    name = ""
+    text = True
+
+    @abstractmethod
+    def encode(self, data: Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        pass
+
+
+class JsonCodec(Codec):
+    name = "json"
+
+    def encode(self, data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    name = "orjson"
+
+    def __init__(self, module: ModuleType):
+        self._orjson = module
+
+    def encode(self, data: Any) -> bytes:
+        return self._orjson.dumps(data)
+
+    def decode(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgpackCodec(Codec):
+    name = "msgpack"
+    text = False
+
+    def __init__(self, module: ModuleType):
+        self._msgpack = module
+
+    def encode(self, data: Any) -> bytes:
+        return self._msgpack.packb(data, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(data, raw=False)
+
+
+_codecs: dict[str, Codec] = {}
+
+
+def get_codec(name: str | None = None) -> Codec:
+    name = name or DEFAULT_CODEC
+    if name in _codecs:
+        return _codecs[name]
+
+    codec: Codec
+    if name == "json":
+        codec = JsonCodec()
+    elif name == "orjson":
+        module = _import_optional("orjson")
+        if module is None:
+            # orjson produces plain JSON, so the stdlib codec reads and writes the same bytes
+            logger.info("orjson is not installed, falling back to the json codec")
+            codec = get_codec("json")
+        else:
+            codec = OrjsonCodec(module)
+    elif name == "msgpack":
+        module = _import_optional("msgpack")
+        if module is None:
+            raise RuntimeError("The msgpack codec requires the msgpack package")
+        codec = MsgpackCodec(module)
+    else:
+        raise ValueError(f"Unknown codec: {name}")
+    _codecs[name] = codec
+    return codec
@@ -1,10 +1,10 @@
 from dataclasses import dataclass, field
 from typing import Any
 
-from src.models.game_map.location import Location
+from src.models.game_map.location import FrozenLocation, Location
 
 
-@dataclass
+@dataclass(slots=True)
 class Callout:
     region_name: str
     super_region_name: str | None = None
@@ -24,3 +24,20 @@ class Callout:
             "superRegionName": self.super_region_name,
             "location": self.location.to_dict(),
         }
+
+    def freeze(self) -> "FrozenCallout":
+        return FrozenCallout(self.region_name, self.super_region_name, self.location.freeze())
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenCallout:
+    region_name: str
+    super_region_name: str | None = None
+    location: FrozenLocation = field(default_factory=FrozenLocation)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "regionName": self.region_name,
+            "superRegionName": self.super_region_name,
+            "location": self.location.to_dict(),
+        }
@@ -0,0 +1,106 @@
+import heapq
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.models.game_map.callout import Callout
+from src.models.game_map.callout_table import CalloutTable
+
+
+class CalloutIndex:
+    BATCH_SIZE = 1 << 16
+
+    def __init__(self, callouts: Sequence[Callout]):
+        self.callouts = callouts
+        if isinstance(callouts, CalloutTable):
+            self.points = callouts.points
+        else:
+            self.points = np.array(
+                [(callout.location.x, callout.location.y) for callout in callouts], dtype=np.float64
+            ).reshape(-1, 2)
+        self._squared_norms = (self.points**2).sum(axis=1)
+
+        # Flat KD-tree: node i stores the callout index it splits on, its axis and both children (-1 if absent)
+        self._node_callout: list[int] = []
+        self._node_axis: list[int] = []
+        self._node_left: list[int] = []
+        self._node_right: list[int] = []
+        self._root = self._build(list(range(len(callouts))), depth=0)
+
+    def __len__(self) -> int:
+        return len(self.callouts)
+
+    def _build(self, indices: list[int], depth: int) -> int:
+        if not indices:
+            return -1
+        axis = depth % 2
+        indices.sort(key=lambda index: self.points[index, axis])
+        median = len(indices) // 2
+
+        node = len(self._node_callout)
+        self._node_callout.append(indices[median])
+        self._node_axis.append(axis)
+        self._node_left.append(-1)
+        self._node_right.append(-1)
+        self._node_left[node] = self._build(indices[:median], depth + 1)
+        upper = median + 1
+        self._node_right[node] = self._build(indices[upper:], depth + 1)
+        return node
+
+    def k_nearest_indices(self, x: float, y: float, k: int = 1) -> list[int]:
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        target = (x, y)
+        # Max-heap of the k best candidates as (-squared distance, callout index)
+        best: list[tuple[float, int]] = []
+
+        def search(node: int) -> None:
+            if node == -1:
+                return
+            index = self._node_callout[node]
+            point = self.points[index]
+            distance = (point[0] - x) ** 2 + (point[1] - y) ** 2
+            if len(best) < k:
+                heapq.heappush(best, (-distance, index))
+            elif distance < -best[0][0]:
+                heapq.heapreplace(best, (-distance, index))
+
+            axis = self._node_axis[node]
+            delta = target[axis] - point[axis]
+            near, far = (self._node_left[node], self._node_right[node])
+            if delta > 0:
+                near, far = far, near
+            search(near)
+            if len(best) < k or delta**2 < -best[0][0]:
+                search(far)
+
+        search(self._root)
+        return [index for _, index in sorted(best, key=lambda item: (-item[0], item[1]))]
+
+    def nearest(self, x: float, y: float) -> Callout | None:
+        indices = self.k_nearest_indices(x, y, 1)
+        return self.callouts[indices[0]] if indices else None
+
+    def k_nearest(self, x: float, y: float, k: int) -> list[Callout]:
+        return [self.callouts[index] for index in self.k_nearest_indices(x, y, k)]
+
+    def label(self, points: np.ndarray) -> np.ndarray:
+        # With only a few dozen callouts per map a chunked distance matrix beats walking the tree per sample
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        labels = np.full(len(points), -1, dtype=np.int32)
+        if not len(self.callouts):
+            return labels
+
+        for start in range(0, len(points), self.BATCH_SIZE):
+            end = start + self.BATCH_SIZE
+            batch = points[start:end]
+            # argmin |p - c|^2 == argmin (|c|^2 - 2 p.c) because |p|^2 is constant per row
+            scores = self._squared_norms - 2.0 * (batch @ self.points.T)
+            batch_labels = scores.argmin(axis=1).astype(np.int32)
+            batch_labels[np.isnan(batch).any(axis=1)] = -1
+            labels[start:end] = batch_labels
+        return labels
+
+    def region_names(self, points: np.ndarray) -> np.ndarray:
+        names = np.array([callout.region_name for callout in self.callouts] + [None], dtype=object)
+        return names[self.label(points)]
@@ -0,0 +1,160 @@
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from logging import getLogger
+
+import numpy as np
+
+from src.models.game_map.game_map import GameMap
+
+logger = getLogger(__name__)
+
+DEFAULT_CELL_SIZE = 50.0
+DEFAULT_PADDING = 500.0
+
+
+def file_hash(path: str) -> str:
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def raster_cache_path(json_path: str, cell_size: float = DEFAULT_CELL_SIZE) -> str:
+    return f"{os.path.splitext(json_path)[0]}.labels.{cell_size:g}.npz"
+
+
+@dataclass
+class CalloutRaster:
+    labels: np.ndarray
+    origin: np.ndarray
+    cell_size: float
+    region_names: list[str]
+    super_region_ids: np.ndarray
+    super_region_names: list[str | None]
+    source_hash: str = ""
+
+    @property
+    def missing_id(self) -> int:
+        # One id past the last callout marks NaN positions; the lookup tables map it to None
+        return len(self.region_names)
+
+    @staticmethod
+    def _bounds(game_map: GameMap, padding: float) -> tuple[float, float, float, float]:
+        points = np.array([(callout.location.x, callout.location.y) for callout in game_map.callouts]).reshape(-1, 2)
+        min_x, min_y = points.min(axis=0) - padding
+        max_x, max_y = points.max(axis=0) + padding
+
+        # Cover the whole minimap square as well, so every on-image position falls inside the grid
+        if game_map.x_multiplier and game_map.y_multiplier:
+            corners = game_map.image_to_world(np.array([[0.0, 0.0], [1.0, 1.0]]))
+            min_x, max_x = min(min_x, corners[:, 0].min()), max(max_x, corners[:, 0].max())
+            min_y, max_y = min(min_y, corners[:, 1].min()), max(max_y, corners[:, 1].max())
+        return float(min_x), float(min_y), float(max_x), float(max_y)
+
+    @classmethod
+    def build(
+        cls, game_map: GameMap, cell_size: float = DEFAULT_CELL_SIZE, padding: float = DEFAULT_PADDING
+    ) -> "CalloutRaster":
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        if not game_map.callouts:
+            raise ValueError(f"{game_map.name} has no callouts to rasterize")
+
+        min_x, min_y, max_x, max_y = cls._bounds(game_map, padding)
+        columns = int(np.ceil((max_x - min_x) / cell_size))
+        rows = int(np.ceil((max_y - min_y) / cell_size))
+        centers_x = min_x + (np.arange(columns) + 0.5) * cell_size
+        centers_y = min_y + (np.arange(rows) + 0.5) * cell_size
+        grid_x, grid_y = np.meshgrid(centers_x, centers_y)
+
+        dtype = np.uint8 if len(game_map.callouts) < np.iinfo(np.uint8).max else np.uint16
+        labels = game_map.label_positions(np.column_stack([grid_x.ravel(), grid_y.ravel()]))
+
+        super_region_names: list[str | None] = []
+        super_region_ids = []
+        for callout in game_map.callouts:
+            if callout.super_region_name not in super_region_names:
+                super_region_names.append(callout.super_region_name)
+            super_region_ids.append(super_region_names.index(callout.super_region_name))
+        super_region_ids.append(len(super_region_names))
+        super_region_names.append(None)
+
+        return cls(
+            labels=labels.astype(dtype).reshape(rows, columns),
+            origin=np.array([min_x, min_y]),
+            cell_size=cell_size,
+            region_names=[callout.region_name for callout in game_map.callouts],
+            super_region_ids=np.array(super_region_ids, dtype=dtype),
+            super_region_names=super_region_names,
+        )
+
+    def lookup(self, points: np.ndarray) -> np.ndarray:
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        missing = np.isnan(points).any(axis=1)
+        cells = np.floor((np.nan_to_num(points) - self.origin) / self.cell_size).astype(np.int64)
+        rows = np.clip(cells[:, 1], 0, self.labels.shape[0] - 1)
+        columns = np.clip(cells[:, 0], 0, self.labels.shape[1] - 1)
+
+        region_ids = self.labels[rows, columns]
+        region_ids[missing] = self.missing_id
+        return region_ids
+
+    def lookup_super_regions(self, points: np.ndarray) -> np.ndarray:
+        return self.super_region_ids[self.lookup(points)]
+
+    def region_names_for(self, points: np.ndarray) -> np.ndarray:
+        names = np.array([*self.region_names, None], dtype=object)
+        return names[self.lookup(points)]
+
+    def super_region_names_for(self, points: np.ndarray) -> np.ndarray:
+        names = np.array(self.super_region_names, dtype=object)
+        return names[self.lookup_super_regions(points)]
+
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(path) or "."
+        with tempfile.NamedTemporaryFile(dir=directory, suffix=".npz", delete=False) as file:
+            np.savez_compressed(
+                file,
+                labels=self.labels,
+                origin=self.origin,
+                cell_size=np.array(self.cell_size),
+                region_names=np.array(self.region_names, dtype=str),
+                super_region_ids=self.super_region_ids,
+                super_region_names=np.array(["" if name is None else name for name in self.super_region_names]),
+                source_hash=np.array(self.source_hash),
+            )
+        os.replace(file.name, path)
+
+    @classmethod
+    def load(cls, path: str) -> "CalloutRaster":
+        with np.load(path) as data:
+            # Missing super regions, including the trailing bucket for NaN positions, are stored as ""
+            super_region_names: list[str | None] = [str(name) or None for name in data["super_region_names"]]
+            return cls(
+                labels=data["labels"],
+                origin=data["origin"],
+                cell_size=float(data["cell_size"]),
+                region_names=[str(name) for name in data["region_names"]],
+                super_region_ids=data["super_region_ids"],
+                super_region_names=super_region_names,
+                source_hash=str(data["source_hash"]),
+            )
+
+
+def load_callout_raster(json_path: str, cell_size: float = DEFAULT_CELL_SIZE) -> CalloutRaster:
+    source_hash = file_hash(json_path)
+    cache_path = raster_cache_path(json_path, cell_size)
+    if os.path.isfile(cache_path):
+        try:
+            raster = CalloutRaster.load(cache_path)
+            if raster.source_hash == source_hash:
+                return raster
+            logger.info(f"{json_path} changed, rebuilding {cache_path}")
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Discarding unreadable callout raster {cache_path}: {e}")
+
+    raster = CalloutRaster.build(GameMap.from_json(json_path), cell_size)
+    raster.source_hash = source_hash
+    raster.save(cache_path)
+    logger.info(f"Saved callout raster to {cache_path}")
+    return raster
@@ -0,0 +1,74 @@
+from collections.abc import Iterable, Iterator, Sequence
+from typing import overload
+
+import numpy as np
+
+from src.models.game_map.callout import Callout
+from src.models.game_map.location import Location
+
+
+class CalloutTable(Sequence[Callout]):
+    __slots__ = ("x", "y", "region_ids", "super_region_ids", "region_names", "super_region_names")
+
+    def __init__(self, callouts: Iterable[Callout] = ()):
+        # Columnar storage: coordinates as float64 arrays, names interned once and referenced by id
+        region_names: dict[str, int] = {}
+        super_region_names: dict[str | None, int] = {}
+        x, y, region_ids, super_region_ids = [], [], [], []
+        for callout in callouts:
+            x.append(callout.location.x)
+            y.append(callout.location.y)
+            region_ids.append(region_names.setdefault(callout.region_name, len(region_names)))
+            super_region_ids.append(super_region_names.setdefault(callout.super_region_name, len(super_region_names)))
+
+        self.x = np.array(x, dtype=np.float64)
+        self.y = np.array(y, dtype=np.float64)
+        self.region_ids = np.array(region_ids, dtype=np.uint16)
+        self.super_region_ids = np.array(super_region_ids, dtype=np.uint16)
+        self.region_names = tuple(region_names)
+        self.super_region_names = tuple(super_region_names)
+
+    @property
+    def points(self) -> np.ndarray:
+        return np.column_stack([self.x, self.y])
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    @overload
+    def __getitem__(self, index: int) -> Callout:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "CalloutTable":
+        ...
+
+    def __getitem__(self, index: int | slice) -> "Callout | CalloutTable":
+        if isinstance(index, slice):
+            table = CalloutTable()
+            table.x = self.x[index]
+            table.y = self.y[index]
+            table.region_ids = self.region_ids[index]
+            table.super_region_ids = self.super_region_ids[index]
+            table.region_names = self.region_names
+            table.super_region_names = self.super_region_names
+            return table
+
+        if not -len(self) <= index < len(self):
+            raise IndexError("CalloutTable index out of range")
+        return Callout(
+            region_name=self.region_names[self.region_ids[index]],
+            super_region_name=self.super_region_names[self.super_region_ids[index]],
+            location=Location(float(self.x[index]), float(self.y[index])),
+        )
+
+    def __iter__(self) -> Iterator[Callout]:
+        return (self[index] for index in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str) or len(other) != len(self):
+            return False
+        return all(callout == other_callout for callout, other_callout in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"CalloutTable({list(self)!r})"
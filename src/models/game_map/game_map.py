@@ -1,9 +1,12 @@
-import json
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
-from src.models.game_map.callout import Callout
+import numpy as np
+
+from src.models.game_map.callout import Callout, FrozenCallout
+from src.models.game_map.callout_index import CalloutIndex
+from src.models.game_map.callout_table import CalloutTable
 from src.models.serializable import Serializable
 
 
@@ -21,7 +24,7 @@ class MapUUID(Enum):
     SUNSET = "92584fbe-486a-b1b2-9faa-39b0f486b498"
 
 
-@dataclass
+@dataclass(slots=True)
 class GameMap(Serializable):
     X_MULTIPLIER = 1.0
     Y_MULTIPLIER = 1.0
@@ -38,6 +41,11 @@ class GameMap(Serializable):
     x_scalar_to_add: float = X_SCALAR_TO_ADD
     y_scalar_to_add: float = Y_SCALAR_TO_ADD
     callouts: list[Callout] = field(default_factory=list)
+    _callout_index: CalloutIndex | None = field(default=None, init=False, repr=False, compare=False)
+    _callout_table: tuple[list[Callout], CalloutTable] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _affine: tuple[tuple[float, ...], np.ndarray] | None = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, map_metadata: dict[str, Any]) -> "GameMap":
@@ -55,11 +63,119 @@ class GameMap(Serializable):
             callouts=[Callout.from_dict(callout) for callout in callouts_data],
         )
 
-    @classmethod
-    def from_json(cls, path: str) -> "GameMap":
-        with open(path) as file:
-            data = json.load(file)
-        return cls.from_dict(data)
+    def callout_table(self) -> CalloutTable:
+        # Opt-in columnar form of the callouts (x/y arrays, interned names), built on first use like the index
+        cached = self._callout_table
+        if cached is None or cached[0] is not self.callouts or len(cached[1]) != len(self.callouts):
+            cached = self._callout_table = (self.callouts, CalloutTable(self.callouts))
+        return cached[1]
+
+    @property
+    def callout_index(self) -> CalloutIndex:
+        # Built on first use and rebuilt if the callouts list is replaced or resized
+        index = self._callout_index
+        if index is None or index.callouts is not self.callouts or len(index) != len(self.callouts):
+            index = self._callout_index = CalloutIndex(self.callouts)
+        return index
+
+    def nearest_callout(self, x: float, y: float) -> Callout | None:
+        return self.callout_index.nearest(x, y)
+
+    def nearest_callouts(self, x: float, y: float, k: int) -> list[Callout]:
+        return self.callout_index.k_nearest(x, y, k)
+
+    def label_positions(self, points: np.ndarray) -> np.ndarray:
+        return self.callout_index.label(points)
+
+    @property
+    def affine(self) -> np.ndarray:
+        # 2x3 matrix from world (x, y, 1) to normalized image coordinates; world x/y are swapped on the minimap
+        key = (self.x_multiplier, self.y_multiplier, self.x_scalar_to_add, self.y_scalar_to_add)
+        if self._affine is None or self._affine[0] != key:
+            matrix = np.array(
+                [
+                    [0.0, self.x_multiplier, self.x_scalar_to_add],
+                    [self.y_multiplier, 0.0, self.y_scalar_to_add],
+                ]
+            )
+            matrix.setflags(write=False)
+            self._affine = (key, matrix)
+        return self._affine[1]
+
+    @staticmethod
+    def _apply_affine(matrix: np.ndarray, points: np.ndarray) -> np.ndarray:
+        points = np.asarray(points, dtype=np.float64)
+        result = np.empty(points.shape, dtype=np.float64)
+        for row in range(2):
+            result[..., row] = matrix[row, 2]
+            for column in range(2):
+                # Skipping zero terms keeps a NaN in one world axis from leaking into the other image axis
+                if matrix[row, column]:
+                    result[..., row] += matrix[row, column] * points[..., column]
+        return result
+
+    def world_to_image(self, points: np.ndarray, image_size: tuple[float, float] | None = None) -> np.ndarray:
+        matrix = self.affine
+        if image_size is not None:
+            matrix = matrix * np.array(image_size, dtype=np.float64)[:, np.newaxis]
+        return self._apply_affine(matrix, points)
+
+    def world_point_to_image(self, x: float, y: float) -> tuple[float, float]:
+        # Scalar path for per-point callers, building arrays would cost far more than the arithmetic
+        return y * self.x_multiplier + self.x_scalar_to_add, x * self.y_multiplier + self.y_scalar_to_add
+
+    def image_to_world(self, points: np.ndarray, image_size: tuple[float, float] | None = None) -> np.ndarray:
+        matrix = self.affine
+        if image_size is not None:
+            matrix = matrix * np.array(image_size, dtype=np.float64)[:, np.newaxis]
+        linear = matrix[:, :2]
+        if np.linalg.det(linear) == 0:
+            raise ValueError(f"{self.name} has a degenerate coordinate transform")
+        inverse = np.linalg.inv(linear)
+        return self._apply_affine(np.column_stack([inverse, -inverse @ matrix[:, 2]]), points)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "uuid": self.uuid.value,
+            "displayName": self.name,
+            "displayIcon": self.display_icon,
+            "listViewIcon": self.list_view_icon,
+            "splash": self.splash,
+            "xMultiplier": self.x_multiplier,
+            "yMultiplier": self.y_multiplier,
+            "xScalarToAdd": self.x_scalar_to_add,
+            "yScalarToAdd": self.y_scalar_to_add,
+            "callouts": [callout.to_dict() for callout in self.callouts],
+        }
+
+    def freeze(self) -> "FrozenGameMap":
+        return FrozenGameMap(
+            self.uuid,
+            self.name,
+            self.display_icon,
+            self.list_view_icon,
+            self.splash,
+            self.x_multiplier,
+            self.y_multiplier,
+            self.x_scalar_to_add,
+            self.y_scalar_to_add,
+            tuple(callout.freeze() for callout in self.callouts),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenGameMap:
+    # Plain immutable record, the callout index, callout table and affine transform stay on GameMap
+    uuid: MapUUID
+    name: str
+    display_icon: str
+    list_view_icon: str | None = None
+    splash: str | None = None
+    x_multiplier: float = GameMap.X_MULTIPLIER
+    y_multiplier: float = GameMap.Y_MULTIPLIER
+    x_scalar_to_add: float = GameMap.X_SCALAR_TO_ADD
+    y_scalar_to_add: float = GameMap.Y_SCALAR_TO_ADD
+    callouts: tuple[FrozenCallout, ...] = ()
 
     def to_dict(self) -> dict[str, Any]:
         return {
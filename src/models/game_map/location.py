@@ -1,10 +1,23 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     x: float = 0.0
     y: float = 0.0
 
     def to_dict(self) -> dict[str, float]:
         return {"x": self.x, "y": self.y}
+
+    def freeze(self) -> "FrozenLocation":
+        return FrozenLocation(self.x, self.y)
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenLocation:
+    # Immutable, hashable counterpart of Location, e.g. for set membership or dict keys
+    x: float = 0.0
+    y: float = 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        return {"x": self.x, "y": self.y}
@@ -1,12 +1,38 @@
 import json
 from abc import ABC, abstractmethod
+from typing import Any, TypeVar
+
+from src.models.codec import get_codec
+
+SerializableT = TypeVar("SerializableT", bound="Serializable")
 
 
 class Serializable(ABC):
+    __slots__ = ()
+
+    @classmethod
+    @abstractmethod
+    def from_dict(cls: type[SerializableT], data: dict[str, Any]) -> SerializableT:
+        pass
+
     @abstractmethod
     def to_dict(self) -> dict:
         pass
 
+    @classmethod
+    def from_json(cls: type[SerializableT], path: str) -> SerializableT:
+        # Every codec except msgpack reads the JSON written by to_json
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read(), "orjson")
+
     def to_json(self, path: str) -> None:
+        # Stays indented, data files are reviewed in diffs and kept formatted by pre-commit
         with open(path, "w") as file:
             json.dump(self.to_dict(), file, indent=2)
+
+    @classmethod
+    def from_bytes(cls: type[SerializableT], data: bytes, codec: str | None = None) -> SerializableT:
+        return cls.from_dict(get_codec(codec).decode(data))
+
+    def to_bytes(self, codec: str | None = None) -> bytes:
+        return get_codec(codec).encode(self.to_dict())
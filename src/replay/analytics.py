@@ -0,0 +1,380 @@
+import argparse
+import json
+import os
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from logging import INFO, basicConfig, getLogger
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.models.catalog import get_map, resolve
+from src.models.game_map.game_map import GameMap, MapUUID
+from src.replay.columnar import is_columnar_replay
+from src.replay.frames import PLAYER_COUNT, ReplayFrames, world_to_image
+from src.replay.streaming import DEFAULT_CHUNK_FRAMES, iter_replay_chunks
+
+basicConfig(level=INFO)
+logger = getLogger(__name__)
+
+DEFAULT_CHECKPOINT = os.path.join(".cache", "analytics", "checkpoint.jsonl")
+PROGRESS_INTERVAL = 5.0
+
+
+@dataclass
+class RoundStats:
+    round_number: int
+    frames: int = 0
+    phase_frames: dict[str, int] = field(default_factory=dict)
+    # Per player slot: world units travelled, frames with a position, and positions inside the minimap
+    distance: list[float] = field(default_factory=list)
+    visible_frames: list[int] = field(default_factory=list)
+    on_map_frames: list[int] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, round_data: dict[str, Any]) -> "RoundStats":
+        return cls(**round_data)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "round_number": self.round_number,
+            "frames": self.frames,
+            "phase_frames": self.phase_frames,
+            "distance": self.distance,
+            "visible_frames": self.visible_frames,
+            "on_map_frames": self.on_map_frames,
+        }
+
+
+@dataclass
+class MatchStats:
+    match_id: str
+    map_uuid: MapUUID
+    rounds: list[RoundStats] = field(default_factory=list)
+
+    @property
+    def frames(self) -> int:
+        return sum(round_stats.frames for round_stats in self.rounds)
+
+    @classmethod
+    def from_dict(cls, match_data: dict[str, Any]) -> "MatchStats":
+        return cls(
+            match_id=match_data["match_id"],
+            map_uuid=MapUUID(match_data["map_uuid"]),
+            rounds=[RoundStats.from_dict(round_data) for round_data in match_data["rounds"]],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "match_id": self.match_id,
+            "map_uuid": self.map_uuid.value,
+            "rounds": [round_stats.to_dict() for round_stats in self.rounds],
+        }
+
+
+class MatchAccumulator:
+    def __init__(self, match_id: str, game_map: GameMap, player_count: int = PLAYER_COUNT):
+        # Chunks arrive in order; the last frame of each chunk is carried over so movement across a chunk boundary
+        # still counts, while the jump to a new round's spawn never does
+        self.game_map = game_map
+        self.player_count = player_count
+        self.stats = MatchStats(match_id=match_id, map_uuid=game_map.uuid)
+        self._rounds: dict[int, RoundStats] = {}
+        self._previous_positions: np.ndarray | None = None
+        self._previous_round: int | None = None
+
+    def _round(self, round_number: int) -> RoundStats:
+        if round_number not in self._rounds:
+            round_stats = RoundStats(
+                round_number=round_number,
+                distance=[0.0] * self.player_count,
+                visible_frames=[0] * self.player_count,
+                on_map_frames=[0] * self.player_count,
+            )
+            self._rounds[round_number] = round_stats
+            self.stats.rounds.append(round_stats)
+        return self._rounds[round_number]
+
+    def add(self, frames: ReplayFrames) -> None:
+        if len(frames) == 0:
+            return
+        positions = np.asarray(frames.positions, dtype=np.float64)
+        rounds = np.asarray(frames.round_numbers)
+
+        if self._previous_positions is None:
+            previous_positions = np.concatenate([positions[:1], positions[:-1]])
+            previous_rounds = np.concatenate([[rounds[0] - 1], rounds[:-1]])
+        else:
+            previous_positions = np.concatenate([self._previous_positions[None], positions[:-1]])
+            previous_rounds = np.concatenate([[self._previous_round], rounds[:-1]])
+        steps = np.linalg.norm(positions - previous_positions, axis=2)
+        steps[(rounds != previous_rounds)[:, None] | ~np.isfinite(steps)] = 0.0
+
+        visible = np.isfinite(positions).all(axis=2)
+        image = world_to_image(positions, self.game_map)
+        on_map = visible & ((image >= 0.0) & (image <= 1.0)).all(axis=2)
+
+        for round_number in np.unique(rounds):
+            mask = rounds == round_number
+            round_stats = self._round(int(round_number))
+            round_stats.frames += int(mask.sum())
+            for code, count in enumerate(np.bincount(frames.phase_codes[mask], minlength=len(frames.phases))):
+                if count:
+                    phase = frames.phases[code]
+                    round_stats.phase_frames[phase] = round_stats.phase_frames.get(phase, 0) + int(count)
+            round_stats.distance = (np.add(round_stats.distance, steps[mask].sum(axis=0))).tolist()
+            round_stats.visible_frames = (np.add(round_stats.visible_frames, visible[mask].sum(axis=0))).tolist()
+            round_stats.on_map_frames = (np.add(round_stats.on_map_frames, on_map[mask].sum(axis=0))).tolist()
+
+        self._previous_positions = positions[-1]
+        self._previous_round = int(rounds[-1])
+
+
+@dataclass(frozen=True)
+class AnalyticsTask:
+    path: str
+    map_uuid: MapUUID
+    player_count: int = PLAYER_COUNT
+    chunk_frames: int = DEFAULT_CHUNK_FRAMES
+
+    @property
+    def match_id(self) -> str:
+        return os.path.abspath(self.path)
+
+
+def analyze_replay(task: AnalyticsTask) -> MatchStats:
+    # Runs in the worker processes: only the task goes over the pipe, each worker reads its replay itself
+    accumulator = MatchAccumulator(task.match_id, get_map(task.map_uuid), task.player_count)
+    for frames in iter_replay_chunks(task.path, task.chunk_frames, task.player_count):
+        accumulator.add(frames)
+    return accumulator.stats
+
+
+def find_replays(paths: Iterable[str]) -> Iterator[str]:
+    # Directories are searched for replay CSVs and columnar replays; columnar replays are directories themselves
+    for path in paths:
+        if is_columnar_replay(path) or os.path.isfile(path):
+            yield path
+            continue
+        for directory, subdirectories, filenames in os.walk(path):
+            subdirectories.sort()
+            for subdirectory in list(subdirectories):
+                if is_columnar_replay(os.path.join(directory, subdirectory)):
+                    subdirectories.remove(subdirectory)
+                    yield os.path.join(directory, subdirectory)
+            for filename in sorted(filenames):
+                if filename.endswith(".csv"):
+                    yield os.path.join(directory, filename)
+
+
+def infer_map(path: str) -> MapUUID:
+    # Replays are expected to be filed under a directory named after their map, e.g. replays/ascent/match.csv
+    parent = os.path.basename(os.path.dirname(os.path.abspath(path)))
+    return resolve(parent, MapUUID)
+
+
+def load_checkpoint(path: str) -> dict[str, MatchStats]:
+    completed: dict[str, MatchStats] = {}
+    if not os.path.isfile(path):
+        return completed
+    with open(path) as file:
+        for line_number, line in enumerate(file, start=1):
+            try:
+                stats = MatchStats.from_dict(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                # Most likely the line that was being written when a previous run was killed
+                logger.warning(f"Ignoring unreadable line {line_number} of {path}")
+                continue
+            completed[stats.match_id] = stats
+    return completed
+
+
+class AnalyticsRunner:
+    def __init__(self, workers: int | None = None, checkpoint_path: str | None = None):
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers or os.cpu_count() or 1
+        self.checkpoint_path = checkpoint_path
+        self.failed: dict[str, str] = {}
+
+    def _open_checkpoint(self) -> dict[str, MatchStats]:
+        if self.checkpoint_path is None:
+            return {}
+        os.makedirs(os.path.dirname(self.checkpoint_path) or ".", exist_ok=True)
+        completed = load_checkpoint(self.checkpoint_path)
+        # A run killed mid-write leaves a partial last line; end it so new records start on their own line
+        if os.path.isfile(self.checkpoint_path) and os.path.getsize(self.checkpoint_path):
+            with open(self.checkpoint_path, "rb+") as file:
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    file.write(b"\n")
+        return completed
+
+    def _checkpoint(self, stats: MatchStats) -> None:
+        if self.checkpoint_path is None:
+            return
+        with open(self.checkpoint_path, "a") as file:
+            file.write(json.dumps(stats.to_dict(), separators=(",", ":")) + "\n")
+
+    def run(self, tasks: Iterable[AnalyticsTask]) -> list[MatchStats]:
+        tasks = list(tasks)
+        completed = self._open_checkpoint()
+        pending = [task for task in tasks if task.match_id not in completed]
+        results = [completed[task.match_id] for task in tasks if task.match_id in completed]
+        if results:
+            logger.info(f"Resuming with {len(results)} matches from {self.checkpoint_path}")
+        logger.info(f"Analyzing {len(pending)} replays with {self.workers} workers")
+
+        progress = Progress(len(pending))
+        if self.workers == 1:
+            for task in pending:
+                try:
+                    stats = analyze_replay(task)
+                except Exception as e:
+                    self._fail(task, e)
+                else:
+                    self._checkpoint(stats)
+                    results.append(stats)
+                progress.advance()
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures: dict[Future[MatchStats], AnalyticsTask] = {
+                    executor.submit(analyze_replay, task): task for task in pending
+                }
+                for future in as_completed(futures):
+                    try:
+                        stats = future.result()
+                    except Exception as e:
+                        self._fail(futures[future], e)
+                    else:
+                        self._checkpoint(stats)
+                        results.append(stats)
+                    progress.advance()
+        progress.report(final=True)
+        return sorted(results, key=lambda stats: stats.match_id)
+
+    def _fail(self, task: AnalyticsTask, error: Exception) -> None:
+        # Failed replays stay out of the checkpoint, so the next run retries them
+        logger.error(f"Failed to analyze {task.path}: {error}")
+        self.failed[task.match_id] = str(error)
+
+
+class Progress:
+    def __init__(self, total: int, interval: float = PROGRESS_INTERVAL):
+        self.total = total
+        self.done = 0
+        self.interval = interval
+        self.started_at = self.reported_at = time.perf_counter()
+
+    def advance(self) -> None:
+        self.done += 1
+        if time.perf_counter() - self.reported_at >= self.interval:
+            self.report()
+
+    def report(self, final: bool = False) -> None:
+        now = time.perf_counter()
+        self.reported_at = now
+        elapsed = now - self.started_at
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        message = f"Analyzed {self.done}/{self.total} replays ({rate:.1f}/s"
+        if not final and rate > 0:
+            message += f", {(self.total - self.done) / rate:.0f}s left"
+        logger.info(message + ")")
+
+
+def round_table(matches: Iterable[MatchStats]) -> pd.DataFrame:
+    rows = []
+    for stats in matches:
+        for round_stats in stats.rounds:
+            row = {
+                "map": stats.map_uuid.name,
+                "match_id": stats.match_id,
+                "round": round_stats.round_number,
+                "frames": round_stats.frames,
+                "distance": float(np.sum(round_stats.distance)),
+                "players": sum(1 for frames in round_stats.visible_frames if frames),
+                "visible_frames": sum(round_stats.visible_frames),
+                "on_map_frames": sum(round_stats.on_map_frames),
+            }
+            row.update({f"phase_{phase}": frames for phase, frames in round_stats.phase_frames.items()})
+            rows.append(row)
+    table = pd.DataFrame(rows)
+    phase_columns = [column for column in table.columns if column.startswith("phase_")]
+    table[phase_columns] = table[phase_columns].fillna(0).astype(np.int64)
+    return table
+
+
+def summarize(matches: Iterable[MatchStats]) -> pd.DataFrame:
+    # Reduces the per-round rows of every match into one row per map
+    rounds = round_table(matches)
+    if rounds.empty:
+        return pd.DataFrame()
+    phase_columns = sorted(column for column in rounds.columns if column.startswith("phase_"))
+    grouped = rounds.groupby("map")
+    totals = grouped[["frames", "distance", "players", "visible_frames", "on_map_frames", *phase_columns]].sum()
+    totals["matches"] = grouped["match_id"].nunique()
+    totals["rounds"] = grouped.size()
+    summary = pd.DataFrame(
+        {
+            "matches": totals["matches"],
+            "rounds": totals["rounds"],
+            "frames": totals["frames"],
+            "frames_per_round": totals["frames"] / totals["rounds"],
+            "distance_per_player_round": totals["distance"] / totals["players"].where(totals["players"] > 0),
+            "on_map_fraction": totals["on_map_frames"] / totals["visible_frames"].where(totals["visible_frames"] > 0),
+        }
+    )
+    for column in phase_columns:
+        summary[f"{column}_fraction"] = totals[column] / totals["frames"]
+    return summary
+
+
+def build_tasks(
+    paths: Iterable[str],
+    map_name: str | None = None,
+    player_count: int = PLAYER_COUNT,
+    chunk_frames: int = DEFAULT_CHUNK_FRAMES,
+) -> list[AnalyticsTask]:
+    map_uuid = resolve(map_name, MapUUID) if map_name else None
+    tasks = []
+    for path in find_replays(paths):
+        try:
+            task_map = map_uuid or infer_map(path)
+        except ValueError:
+            logger.warning(f"Skipping {path}: pass --map or file it under a directory named after its map")
+            continue
+        tasks.append(AnalyticsTask(path, task_map, player_count, chunk_frames))
+    return tasks
+
+
+def parse_args(argv: list[str] | None = None, prog: str | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog=prog, description="Compute per-match, per-round and per-map replay stats")
+    parser.add_argument("replays", nargs="+", help="Replay CSVs, columnar replays or directories holding them")
+    parser.add_argument("--map", dest="map_name", help="Map of every replay, defaults to each replay's directory name")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes, defaults to the CPU count")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT, help="JSONL file of finished matches to resume")
+    parser.add_argument("--no-checkpoint", action="store_true", help="Analyze every replay from scratch")
+    parser.add_argument("--players", type=int, default=PLAYER_COUNT, help="Player slots per replay")
+    parser.add_argument("--chunk-frames", type=int, default=DEFAULT_CHUNK_FRAMES, help="Frames read at once")
+    parser.add_argument("--output", help="Write the per-map summary to this CSV file")
+    parser.add_argument("--rounds-output", help="Write the per-round table to this CSV file")
+    return parser.parse_args(argv)
+
+
+def main(args: argparse.Namespace) -> int:
+    tasks = build_tasks(args.replays, args.map_name, args.players, args.chunk_frames)
+    runner = AnalyticsRunner(workers=args.workers, checkpoint_path=None if args.no_checkpoint else args.checkpoint)
+    matches = runner.run(tasks)
+
+    summary = summarize(matches)
+    logger.info(f"Summary of {len(matches)} matches:\n{summary.to_string()}")
+    if args.output:
+        summary.to_csv(args.output)
+        logger.info(f"Saved the per-map summary to {args.output}")
+    if args.rounds_output:
+        round_table(matches).to_csv(args.rounds_output, index=False)
+        logger.info(f"Saved the per-round table to {args.rounds_output}")
+    return 1 if runner.failed else 0
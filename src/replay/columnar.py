@@ -0,0 +1,111 @@
+import argparse
+import json
+import os
+import shutil
+from logging import INFO, basicConfig, getLogger
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from src.replay.frames import PLAYER_COUNT, ReplayFrames, position_columns
+
+basicConfig(level=INFO)
+logger = getLogger(__name__)
+
+REPLAY_SUFFIX = ".replay"
+FORMAT_VERSION = 1
+METADATA_FILE = "metadata.json"
+ARRAY_FILES = {
+    "positions": "positions.npy",
+    "round_numbers": "round_numbers.npy",
+    "phase_codes": "phase_codes.npy",
+}
+
+
+def is_columnar_replay(path: str) -> bool:
+    return os.path.isfile(os.path.join(path, METADATA_FILE))
+
+
+def write_replay(frames: ReplayFrames, path: str, source: str | None = None) -> None:
+    # Arrays go to a sibling directory first so a crash never leaves a half-written replay behind
+    temp_path = f"{path}.tmp"
+    shutil.rmtree(temp_path, ignore_errors=True)
+    os.makedirs(temp_path)
+    for attribute, filename in ARRAY_FILES.items():
+        np.save(os.path.join(temp_path, filename), np.ascontiguousarray(getattr(frames, attribute)))
+
+    metadata = {
+        "version": FORMAT_VERSION,
+        "frames": len(frames),
+        "players": frames.player_count,
+        "phases": frames.phases,
+        "source": source,
+    }
+    with open(os.path.join(temp_path, METADATA_FILE), "w") as file:
+        json.dump(metadata, file, indent=2)
+
+    # The old replay is renamed aside rather than deleted, so there is always a complete replay on disk; read_replay
+    # falls back to the backup if a crash lands between the two renames
+    backup_path = f"{path}.old"
+    shutil.rmtree(backup_path, ignore_errors=True)
+    if os.path.exists(path):
+        os.replace(path, backup_path)
+    os.replace(temp_path, path)
+    shutil.rmtree(backup_path, ignore_errors=True)
+
+
+def read_metadata(path: str) -> dict:
+    with open(os.path.join(path, METADATA_FILE)) as file:
+        metadata = json.load(file)
+    if metadata.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported replay format version: {metadata.get('version')}")
+    return metadata
+
+
+def read_replay(path: str, mmap: bool = True) -> ReplayFrames:
+    if not is_columnar_replay(path) and is_columnar_replay(f"{path}.old"):
+        logger.warning(f"Reading {path} from the backup left by an interrupted write")
+        path = f"{path}.old"
+    if not is_columnar_replay(path):
+        raise FileNotFoundError(f"Columnar replay not found: {path}")
+    metadata = read_metadata(path)
+    mmap_mode: Literal["r"] | None = "r" if mmap else None
+    arrays = {
+        attribute: np.load(os.path.join(path, filename), mmap_mode=mmap_mode)
+        for attribute, filename in ARRAY_FILES.items()
+    }
+    return ReplayFrames(phases=metadata["phases"], **arrays)
+
+
+def read_csv_frames(csv_path: str, player_count: int = PLAYER_COUNT) -> ReplayFrames:
+    columns = position_columns(player_count)
+    replay = pd.read_csv(
+        csv_path,
+        usecols=["roundNumber", "phase", *columns],
+        dtype={column: np.float32 for column in columns},
+    )
+    return ReplayFrames.from_dataframe(replay, player_count)
+
+
+def convert_csv(csv_path: str, output: str | None = None) -> str:
+    output = output or f"{os.path.splitext(csv_path)[0]}{REPLAY_SUFFIX}"
+    frames = read_csv_frames(csv_path)
+    write_replay(frames, output, source=os.path.basename(csv_path))
+    logger.info(f"Converted {len(frames)} frames from {csv_path} to {output}")
+    return output
+
+
+def parse_args(argv: list[str] | None = None, prog: str | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog=prog, description="Convert a replay CSV to the columnar memory-mapped format")
+    parser.add_argument("csv_file_path", help="Replay CSV file")
+    parser.add_argument("output", nargs="?", help=f"Output directory, defaults to the CSV path with {REPLAY_SUFFIX}")
+    return parser.parse_args(argv)
+
+
+def main(args: argparse.Namespace) -> None:
+    convert_csv(args.csv_file_path, args.output)
+
+
+if __name__ == "__main__":
+    main(parse_args())
@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from src.models.game_map.game_map import GameMap
+
+PLAYER_COUNT = 10
+# Stands in for blank round numbers, e.g. empty rows or frames recorded before the first round starts
+UNKNOWN_ROUND = -1
+
+
+def position_columns(player_count: int = PLAYER_COUNT) -> list[str]:
+    return [f"{i + 1}_{axis}" for i in range(player_count) for axis in ("x", "y")]
+
+
+def extract_positions(replay: pd.DataFrame, player_count: int = PLAYER_COUNT) -> np.ndarray:
+    values = replay[position_columns(player_count)].to_numpy(dtype=np.float32)
+    return values.reshape(len(replay), player_count, 2)
+
+
+@dataclass
+class ReplayFrames:
+    positions: np.ndarray
+    round_numbers: np.ndarray
+    phase_codes: np.ndarray
+    phases: list[str]
+
+    @classmethod
+    def from_dataframe(
+        cls, replay: pd.DataFrame, player_count: int = PLAYER_COUNT, phases: list[str] | None = None
+    ) -> "ReplayFrames":
+        # Passing the same phases list across chunks keeps phase codes stable for a whole replay
+        phases = [] if phases is None else phases
+        codes, uniques = pd.factorize(replay["phase"], use_na_sentinel=False)
+        lookup = []
+        for phase in (str(unique) for unique in uniques):
+            if phase not in phases:
+                phases.append(phase)
+            lookup.append(phases.index(phase))
+        return cls(
+            positions=extract_positions(replay, player_count),
+            round_numbers=replay["roundNumber"].fillna(UNKNOWN_ROUND).to_numpy(dtype=np.int32),
+            phase_codes=np.asarray(lookup, dtype=np.uint8)[codes],
+            phases=phases,
+        )
+
+    def __len__(self) -> int:
+        return len(self.round_numbers)
+
+    @property
+    def player_count(self) -> int:
+        return self.positions.shape[1]
+
+    def phase(self, frame: int) -> str:
+        return self.phases[self.phase_codes[frame]]
+
+
+def world_to_image(positions: np.ndarray, game_map: GameMap, width: float = 1.0, height: float = 1.0) -> np.ndarray:
+    # NaN positions (dead or missing players) propagate untouched
+    return game_map.world_to_image(positions, (width, height)).astype(np.float32)
@@ -0,0 +1,234 @@
+import argparse
+import json
+import os
+import tempfile
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from logging import getLogger
+
+import numpy as np
+
+from src.models.catalog import get_map
+from src.models.game_map.game_map import GameMap, MapUUID
+from src.replay.frames import PLAYER_COUNT, ReplayFrames, world_to_image
+from src.replay.streaming import iter_replay_chunks
+
+logger = getLogger(__name__)
+
+DEFAULT_BINS = 256
+DEFAULT_STORE_DIRECTORY = os.path.join(".cache", "heatmaps")
+ASSETS_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "assets", "maps")
+
+
+@dataclass(frozen=True)
+class HeatmapFilter:
+    rounds: frozenset[int] | None = None
+    phases: frozenset[str] | None = None
+    players: frozenset[int] | None = None
+
+    def __post_init__(self):
+        if self.players is not None:
+            invalid = sorted(player for player in self.players if not 0 < player <= PLAYER_COUNT)
+            if invalid:
+                raise ValueError(f"players must be slots 1 to {PLAYER_COUNT}, got {invalid}")
+
+    def to_dict(self) -> dict[str, list | None]:
+        return {
+            "rounds": sorted(self.rounds) if self.rounds is not None else None,
+            "phases": sorted(self.phases) if self.phases is not None else None,
+            "players": sorted(self.players) if self.players is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, filter_data: dict[str, list | None]) -> "HeatmapFilter":
+        rounds, phases, players = (filter_data.get(key) for key in ("rounds", "phases", "players"))
+        return cls(
+            rounds=frozenset(rounds) if rounds is not None else None,
+            phases=frozenset(phases) if phases is not None else None,
+            players=frozenset(players) if players is not None else None,
+        )
+
+    def select(self, frames: ReplayFrames) -> np.ndarray:
+        mask = np.ones(len(frames), dtype=bool)
+        if self.rounds is not None:
+            mask &= np.isin(frames.round_numbers, list(self.rounds))
+        if self.phases is not None:
+            codes = [code for code, phase in enumerate(frames.phases) if phase in self.phases]
+            mask &= np.isin(frames.phase_codes, codes)
+
+        players = np.arange(frames.player_count)
+        if self.players is not None:
+            # Replays may have fewer slots than the filter names, so those slots select nothing
+            players = np.array(
+                [player - 1 for player in sorted(self.players) if player <= frames.player_count], dtype=np.intp
+            )
+        return frames.positions[mask][:, players]
+
+
+@dataclass
+class PositionHeatmap:
+    map_uuid: MapUUID
+    bins: int = DEFAULT_BINS
+    filter: HeatmapFilter = field(default_factory=HeatmapFilter)
+    counts: np.ndarray = field(default=None)  # type: ignore[arg-type]
+    matches: set[str] = field(default_factory=set)
+
+    def __post_init__(self):
+        if self.counts is None:
+            self.counts = np.zeros((self.bins, self.bins), dtype=np.int64)
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum())
+
+    def accumulate(self, frames: ReplayFrames, game_map: GameMap) -> None:
+        if game_map.uuid != self.map_uuid:
+            raise ValueError(f"Cannot add {game_map.uuid.name} positions to a {self.map_uuid.name} heatmap")
+        # Normalized image space: rows follow image y, columns image x, both in [0, 1)
+        points = world_to_image(self.filter.select(frames), game_map).reshape(-1, 2)
+        points = points[~np.isnan(points).any(axis=1)]
+        histogram, _, _ = np.histogram2d(points[:, 1], points[:, 0], bins=self.bins, range=[[0.0, 1.0], [0.0, 1.0]])
+        self.counts += histogram.astype(np.int64)
+
+    def add_match(self, match_id: str, chunks: Iterable[ReplayFrames], game_map: GameMap) -> bool:
+        if match_id in self.matches:
+            logger.info(f"Skipping {match_id}, already in the {self.map_uuid.name} heatmap")
+            return False
+        for frames in chunks:
+            self.accumulate(frames, game_map)
+        self.matches.add(match_id)
+        return True
+
+    def merge(self, other: "PositionHeatmap") -> "PositionHeatmap":
+        if (other.map_uuid, other.bins, other.filter) != (self.map_uuid, self.bins, self.filter):
+            raise ValueError("Only heatmaps with the same map, bins and filter can be merged")
+        overlap = self.matches & other.matches
+        if overlap:
+            raise ValueError(f"Heatmaps share {len(overlap)} matches and would double count them")
+        return PositionHeatmap(
+            map_uuid=self.map_uuid,
+            bins=self.bins,
+            filter=self.filter,
+            counts=self.counts + other.counts,
+            matches=self.matches | other.matches,
+        )
+
+    def __add__(self, other: "PositionHeatmap") -> "PositionHeatmap":
+        return self.merge(other)
+
+    def density(self) -> np.ndarray:
+        total = self.total
+        return self.counts / total if total else np.zeros(self.counts.shape)
+
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        metadata = {
+            "map_uuid": self.map_uuid.value,
+            "bins": self.bins,
+            "filter": self.filter.to_dict(),
+            "matches": sorted(self.matches),
+        }
+        with tempfile.NamedTemporaryFile(dir=directory, suffix=".npz", delete=False) as file:
+            np.savez_compressed(file, counts=self.counts, metadata=np.array(json.dumps(metadata)))
+        os.replace(file.name, path)
+
+    @classmethod
+    def load(cls, path: str) -> "PositionHeatmap":
+        with np.load(path) as data:
+            metadata = json.loads(str(data["metadata"]))
+            return cls(
+                map_uuid=MapUUID(metadata["map_uuid"]),
+                bins=metadata["bins"],
+                filter=HeatmapFilter.from_dict(metadata["filter"]),
+                counts=data["counts"],
+                matches=set(metadata["matches"]),
+            )
+
+    def render(self, image_path: str, output_path: str, cmap: str = "inferno", alpha: float = 0.6) -> None:
+        # Rendering is the only part that needs matplotlib and PIL, so aggregating replays never imports them
+        from matplotlib import colormaps
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        from PIL import Image
+
+        map_image = Image.open(image_path)
+        width, height = map_image.size
+        fig = Figure(figsize=(10, 10), dpi=100)
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_axes((0, 0, 1, 1))
+        ax.set_axis_off()
+        ax.imshow(map_image, extent=(0, width, height, 0))
+
+        # Log scaling keeps sparse areas visible next to spawn hot spots; empty bins stay transparent
+        intensity = np.log1p(self.counts.astype(np.float64))
+        if intensity.max() > 0:
+            intensity /= intensity.max()
+        overlay = np.ma.masked_equal(intensity, 0.0)
+        ax.imshow(overlay, extent=(0, width, height, 0), cmap=colormaps[cmap], alpha=alpha, interpolation="bilinear")
+        ax.set_xlim(0, width)
+        ax.set_ylim(height, 0)
+        canvas.print_png(output_path)
+
+
+class HeatmapStore:
+    def __init__(self, directory: str, bins: int = DEFAULT_BINS, heatmap_filter: HeatmapFilter | None = None):
+        self.directory = directory
+        self.bins = bins
+        self.filter = heatmap_filter or HeatmapFilter()
+
+    def path(self, map_uuid: MapUUID) -> str:
+        return os.path.join(self.directory, f"{map_uuid.name.lower()}.heatmap.npz")
+
+    def get(self, map_uuid: MapUUID) -> PositionHeatmap:
+        path = self.path(map_uuid)
+        if os.path.isfile(path):
+            heatmap = PositionHeatmap.load(path)
+            if (heatmap.bins, heatmap.filter) != (self.bins, self.filter):
+                raise ValueError(f"{path} was built with different bins or filters")
+            return heatmap
+        return PositionHeatmap(map_uuid=map_uuid, bins=self.bins, filter=self.filter)
+
+    def add_replays(
+        self, game_map: GameMap, replay_paths: Iterable[str], player_count: int = PLAYER_COUNT
+    ) -> PositionHeatmap:
+        heatmap = self.get(game_map.uuid)
+        added = 0
+        for replay_path in replay_paths:
+            match_id = os.path.abspath(replay_path)
+            added += heatmap.add_match(match_id, iter_replay_chunks(replay_path, player_count=player_count), game_map)
+        if added:
+            heatmap.save(self.path(game_map.uuid))
+            logger.info(f"Added {added} matches to the {game_map.name} heatmap ({len(heatmap.matches)} total)")
+        return heatmap
+
+    def merge_into(self, partial: PositionHeatmap) -> PositionHeatmap:
+        heatmap = self.get(partial.map_uuid).merge(partial)
+        heatmap.save(self.path(partial.map_uuid))
+        return heatmap
+
+
+def parse_args(argv: list[str] | None = None, prog: str | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog=prog, description="Add replays to a map's positional heatmap")
+    parser.add_argument("map_name", help="Map name, e.g. ascent")
+    parser.add_argument("replays", nargs="*", help="Replay CSV files or columnar replay directories")
+    parser.add_argument("--store", default=DEFAULT_STORE_DIRECTORY, help="Directory holding the per-map heatmaps")
+    parser.add_argument("--bins", type=int, default=DEFAULT_BINS, help="Histogram bins per axis")
+    parser.add_argument("--rounds", type=int, nargs="+", help="Only count these rounds")
+    parser.add_argument("--phases", nargs="+", help="Only count these phases")
+    parser.add_argument("--players", type=int, nargs="+", help="Only count these player slots (1-based)")
+    parser.add_argument("--render", help="Write a PNG overlay of the heatmap on the map")
+    return parser.parse_args(argv)
+
+
+def main(args: argparse.Namespace) -> None:
+    heatmap_filter = HeatmapFilter(
+        rounds=frozenset(args.rounds) if args.rounds else None,
+        phases=frozenset(args.phases) if args.phases else None,
+        players=frozenset(args.players) if args.players else None,
+    )
+    game_map = get_map(args.map_name)
+    heatmap = HeatmapStore(args.store, args.bins, heatmap_filter).add_replays(game_map, args.replays)
+    if args.render:
+        heatmap.render(os.path.join(ASSETS_DIRECTORY, game_map.name.lower(), "display_icon.png"), args.render)
+        logger.info(f"Saved heatmap overlay to {args.render}")
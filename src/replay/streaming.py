@@ -0,0 +1,85 @@
+import queue
+import threading
+from collections.abc import Iterable, Iterator
+from typing import TypeVar
+
+import numpy as np
+import pandas as pd
+
+from src.replay.columnar import is_columnar_replay, read_replay
+from src.replay.frames import PLAYER_COUNT, ReplayFrames, position_columns
+
+T = TypeVar("T")
+
+DEFAULT_CHUNK_FRAMES = 10_000
+DEFAULT_PREFETCH_DEPTH = 2
+
+
+def iter_replay_chunks(
+    path: str, chunk_frames: int = DEFAULT_CHUNK_FRAMES, player_count: int = PLAYER_COUNT
+) -> Iterator[ReplayFrames]:
+    if chunk_frames < 1:
+        raise ValueError("chunk_frames must be at least 1")
+
+    if is_columnar_replay(path):
+        frames = read_replay(path)
+        for start in range(0, len(frames), chunk_frames):
+            end = start + chunk_frames
+            yield ReplayFrames(
+                positions=frames.positions[start:end],
+                round_numbers=frames.round_numbers[start:end],
+                phase_codes=frames.phase_codes[start:end],
+                phases=frames.phases,
+            )
+        return
+
+    columns = position_columns(player_count)
+    phases: list[str] = []
+    with pd.read_csv(
+        path,
+        usecols=["roundNumber", "phase", *columns],
+        dtype={column: np.float32 for column in columns},
+        chunksize=chunk_frames,
+    ) as reader:
+        for chunk in reader:
+            if chunk.empty:
+                continue
+            yield ReplayFrames.from_dataframe(chunk, player_count, phases=phases)
+
+
+def prefetch(items: Iterable[T], depth: int = DEFAULT_PREFETCH_DEPTH) -> Iterator[T]:
+    # Reads ahead on a background thread; the bounded queue caps how many chunks are held in memory
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    done = object()
+    stop = threading.Event()
+
+    def put(entry: tuple) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+            put((done, None))
+        except BaseException as e:
+            put((done, e))
+
+    thread = threading.Thread(target=produce, name="replay-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
@@ -1,15 +1,39 @@
+import argparse
 import os
+import time
+from collections.abc import Generator, Iterator
+from logging import getLogger
+from typing import TYPE_CHECKING
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-from matplotlib.animation import FuncAnimation
 from PIL import Image
 
+from src.models.catalog import get_map
 from src.models.game_map.game_map import GameMap
+from src.replay.columnar import is_columnar_replay, read_replay
+from src.replay.frames import ReplayFrames, world_to_image
+from src.replay.streaming import DEFAULT_CHUNK_FRAMES, iter_replay_chunks, prefetch
+from src.view.playback import FrameRateMeter
+from src.view.profiling import FrameProfiler
+
+if TYPE_CHECKING:
+    from matplotlib.artist import Artist
+    from matplotlib.collections import PathCollection
+    from matplotlib.text import Text
+
+logger = getLogger(__name__)
 
 
 class ViewMap:
-    def __init__(self, map_name: str, csv_file_path: str):
+    def __init__(
+        self,
+        map_name: str,
+        csv_file_path: str,
+        stream: bool = False,
+        chunk_frames: int = DEFAULT_CHUNK_FRAMES,
+        profiler: FrameProfiler | None = None,
+    ):
         # Get the directory of the current script
         self.base_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -18,9 +42,25 @@ class ViewMap:
         self.image_file_path = os.path.join(self.base_dir, "..", "assets", "maps", map_name, "display_icon.png")
         self.json_file_path = os.path.join(self.base_dir, "..", "data", "maps", f"{map_name}.json")
 
-        self.selected_map = GameMap.from_json(self.json_file_path)
+        self.selected_map = get_map(map_name)
         self.map_img = self.load_map_image()
-        self.current_game = self.load_csv_data()
+        self.current_game: pd.DataFrame | None = None
+        self.profiler = profiler
+        self.stream = stream
+        self.chunk_frames = chunk_frames
+        self._chunks: Iterator[ReplayFrames] | None = None
+        self._exhausted = False
+        if stream:
+            self._chunks = self.stream_replay_frames(chunk_frames)
+            try:
+                self.frames = self._next_chunk()
+            except StopIteration:
+                raise RuntimeError(f"Replay contains no frames: {self.csv_file_path}")
+        else:
+            self.frames = self.load_replay_frames()
+        self.player_positions = self.convert_replay_coordinates(self.frames.positions, self.selected_map)
+        self.frame_rate = FrameRateMeter()
+        self._title_key: tuple[int, int] | None = None
 
     def load_map_image(self) -> Image.Image:
         if not os.path.isfile(self.image_file_path):
@@ -30,6 +70,53 @@ class ViewMap:
         except OSError as e:
             raise RuntimeError(f"Failed to load map image: {e}")
 
+    def load_replay_frames(self) -> ReplayFrames:
+        # Columnar replays are memory-mapped as-is; CSV files still go through pandas
+        if is_columnar_replay(self.csv_file_path):
+            try:
+                return read_replay(self.csv_file_path)
+            except (OSError, ValueError) as e:
+                raise RuntimeError(f"Failed to load columnar replay: {e}")
+        self.current_game = self.load_csv_data()
+        return ReplayFrames.from_dataframe(self.current_game)
+
+    def stream_replay_frames(self, chunk_frames: int) -> Iterator[ReplayFrames]:
+        if not os.path.exists(self.csv_file_path):
+            raise FileNotFoundError(f"CSV file not found: {self.csv_file_path}")
+        return prefetch(iter_replay_chunks(self.csv_file_path, chunk_frames))
+
+    def _next_chunk(self) -> ReplayFrames:
+        if self._chunks is None:
+            raise StopIteration
+        try:
+            return next(self._chunks)
+        except (OSError, ValueError, pd.errors.EmptyDataError, pd.errors.ParserError) as e:
+            raise RuntimeError(f"Failed to load CSV data: {e}")
+
+    def iter_frame_indices(self) -> Generator[int, None, None]:
+        # In streaming mode the next chunk is swapped in as soon as the current one has been played. FuncAnimation
+        # calls this again on every repeat, so a fully played stream is reopened from its first chunk
+        if self._exhausted:
+            self._chunks = self.stream_replay_frames(self.chunk_frames)
+            self._swap_chunk(self._next_chunk())
+            self._exhausted = False
+        yield from range(len(self.frames))
+        while self._chunks is not None:
+            try:
+                frames = self._next_chunk()
+            except StopIteration:
+                self._exhausted = True
+                return
+            self._swap_chunk(frames)
+            yield from range(len(self.frames))
+
+    def _swap_chunk(self, frames: ReplayFrames) -> None:
+        started_at = time.perf_counter()
+        self.frames = frames
+        self.player_positions = self.convert_replay_coordinates(self.frames.positions, self.selected_map)
+        if self.profiler is not None:
+            self.profiler.add("transform", time.perf_counter() - started_at)
+
     def load_csv_data(self) -> pd.DataFrame:
         if not os.path.isfile(self.csv_file_path):
             raise FileNotFoundError(f"CSV file not found: {self.csv_file_path}")
@@ -39,46 +126,110 @@ class ViewMap:
             raise RuntimeError(f"Failed to load CSV data: {e}")
 
     def convert_coordinates(self, x: float, y: float, selected_map: GameMap) -> tuple[float, float]:
-        x_image = (y * selected_map.x_multiplier) + selected_map.x_scalar_to_add
-        y_image = (x * selected_map.y_multiplier) + selected_map.y_scalar_to_add
-        return x_image, y_image
-
-    def update(self, frame: int, players: list[plt.Line2D], selected_map: GameMap, plot: plt.Axes) -> list[plt.Line2D]:
-        phase = self.current_game.iloc[frame]["phase"]
-        round_number = self.current_game.iloc[frame]["roundNumber"]
-
-        for i, scatter in enumerate(players):
-            x = self.current_game.iloc[frame][f"{i+1}_x"]
-            y = self.current_game.iloc[frame][f"{i+1}_y"]
-
-            if pd.isna(x) or pd.isna(y):
-                scatter.set_data([], [])
-            else:
-                x_img, y_img = self.convert_coordinates(x, y, selected_map)
-                scatter.set_data([x_img * self.map_img.width], [y_img * self.map_img.height])
-
-        plot.set_title(f"{self.map_name} Map - Phase: {phase}, Round: {round_number}")
-        return players
+        return selected_map.world_point_to_image(x, y)
+
+    def convert_replay_coordinates(self, positions: np.ndarray, selected_map: GameMap) -> np.ndarray:
+        # (frames, players, 2) pixel coordinates, computed once so playback does no coordinate math
+        return world_to_image(positions, selected_map, self.map_img.width, self.map_img.height)
+
+    def title_for_frame(self, frame: int) -> str:
+        return f"{self.map_name} Map - Phase: {self.frames.phase(frame)}, Round: {self.frames.round_numbers[frame]}"
+
+    def update(self, frame: int, players: "PathCollection", title: "Text") -> list["Artist"]:
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.begin_frame(frame)
+        title_key = (int(self.frames.round_numbers[frame]), int(self.frames.phase_codes[frame]))
+        if profiler is not None:
+            profiler.lap("fetch")
+        positions = self.player_positions[frame]
+        if profiler is not None:
+            profiler.lap("transform")
+
+        # NaN offsets (dead or missing players) are skipped by the renderer, so no per-player branching is needed
+        players.set_offsets(positions)
+        if title_key != self._title_key:
+            title.set_text(self.title_for_frame(frame))
+            self._title_key = title_key
+        if profiler is not None:
+            profiler.lap("artists")
+
+        self.frame_rate.tick()
+        return [players, title]
+
+    def show_map(self, interval: int = 5):
+        # pyplot selects a GUI backend on import, so it is only loaded once something is actually shown
+        import matplotlib.pyplot as plt
+        from matplotlib.animation import FuncAnimation
+        from matplotlib.lines import Line2D
 
-    def show_map(self):
         fig, ax = plt.subplots(figsize=(10, 10))
         ax.imshow(self.map_img, extent=[0, self.map_img.width, self.map_img.height, 0])
 
-        players = [ax.plot([], [], "o", markersize=8, label=f"Player {i+1}")[0] for i in range(10)]
+        colors = plt.get_cmap("tab10")(np.arange(self.frames.player_count))
+        players = ax.scatter(
+            np.full(self.frames.player_count, np.nan), np.full(self.frames.player_count, np.nan), s=64, c=colors
+        )
+        # The title lives inside the axes so blitting, which only repaints the axes area, can refresh it
+        title = ax.text(
+            0.5,
+            0.99,
+            "",
+            transform=ax.transAxes,
+            ha="center",
+            va="top",
+            bbox={"facecolor": "white", "alpha": 0.7, "edgecolor": "none"},
+        )
+        self._title_key = None
+        self.frame_rate = FrameRateMeter()
 
         _ = FuncAnimation(
             fig,
             self.update,
-            fargs=(players, self.selected_map, ax),
-            frames=len(self.current_game),
-            interval=5,
-            blit=False,
+            fargs=(players, title),
+            frames=self.iter_frame_indices if self.stream else len(self.frames),
+            interval=interval,
+            blit=True,
+            cache_frame_data=False,
         )
+        fig.canvas.mpl_connect("close_event", lambda _: self.frame_rate.report(target_fps=1000 / interval))
+        profiler = self.profiler
+        if profiler is not None:
+            # Blitting ends every animation frame, so the wrapped blit closes the profiled frame
+            fig.canvas.blit = profiler.instrument_draw(fig.canvas.blit)  # type: ignore[method-assign]
+            fig.canvas.mpl_connect("close_event", lambda _: profiler.report())
 
         # Customize the plot
         ax.set_xlim(0, self.map_img.width)
         ax.set_ylim(self.map_img.height, 0)
-        ax.legend(loc="upper right")
+        ax.legend(
+            handles=[
+                Line2D([], [], marker="o", linestyle="", color=color, label=f"Player {i+1}")
+                for i, color in enumerate(colors)
+            ],
+            loc="upper right",
+        )
 
         # Display the animation
         plt.show()
+
+
+def parse_args(argv: list[str] | None = None, prog: str | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog=prog, description="Play back a replay on its map")
+    parser.add_argument("map_name", help="Map name, e.g. ascent")
+    parser.add_argument("csv_file_path", help="Replay CSV file or columnar replay directory")
+    parser.add_argument("--stream", action="store_true", help="Load the replay in bounded chunks during playback")
+    parser.add_argument("--interval", type=int, default=5, help="Delay between frames in milliseconds")
+    parser.add_argument(
+        "--profile", action="store_true", help="Time each frame's stages and report percentiles and dropped frames"
+    )
+    parser.add_argument("--trace", help="Also write a Chrome trace JSON of every profiled frame to this file")
+    return parser.parse_args(argv)
+
+
+def main(args: argparse.Namespace) -> None:
+    profiler = None
+    if args.profile or args.trace:
+        profiler = FrameProfiler(target_fps=1000 / args.interval, trace_path=args.trace)
+    view = ViewMap(args.map_name, os.path.abspath(args.csv_file_path), stream=args.stream, profiler=profiler)
+    view.show_map(args.interval)
@@ -0,0 +1,220 @@
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from logging import INFO, basicConfig, getLogger
+
+import numpy as np
+from matplotlib import colormaps
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
+
+from src.view.ViewMap import ViewMap
+
+basicConfig(level=INFO)
+logger = getLogger(__name__)
+
+FRAME_PATTERN = "frame_{:06d}.png"
+
+
+@dataclass
+class RenderChunk:
+    positions: np.ndarray
+    titles: list[str]
+    first_index: int
+    directory: str
+    figsize: tuple[float, float]
+    dpi: int
+
+
+# Set once per worker process by the pool initializer, so the map image is not pickled with every chunk
+_worker_map_image: np.ndarray | None = None
+
+
+def init_worker(map_image: np.ndarray) -> None:
+    global _worker_map_image
+    _worker_map_image = map_image
+
+
+def render_worker_chunk(chunk: RenderChunk) -> int:
+    if _worker_map_image is None:
+        raise RuntimeError("Worker was not initialized with a map image")
+    return render_chunk(chunk, _worker_map_image)
+
+
+def render_chunk(chunk: RenderChunk, map_image: np.ndarray) -> int:
+    # Figure + Agg canvas instead of pyplot keeps workers headless and free of global backend state
+    height, width = map_image.shape[:2]
+    fig = Figure(figsize=chunk.figsize, dpi=chunk.dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_axes((0, 0, 1, 1))
+    ax.set_axis_off()
+    ax.imshow(map_image, extent=(0, width, height, 0))
+    ax.set_xlim(0, width)
+    ax.set_ylim(height, 0)
+
+    player_count = chunk.positions.shape[1]
+    players = ax.scatter(np.full(player_count, np.nan), np.full(player_count, np.nan), s=64)
+    players.set_color(colormaps["tab10"](np.arange(player_count)))
+    players.set_animated(True)
+    title = ax.text(
+        0.5,
+        0.99,
+        "",
+        transform=ax.transAxes,
+        ha="center",
+        va="top",
+        animated=True,
+        bbox={"facecolor": "white", "alpha": 0.7, "edgecolor": "none"},
+    )
+
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+    for offset, (positions, text) in enumerate(zip(chunk.positions, chunk.titles)):
+        canvas.restore_region(background)
+        players.set_offsets(positions)
+        if title.get_text() != text:
+            title.set_text(text)
+        ax.draw_artist(players)
+        ax.draw_artist(title)
+        frame = Image.fromarray(np.asarray(canvas.buffer_rgba())).convert("RGB")
+        frame.save(os.path.join(chunk.directory, FRAME_PATTERN.format(chunk.first_index + offset)), compress_level=1)
+    return len(chunk.titles)
+
+
+class ReplayExporter:
+    FORMATS = ("mp4", "gif", "png")
+    DEFAULT_FPS = 30
+    CHUNKS_PER_WORKER = 4
+
+    def __init__(
+        self,
+        view_map: ViewMap,
+        fps: int = DEFAULT_FPS,
+        stride: int = 1,
+        workers: int | None = None,
+        figsize: tuple[float, float] = (10, 10),
+        dpi: int = 100,
+    ):
+        if stride < 1:
+            raise ValueError("stride must be at least 1")
+        self.view_map = view_map
+        self.fps = fps
+        self.stride = stride
+        self.workers = workers or os.cpu_count() or 1
+        self.figsize = figsize
+        self.dpi = dpi
+
+    def _chunks(self, directory: str) -> list[RenderChunk]:
+        frame_indices = np.arange(0, len(self.view_map.frames), self.stride)
+        chunk_count = max(1, min(len(frame_indices), self.workers * self.CHUNKS_PER_WORKER))
+
+        chunks = []
+        first_index = 0
+        for indices in np.array_split(frame_indices, chunk_count):
+            if len(indices) == 0:
+                continue
+            chunks.append(
+                RenderChunk(
+                    positions=self.view_map.player_positions[indices],
+                    titles=[self.view_map.title_for_frame(int(frame)) for frame in indices],
+                    first_index=first_index,
+                    directory=directory,
+                    figsize=self.figsize,
+                    dpi=self.dpi,
+                )
+            )
+            first_index += len(indices)
+        return chunks
+
+    def render_frames(self, directory: str) -> int:
+        os.makedirs(directory, exist_ok=True)
+        chunks = self._chunks(directory)
+        map_image = np.asarray(self.view_map.map_img.convert("RGBA"))
+        if self.workers == 1:
+            rendered = sum(render_chunk(chunk, map_image) for chunk in chunks)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self.workers, initializer=init_worker, initargs=(map_image,)
+            ) as executor:
+                rendered = 0
+                for count in executor.map(render_worker_chunk, chunks):
+                    rendered += count
+                    logger.info(f"Rendered {rendered} frames")
+        return rendered
+
+    def export(self, output: str, output_format: str | None = None) -> str:
+        output_format = output_format or os.path.splitext(output)[1].lstrip(".").lower() or "png"
+        if output_format not in self.FORMATS:
+            raise ValueError(f"Unsupported export format: {output_format}")
+
+        if output_format == "png":
+            rendered = self.render_frames(output)
+            logger.info(f"Exported {rendered} frames to {output}")
+            return output
+
+        with tempfile.TemporaryDirectory(prefix="valostats-export-") as directory:
+            rendered = self.render_frames(directory)
+            if output_format == "gif":
+                self._stitch_gif(directory, rendered, output)
+            else:
+                self._stitch_mp4(directory, output)
+        logger.info(f"Exported {rendered} frames to {output}")
+        return output
+
+    def _stitch_gif(self, directory: str, frame_count: int, output: str) -> None:
+        frames = (Image.open(os.path.join(directory, FRAME_PATTERN.format(index))) for index in range(frame_count))
+        first = next(frames)
+        first.save(output, save_all=True, append_images=frames, duration=1000 / self.fps, loop=0)
+
+    def _stitch_mp4(self, directory: str, output: str) -> None:
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            raise RuntimeError("ffmpeg is required to export MP4 video")
+        command = [
+            ffmpeg,
+            "-y",
+            "-loglevel",
+            "error",
+            "-framerate",
+            str(self.fps),
+            "-i",
+            os.path.join(directory, "frame_%06d.png"),
+            "-vf",
+            "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+            "-c:v",
+            "libx264",
+            "-pix_fmt",
+            "yuv420p",
+            output,
+        ]
+        try:
+            subprocess.run(command, check=True, capture_output=True, text=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to encode MP4 video: {e.stderr.strip()}")
+
+
+def parse_args(argv: list[str] | None = None, prog: str | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog=prog, description="Render a replay CSV to MP4, GIF or a PNG frame sequence")
+    parser.add_argument("map_name", help="Map name, e.g. ascent")
+    parser.add_argument("csv_file_path", help="Replay CSV file")
+    parser.add_argument("output", help="Output .mp4/.gif file or PNG frame directory")
+    parser.add_argument("--format", choices=ReplayExporter.FORMATS, help="Defaults to the output extension")
+    parser.add_argument("--fps", type=int, default=ReplayExporter.DEFAULT_FPS)
+    parser.add_argument("--stride", type=int, default=1, help="Render every n-th frame")
+    parser.add_argument("--workers", type=int, default=None, help="Render processes, defaults to the CPU count")
+    return parser.parse_args(argv)
+
+
+def main(args: argparse.Namespace) -> None:
+    view_map = ViewMap(args.map_name, os.path.abspath(args.csv_file_path))
+    exporter = ReplayExporter(view_map, fps=args.fps, stride=args.stride, workers=args.workers)
+    exporter.export(args.output, args.format)
+
+
+if __name__ == "__main__":
+    main(parse_args())
@@ -0,0 +1,31 @@
+import time
+from logging import getLogger
+
+logger = getLogger(__name__)
+
+
+class FrameRateMeter:
+    def __init__(self) -> None:
+        self.frames = 0
+        self.started_at: float | None = None
+        self.last_frame_at: float | None = None
+
+    def tick(self) -> None:
+        now = time.perf_counter()
+        if self.started_at is None:
+            self.started_at = now
+        self.last_frame_at = now
+        self.frames += 1
+
+    @property
+    def fps(self) -> float:
+        if self.started_at is None or self.last_frame_at is None or self.frames < 2:
+            return 0.0
+        elapsed = self.last_frame_at - self.started_at
+        return (self.frames - 1) / elapsed if elapsed > 0 else 0.0
+
+    def report(self, target_fps: float | None = None) -> None:
+        message = f"Rendered {self.frames} frames at {self.fps:.1f} FPS"
+        if target_fps:
+            message += f" (target {target_fps:.1f} FPS)"
+        logger.info(message)
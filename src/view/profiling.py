@@ -0,0 +1,161 @@
+import json
+import math
+import os
+import time
+from array import array
+from collections.abc import Callable
+from logging import getLogger
+from typing import Any
+
+import numpy as np
+
+logger = getLogger(__name__)
+
+STAGES = ("fetch", "transform", "artists", "draw")
+PERCENTILES = (50, 95, 99)
+
+
+class FrameProfiler:
+    def __init__(self, target_fps: float | None = None, window: int = 240, trace_path: str | None = None):
+        # Each frame is split into laps: the caller marks the end of every stage, so timing costs one perf_counter
+        # call per stage. A frame stays open until the draw finishes or the next frame begins
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.target_fps = target_fps
+        self.window = window
+        self.trace_path = trace_path
+        self.samples = {stage: array("d") for stage in (*STAGES, "frame")}
+        self.intervals = array("d")
+        self.frames = 0
+        self.dropped = 0
+        self.trace_events: list[dict[str, Any]] = []
+        self._frame: int | None = None
+        self._frame_started_at = 0.0
+        self._previous_started_at: float | None = None
+        self._last = 0.0
+        self._current: dict[str, float] = {}
+        self._pending: dict[str, float] = {}
+        self._clock_origin = time.perf_counter()
+
+    @property
+    def frame_budget(self) -> float | None:
+        return 1.0 / self.target_fps if self.target_fps else None
+
+    def begin_frame(self, frame: int) -> None:
+        now = time.perf_counter()
+        if self._frame is not None:
+            self.end_frame(now)
+        if self._previous_started_at is not None:
+            interval = now - self._previous_started_at
+            self.intervals.append(interval)
+            budget = self.frame_budget
+            if budget:
+                # A frame that took twice the budget means one refresh went by without a new frame
+                self.dropped += max(0, math.floor(interval / budget - 0.5))
+        self._previous_started_at = now
+        self._frame = frame
+        self._frame_started_at = self._last = now
+        self._current, self._pending = self._pending, {}
+
+    def lap(self, stage: str) -> None:
+        # Charges the time since the previous lap to `stage`
+        now = time.perf_counter()
+        if self._frame is None:
+            return
+        self._current[stage] = self._current.get(stage, 0.0) + now - self._last
+        self._last = now
+
+    def add(self, stage: str, seconds: float) -> None:
+        # Work done outside a frame, such as converting the next streamed chunk, is charged to the next frame
+        target = self._current if self._frame is not None else self._pending
+        target[stage] = target.get(stage, 0.0) + seconds
+
+    def end_frame(self, now: float | None = None) -> None:
+        if self._frame is None:
+            return
+        now = time.perf_counter() if now is None else now
+        for stage in STAGES:
+            self.samples[stage].append(self._current.get(stage, 0.0))
+        self.samples["frame"].append(sum(self._current.values()))
+        if self.trace_path is not None:
+            self._record_trace(self._frame, now)
+        self.frames += 1
+        self._frame = None
+        if self.frames % self.window == 0:
+            self.report_rolling()
+
+    def _record_trace(self, frame: int, now: float) -> None:
+        start = (self._frame_started_at - self._clock_origin) * 1e6
+        self.trace_events.append(
+            {
+                "name": "frame",
+                "ph": "X",
+                "ts": start,
+                "dur": (now - self._frame_started_at) * 1e6,
+                "pid": os.getpid(),
+                "tid": 0,
+                "args": {"frame": frame},
+            }
+        )
+        offset = start
+        for stage in STAGES:
+            duration = self._current.get(stage, 0.0) * 1e6
+            if duration:
+                self.trace_events.append(
+                    {"name": stage, "ph": "X", "ts": offset, "dur": duration, "pid": os.getpid(), "tid": 0}
+                )
+                offset += duration
+
+    def instrument_draw(self, draw: Callable[..., Any]) -> Callable[..., Any]:
+        # Wraps the canvas blit, the last step of an animation frame, so drawing is charged to the open frame
+        def timed_draw(*args: Any, **kwargs: Any) -> Any:
+            result = draw(*args, **kwargs)
+            self.lap("draw")
+            self.end_frame()
+            return result
+
+        return timed_draw
+
+    def percentiles(self, stage: str, rolling: bool = False) -> dict[str, float]:
+        samples = self.samples[stage]
+        if rolling:
+            start = max(0, len(samples) - self.window)
+            samples = samples[start:]
+        if not samples:
+            return {f"p{percentile}": 0.0 for percentile in PERCENTILES}
+        values = np.percentile(np.frombuffer(samples, dtype=np.float64), PERCENTILES)
+        return {f"p{percentile}": float(value) for percentile, value in zip(PERCENTILES, values)}
+
+    def summary(self, rolling: bool = False) -> dict[str, Any]:
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "target_fps": self.target_fps,
+            "stages": {stage: self.percentiles(stage, rolling) for stage in self.samples},
+        }
+
+    def _format(self, summary: dict[str, Any]) -> str:
+        stages = ", ".join(
+            f"{stage} " + "/".join(f"{value * 1e3:.2f}" for value in values.values())
+            for stage, values in summary["stages"].items()
+        )
+        return f"{stages} ms (p50/p95/p99)"
+
+    def report_rolling(self) -> None:
+        logger.info(f"Last {min(self.window, self.frames)} frames: {self._format(self.summary(rolling=True))}")
+
+    def report(self) -> None:
+        self.end_frame()
+        summary = self.summary()
+        logger.info(f"Profiled {self.frames} frames, {self.dropped} dropped: {self._format(summary)}")
+        if self.trace_path is not None:
+            self.write_trace(self.trace_path)
+
+    def write_trace(self, path: str) -> None:
+        # Chrome trace event format, loadable in chrome://tracing or Perfetto
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as file:
+            json.dump({"traceEvents": self.trace_events, "displayTimeUnit": "ms"}, file)
+        logger.info(f"Saved {len(self.trace_events)} trace events to {path}")
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from benchmarks.__main__ import main, parse_args
+from benchmarks.runner import (
+    BenchmarkResult,
+    compare,
+    load_results,
+    measure,
+    write_results,
+)
+
+
+def test_measure():
+    calls = []
+    result = measure("noop", lambda: calls.append(1), repeat=3, number=4, items=2, params={"size": 1})
+
+    assert len(calls) == 12
+    assert len(result.timings) == 3
+    assert result.key == "noop[size=1]"
+    assert result.to_dict()["items_per_second"] > 0
+
+
+def test_results_round_trip_and_compare(tmp_path):
+    path = str(tmp_path / "results.json")
+    write_results([BenchmarkResult("fast", [1.0]), BenchmarkResult("slow", [1.0])], path)
+    baseline = load_results(path)
+
+    regressions = compare([BenchmarkResult("fast", [0.9]), BenchmarkResult("slow", [2.0])], baseline, 1.2)
+
+    assert regressions == [("slow", 2.0)]
+
+
+def test_load_results_rejects_other_versions(tmp_path):
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps({"version": 99, "results": {}}))
+
+    with pytest.raises(ValueError, match="Unsupported benchmark results version: 99"):
+        load_results(str(path))
+
+
+def test_suite_runs_offline(tmp_path):
+    output = tmp_path / "results.json"
+    args = parse_args(["--repeat", "1", "--frames", "100", "--requests", "5", "--output", str(output)])
+
+    assert main(args) == 0
+    results = load_results(str(output))
+    assert "view.update[frames=100]" in results
+    assert "client.get_map_by_uuid" in results
+    assert "models.world_point_to_image" in results
+    assert results["models.catalog_get_map"]["best"] < results["models.game_map_from_json"]["best"]
+    assert "asset_downloader.save_assets[workers=1]" in results
+
+
+def test_unknown_suite():
+    with pytest.raises(SystemExit):
+        parse_args(["rendering"])
@@ -2,7 +2,18 @@ from uuid import uuid4
 
 import pytest
 
+from src.models.game_map.game_map import MapUUID
+
 
 @pytest.fixture()
 def uuid():
     return uuid4()
+
+
+@pytest.fixture()
+def map_entries():
+    return [
+        {"uuid": MapUUID.ASCENT.value, "displayName": "Ascent", "displayIcon": "ascent.png"},
+        {"uuid": MapUUID.BIND.value, "displayName": "Bind", "displayIcon": "bind.png"},
+        {"uuid": "ee613ee9-28b7-4beb-9666-08db13bb2244", "displayName": "The Range", "displayIcon": None},
+    ]
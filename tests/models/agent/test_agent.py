@@ -5,7 +5,7 @@ from uuid import UUID
 import pytest
 
 from src.models.agent.ability import AbilitySlot
-from src.models.agent.agent import Agent, AgentUUID
+from src.models.agent.agent import Agent, AgentUUID, FrozenAgent
 from src.models.agent.role import RoleUUID
 from tests.models.agent.test_ability import ALL_ABILITIES
 from tests.models.agent.test_role import ALL_ROLES
@@ -108,3 +108,21 @@ def test_agent_json_serialization(agent_data):
         assert agent == loaded_agent
     finally:
         os.remove(temp_file_path)
+
+
+@pytest.mark.parametrize("codec", [None, "json"])
+def test_agent_bytes_round_trip(agent_data, codec):
+    agent = Agent.from_dict(agent_data)
+    assert Agent.from_bytes(agent.to_bytes(codec), codec) == agent
+
+
+def test_agent_freeze(agent_data):
+    agent = Agent.from_dict(agent_data)
+    frozen = agent.freeze()
+
+    assert isinstance(frozen, FrozenAgent)
+    assert isinstance(frozen.abilities, tuple)
+    assert frozen.to_dict() == agent.to_dict()
+    assert len({frozen, Agent.from_dict(agent_data).freeze()}) == 1
+    with pytest.raises(AttributeError):
+        frozen.name = "Changed"  # type: ignore[misc]
@@ -0,0 +1,95 @@
+import os
+
+import numpy as np
+import pytest
+
+from src.models.game_map.callout import Callout
+from src.models.game_map.callout_index import CalloutIndex
+from src.models.game_map.game_map import GameMap
+
+DATA_DIRECTORY = os.path.join(os.path.dirname(__file__), "..", "..", "..", "src", "data", "maps")
+
+
+@pytest.fixture()
+def ascent():
+    return GameMap.from_json(os.path.join(DATA_DIRECTORY, "ascent.json"))
+
+
+@pytest.fixture()
+def samples():
+    rng = np.random.default_rng(0)
+    return np.column_stack([rng.uniform(-4000, 9000, 500), rng.uniform(-10000, 2000, 500)])
+
+
+def brute_force_order(index, x, y):
+    distances = ((index.points - (x, y)) ** 2).sum(axis=1)
+    return list(np.argsort(distances, kind="stable"))
+
+
+def test_empty_index():
+    index = CalloutIndex([])
+    assert index.nearest(0.0, 0.0) is None
+    np.testing.assert_array_equal(index.label(np.zeros((3, 2))), [-1, -1, -1])
+
+
+def test_invalid_k(ascent):
+    with pytest.raises(ValueError, match="k must be at least 1"):
+        ascent.callout_index.k_nearest(0.0, 0.0, 0)
+
+
+def test_nearest_matches_brute_force(ascent, samples):
+    index = ascent.callout_index
+    for x, y in samples:
+        assert index.k_nearest_indices(x, y)[0] == brute_force_order(index, x, y)[0]
+
+
+@pytest.mark.parametrize("k", [2, 5, 100])
+def test_k_nearest_matches_brute_force(ascent, samples, k):
+    index = ascent.callout_index
+    for x, y in samples[:50]:
+        assert index.k_nearest_indices(x, y, k) == brute_force_order(index, x, y)[:k]
+
+
+def test_nearest_returns_callout(ascent):
+    tree = ascent.callouts[0]
+    assert ascent.nearest_callout(tree.location.x + 1.0, tree.location.y - 1.0) is tree
+    assert ascent.nearest_callouts(tree.location.x, tree.location.y, 3)[0] is tree
+
+
+def test_label_matches_nearest(ascent, samples):
+    samples = samples.copy()
+    samples[7] = [np.nan, 0.0]
+
+    labels = ascent.label_positions(samples)
+
+    assert labels.dtype == np.int32
+    assert labels[7] == -1
+    for label, (x, y) in zip(labels, samples):
+        if not np.isnan(x):
+            assert label == ascent.callout_index.k_nearest_indices(x, y)[0]
+
+
+def test_label_in_batches(ascent, samples, monkeypatch):
+    expected = ascent.label_positions(samples)
+    monkeypatch.setattr(CalloutIndex, "BATCH_SIZE", 7)
+    np.testing.assert_array_equal(ascent.label_positions(samples), expected)
+
+
+def test_region_names():
+    index = CalloutIndex(
+        [
+            Callout.from_dict({"regionName": "Main", "location": {"x": 0.0, "y": 0.0}}),
+            Callout.from_dict({"regionName": "Site", "location": {"x": 100.0, "y": 0.0}}),
+        ]
+    )
+    names = index.region_names(np.array([[10.0, 5.0], [90.0, -5.0], [np.nan, np.nan]]))
+    assert list(names) == ["Main", "Site", None]
+
+
+def test_callout_index_is_cached_and_rebuilt(ascent):
+    index = ascent.callout_index
+    assert ascent.callout_index is index
+
+    ascent.callouts = ascent.callouts[:3]
+    assert ascent.callout_index is not index
+    assert len(ascent.callout_index) == 3
@@ -0,0 +1,118 @@
+import json
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from src.models.game_map.callout_raster import (
+    CalloutRaster,
+    load_callout_raster,
+    raster_cache_path,
+)
+from src.models.game_map.game_map import GameMap
+
+DATA_DIRECTORY = os.path.join(os.path.dirname(__file__), "..", "..", "..", "src", "data", "maps")
+
+
+@pytest.fixture()
+def ascent_json(tmp_path):
+    path = tmp_path / "ascent.json"
+    shutil.copy(os.path.join(DATA_DIRECTORY, "ascent.json"), path)
+    return str(path)
+
+
+@pytest.fixture()
+def ascent(ascent_json):
+    return GameMap.from_json(ascent_json)
+
+
+@pytest.fixture()
+def raster(ascent):
+    return CalloutRaster.build(ascent, cell_size=25.0)
+
+
+@pytest.fixture()
+def samples():
+    rng = np.random.default_rng(1)
+    return np.column_stack([rng.uniform(-4000, 9000, 2000), rng.uniform(-10000, 2000, 2000)])
+
+
+def test_build_requires_positive_cell_size(ascent):
+    with pytest.raises(ValueError, match="cell_size must be positive"):
+        CalloutRaster.build(ascent, cell_size=0)
+
+
+def test_build_requires_callouts(ascent):
+    ascent.callouts = []
+    with pytest.raises(ValueError, match="Ascent has no callouts to rasterize"):
+        CalloutRaster.build(ascent)
+
+
+def test_raster_covers_minimap(raster, ascent):
+    assert raster.labels.dtype == np.uint8
+    corners = np.array([[(v - ascent.y_scalar_to_add) / ascent.y_multiplier, 0.0] for v in (0.01, 0.99)])
+    corners[:, 1] = [(u - ascent.x_scalar_to_add) / ascent.x_multiplier for u in (0.01, 0.99)]
+    cells = np.floor((corners - raster.origin) / raster.cell_size)
+    assert (cells >= 0).all()
+    assert (cells[:, 0] < raster.labels.shape[1]).all() and (cells[:, 1] < raster.labels.shape[0]).all()
+
+
+def test_lookup_agrees_with_nearest_callout(raster, ascent, samples):
+    exact = ascent.label_positions(samples)
+    approximate = raster.lookup(samples)
+    # Only samples within a cell of a Voronoi boundary may differ
+    assert (approximate == exact).mean() > 0.98
+
+
+def test_lookup_at_callout_locations(raster, ascent):
+    points = np.array([(callout.location.x, callout.location.y) for callout in ascent.callouts])
+    names = raster.region_names_for(points)
+    assert list(names) == [callout.region_name for callout in ascent.callouts]
+    assert list(raster.super_region_names_for(points)) == [callout.super_region_name for callout in ascent.callouts]
+
+
+def test_lookup_missing_and_out_of_bounds(raster):
+    points = np.array([[np.nan, 0.0], [1e9, 1e9]])
+    region_ids = raster.lookup(points)
+
+    assert region_ids[0] == raster.missing_id
+    assert region_ids[1] < raster.missing_id
+    assert raster.region_names_for(points)[0] is None
+    assert raster.super_region_names_for(points)[0] is None
+
+
+def test_save_and_load(raster, tmp_path, samples):
+    path = str(tmp_path / "raster.npz")
+    raster.save(path)
+    loaded = CalloutRaster.load(path)
+
+    np.testing.assert_array_equal(loaded.labels, raster.labels)
+    assert loaded.region_names == raster.region_names
+    assert loaded.super_region_names == raster.super_region_names
+    np.testing.assert_array_equal(loaded.lookup(samples), raster.lookup(samples))
+
+
+def test_load_callout_raster_caches_next_to_json(ascent_json):
+    raster = load_callout_raster(ascent_json, cell_size=100.0)
+    cache_path = raster_cache_path(ascent_json, 100.0)
+
+    assert cache_path.endswith("ascent.labels.100.npz")
+    assert os.path.isfile(cache_path)
+    modified_at = os.path.getmtime(cache_path)
+    assert load_callout_raster(ascent_json, cell_size=100.0).source_hash == raster.source_hash
+    assert os.path.getmtime(cache_path) == modified_at
+
+
+def test_load_callout_raster_invalidates_on_json_change(ascent_json):
+    raster = load_callout_raster(ascent_json, cell_size=100.0)
+
+    with open(ascent_json) as file:
+        data = json.load(file)
+    data["callouts"] = data["callouts"][:2]
+    with open(ascent_json, "w") as file:
+        json.dump(data, file)
+
+    rebuilt = load_callout_raster(ascent_json, cell_size=100.0)
+    assert rebuilt.source_hash != raster.source_hash
+    assert len(rebuilt.region_names) == 2
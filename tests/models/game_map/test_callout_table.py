@@ -0,0 +1,89 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from src.models.agent.ability import Ability, AbilitySlot, FrozenAbility
+from src.models.agent.role import FrozenRole, Role, RoleUUID
+from src.models.game_map.callout import Callout
+from src.models.game_map.callout_table import CalloutTable
+from src.models.game_map.game_map import GameMap
+from src.models.game_map.location import FrozenLocation, Location
+
+CALLOUTS = [
+    Callout("Tree", "A", Location(10.0, -20.0)),
+    Callout("Main", "A", Location(-5.0, 5.0)),
+    Callout("Tree", None, Location(1.0, 2.0)),
+]
+
+
+@pytest.fixture()
+def table():
+    return CalloutTable(CALLOUTS)
+
+
+def test_columns_intern_names(table):
+    np.testing.assert_array_equal(table.points, [[10.0, -20.0], [-5.0, 5.0], [1.0, 2.0]])
+    assert table.region_names == ("Tree", "Main")
+    assert table.super_region_names == ("A", None)
+    assert list(table.region_ids) == [0, 1, 0]
+
+
+def test_sequence_views(table):
+    assert len(table) == 3
+    assert table[0] == CALLOUTS[0]
+    assert table[-1] == CALLOUTS[2]
+    assert list(table) == CALLOUTS
+    with pytest.raises(IndexError):
+        table[3]
+
+
+def test_slice_returns_table(table):
+    sliced = table[1:]
+
+    assert isinstance(sliced, CalloutTable)
+    assert list(sliced) == CALLOUTS[1:]
+
+
+def test_equality(table):
+    assert table == CALLOUTS
+    assert table == CalloutTable(CALLOUTS)
+    assert table != CALLOUTS[:2]
+
+
+def test_game_map_keeps_a_callout_list():
+    game_map = GameMap.from_dict(
+        {"uuid": "7eaecc1b-4337-bbf6-6ab9-04b8f06b3319", "displayName": "Ascent", "displayIcon": "icon.png"}
+    )
+    game_map.callouts = list(CALLOUTS)
+    game_map.callouts.append(Callout("Garden", "A", Location(3.0, 3.0)))
+
+    table = game_map.callout_table()
+    assert isinstance(game_map.callouts, list)
+    assert table == game_map.callouts
+    assert game_map.callout_table() is table
+    game_map.callouts.pop()
+    assert len(game_map.callout_table()) == 3
+    assert game_map.nearest_callout(9.0, -19.0) is game_map.callouts[0]
+    assert pickle.loads(pickle.dumps(game_map)) == game_map
+
+
+def test_models_are_slotted_and_mutable():
+    callout = Callout("Tree", "A", Location(10.0, -20.0))
+    callout.region_name = "Garden"
+    callout.location.x = 0.0
+
+    assert not hasattr(callout, "__dict__")
+    assert callout == Callout("Garden", "A", Location(0.0, -20.0))
+
+
+def test_frozen_variants_are_hashable():
+    frozen = CALLOUTS[0].freeze()
+
+    assert isinstance(frozen.location, FrozenLocation)
+    assert frozen.to_dict() == CALLOUTS[0].to_dict()
+    assert len({frozen, Callout("Tree", "A", Location(10.0, -20.0)).freeze()}) == 1
+    assert len({Ability(AbilitySlot.Q_SLOT, "Updraft").freeze(), FrozenAbility(AbilitySlot.Q_SLOT, "Updraft")}) == 1
+    assert hash(Role(RoleUUID.DUELIST, "Duelist").freeze()) == hash(FrozenRole(RoleUUID.DUELIST, "Duelist"))
+    with pytest.raises(AttributeError):
+        frozen.region_name = "Garden"  # type: ignore[misc]
@@ -2,9 +2,10 @@ import os
 import tempfile
 from uuid import UUID
 
+import numpy as np
 import pytest
 
-from src.models.game_map.game_map import GameMap, MapUUID
+from src.models.game_map.game_map import FrozenGameMap, GameMap, MapUUID
 
 
 @pytest.fixture()
@@ -160,3 +161,73 @@ def test_game_map_json_serialization(map_metadata):
         assert game_map == loaded_game_map
     finally:
         os.remove(temp_file_path)
+
+
+@pytest.mark.parametrize("codec", [None, "json"])
+def test_game_map_bytes_round_trip(map_metadata, codec):
+    game_map = GameMap.from_dict(map_metadata)
+    assert GameMap.from_bytes(game_map.to_bytes(codec), codec) == game_map
+
+
+def test_game_map_affine(map_metadata):
+    game_map = GameMap.from_dict(map_metadata)
+
+    np.testing.assert_array_equal(game_map.affine, [[0.0, 2.0, 1.0], [-2.0, 0.0, -1.0]])
+    assert game_map.affine is game_map.affine
+
+
+def test_game_map_affine_follows_multiplier_changes(map_metadata):
+    game_map = GameMap.from_dict(map_metadata)
+    affine = game_map.affine
+    game_map.x_multiplier = 3.0
+
+    assert game_map.affine is not affine
+    assert game_map.affine[0, 1] == 3.0
+
+
+def test_game_map_world_to_image(map_metadata):
+    game_map = GameMap.from_dict(map_metadata)
+    points = np.array([[[10.0, -20.0], [np.nan, 5.0]]])
+
+    image = game_map.world_to_image(points, image_size=(100, 50))
+
+    assert image.shape == points.shape
+    np.testing.assert_allclose(image[0, 0], [(-20.0 * 2.0 + 1.0) * 100, (10.0 * -2.0 - 1.0) * 50])
+    assert image[0, 1, 0] == (5.0 * 2.0 + 1.0) * 100
+    assert np.isnan(image[0, 1, 1])
+
+
+def test_game_map_world_point_to_image_matches_affine(map_metadata):
+    game_map = GameMap.from_dict(map_metadata)
+
+    assert game_map.world_point_to_image(10.0, -20.0) == tuple(game_map.world_to_image(np.array([10.0, -20.0])))
+
+
+@pytest.mark.parametrize("image_size", [None, (1024, 512)])
+def test_game_map_image_to_world_round_trip(map_metadata, image_size):
+    game_map = GameMap.from_dict(map_metadata)
+    points = np.array([[10.0, -20.0], [-5.0, 5.0], [0.0, 0.0]])
+
+    image = game_map.world_to_image(points, image_size)
+
+    np.testing.assert_allclose(game_map.image_to_world(image, image_size), points)
+
+
+def test_game_map_image_to_world_degenerate(map_metadata):
+    game_map = GameMap.from_dict(map_metadata)
+    game_map.y_multiplier = 0.0
+
+    with pytest.raises(ValueError, match="Test Map has a degenerate coordinate transform"):
+        game_map.image_to_world(np.zeros(2))
+
+
+def test_game_map_freeze(map_metadata):
+    game_map = GameMap.from_dict(map_metadata)
+    frozen = game_map.freeze()
+
+    assert isinstance(frozen, FrozenGameMap)
+    assert isinstance(frozen.callouts, tuple)
+    assert frozen.to_dict() == game_map.to_dict()
+    assert len({frozen, GameMap.from_dict(map_metadata).freeze()}) == 1
+    with pytest.raises(AttributeError):
+        frozen.callouts = ()  # type: ignore[misc]
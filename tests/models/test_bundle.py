@@ -0,0 +1,76 @@
+import json
+import os
+
+import pytest
+
+from src.models.bundle import BundleError, DataBundle, file_sha256
+from src.models.catalog import DATA_DIRECTORY
+
+
+@pytest.fixture()
+def bundle():
+    return DataBundle.from_directory(DATA_DIRECTORY)
+
+
+def test_round_trip(tmp_path, bundle):
+    path = str(tmp_path / "data.bundle")
+    bundle.write(path)
+
+    assert DataBundle.read(path) == bundle
+
+
+def test_header(bundle):
+    header, payload, trailer = bundle.to_bytes().split(b"\n")
+
+    assert header.startswith(b'{"format":"valostats-bundle","version":3,')
+    assert json.loads(header)["sources"]["maps/ascent.json"] == file_sha256(
+        os.path.join(DATA_DIRECTORY, "maps", "ascent.json")
+    )
+    assert trailer == b""
+
+
+def test_rejects_tampered_payload(bundle):
+    data = bundle.to_bytes().replace(b"Ascent", b"Ascend")
+
+    with pytest.raises(BundleError, match="does not match its hash"):
+        DataBundle.from_bytes(data)
+
+
+def test_rejects_unknown_version(bundle):
+    data = bundle.to_bytes().replace(b'"version":3', b'"version":2', 1)
+
+    with pytest.raises(BundleError, match="Unsupported bundle version: 2"):
+        DataBundle.from_bytes(data)
+
+
+def test_rejects_other_files():
+    with pytest.raises(BundleError, match="not valid JSON"):
+        DataBundle.from_bytes(b"garbage")
+
+
+def test_json_codec_payload(bundle):
+    data = bundle.to_bytes("json")
+
+    assert b'"codec":"json"' in data
+    assert DataBundle.from_bytes(data) == bundle
+
+
+def test_wraps_payload_errors(bundle):
+    data = bundle.to_bytes("json").replace(b'"codec":"json"', b'"codec":"unknown"', 1)
+
+    with pytest.raises(BundleError, match="Unknown codec: unknown"):
+        DataBundle.from_bytes(data)
+
+
+def test_requires_payload_size(bundle):
+    data = bundle.to_bytes().replace(b'"size":', b'"length":', 1)
+
+    with pytest.raises(BundleError, match="no payload size"):
+        DataBundle.from_bytes(data)
+
+
+def test_requires_source_hashes(bundle):
+    data = bundle.to_bytes().replace(b'"sources":', b'"files":', 1)
+
+    with pytest.raises(BundleError, match="no source hashes"):
+        DataBundle.from_bytes(data)
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import os
+import shutil
+
+import pytest
+
+from src.models.agent.ability import AbilitySlot
+from src.models.agent.agent import AgentUUID
+from src.models.agent.role import RoleUUID
+from src.models.bundle import (
+    BUNDLE_FILE_NAME,
+    BUNDLE_FORMAT,
+    BUNDLE_VERSION,
+    DataBundle,
+)
+from src.models.catalog import DATA_DIRECTORY, Catalog, resolve
+from src.models.game_map.game_map import MapUUID
+
+
+@pytest.fixture()
+def catalog(tmp_path):
+    shutil.copytree(DATA_DIRECTORY, tmp_path / "data")
+    return Catalog(str(tmp_path / "data"), max_size=4, use_bundle=False)
+
+
+@pytest.fixture()
+def bundled_catalog(tmp_path):
+    bundle = DataBundle.from_directory(DATA_DIRECTORY)
+    bundle.write(str(tmp_path / BUNDLE_FILE_NAME))
+    return Catalog(str(tmp_path))
+
+
+@pytest.mark.parametrize("key", [MapUUID.ASCENT, "ascent", "Ascent", "7eaecc1b-4337-bbf6-6ab9-04b8f06b3319"])
+def test_resolve_map(key):
+    assert resolve(key, MapUUID) == MapUUID.ASCENT
+
+
+def test_resolve_display_name():
+    assert resolve("KAY/O", AgentUUID) == AgentUUID.KAYO
+
+
+def test_resolve_unknown():
+    with pytest.raises(ValueError, match="Unknown MapUUID: atlantis"):
+        resolve("atlantis", MapUUID)
+
+
+def test_get_map_is_memoized(catalog):
+    game_map = catalog.get_map("ascent")
+
+    assert game_map.uuid == MapUUID.ASCENT
+    assert catalog.get_map(MapUUID.ASCENT) == game_map
+    assert (catalog.hits, catalog.misses) == (1, 1)
+
+
+def test_lookups_return_copies(catalog):
+    game_map = catalog.get_map("ascent")
+    agent = catalog.get_agent("jett")
+    game_map.name = "Changed"
+    agent.abilities.clear()
+
+    assert catalog.get_map("ascent").name == "Ascent"
+    assert catalog.get_agent("jett").abilities
+    assert catalog.abilities_by_slot(AbilitySlot.X_SLOT)
+
+
+def test_get_agent_reloads_modified_file(catalog):
+    agent = catalog.get_agent(AgentUUID.JETT)
+    path = catalog.agent_path(AgentUUID.JETT)
+    with open(path) as file:
+        data = json.load(file)
+    data["displayName"] = "Jett v2"
+    with open(path, "w") as file:
+        json.dump(data, file)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = catalog.get_agent("jett")
+
+    assert reloaded is not agent
+    assert reloaded.name == "Jett v2"
+
+
+def test_cache_is_bounded(catalog):
+    first = catalog.get_map(MapUUID.ABYSS)
+    for map_uuid in list(MapUUID)[1:5]:
+        catalog.get_map(map_uuid)
+
+    assert len(catalog._cache) == 4
+    assert catalog.get_map(MapUUID.ABYSS) == first
+    assert catalog.misses == 6
+
+
+def test_missing_entry(catalog):
+    os.remove(catalog.map_path(MapUUID.SUNSET))
+
+    assert MapUUID.SUNSET not in catalog.map_uuids()
+    with pytest.raises(FileNotFoundError, match="Catalog entry not found"):
+        catalog.get_map(MapUUID.SUNSET)
+
+
+def test_agents_by_role(catalog):
+    duelists = catalog.agents_by_role(RoleUUID.DUELIST)
+
+    assert AgentUUID.JETT in [agent.uuid for agent in duelists]
+    assert all(agent.role.uuid == RoleUUID.DUELIST for agent in duelists)
+    assert [agent.uuid for agent in catalog.agents_by_role("duelist")] == [agent.uuid for agent in duelists]
+
+
+def test_abilities_by_slot(catalog):
+    ultimates = catalog.abilities_by_slot(AbilitySlot.X_SLOT)
+
+    assert len(ultimates) == len(catalog.agent_uuids())
+    assert all(ability.slot == AbilitySlot.X_SLOT for _, ability in ultimates)
+    assert catalog.abilities_by_slot("Ultimate") == ultimates
+
+
+def test_bundle_is_read_once(bundled_catalog):
+    game_map = bundled_catalog.get_map("ascent")
+
+    assert bundled_catalog.get_map(MapUUID.ASCENT) == game_map
+    assert bundled_catalog.misses == 0
+    assert bundled_catalog.map_uuids() == list(MapUUID)
+    assert bundled_catalog.agents_by_role("sentinel")
+
+
+def test_unreadable_bundle_falls_back_to_files(catalog, caplog):
+    with open(os.path.join(catalog.data_directory, BUNDLE_FILE_NAME), "wb") as file:
+        file.write(b"garbage")
+    catalog.bundle_path = os.path.join(catalog.data_directory, BUNDLE_FILE_NAME)
+
+    assert catalog.get_agent(AgentUUID.SAGE).uuid == AgentUUID.SAGE
+    assert catalog.misses == 1
+    assert "Ignoring unreadable data bundle" in caplog.text
+
+
+def test_edited_file_wins_over_an_older_bundle(tmp_path):
+    shutil.copytree(DATA_DIRECTORY, tmp_path / "data")
+    DataBundle.from_directory(str(tmp_path / "data")).write(str(tmp_path / "data" / BUNDLE_FILE_NAME))
+    catalog = Catalog(str(tmp_path / "data"))
+    assert catalog.get_map("ascent").name == "Ascent"
+
+    path = catalog.map_path(MapUUID.ASCENT)
+    with open(path) as file:
+        data = json.load(file)
+    data["displayName"] = "Ascent v2"
+    with open(path, "w") as file:
+        json.dump(data, file)
+    bundle_mtime = os.stat(catalog.bundle_path).st_mtime_ns
+    os.utime(path, ns=(bundle_mtime, bundle_mtime + 1_000_000))
+
+    assert catalog.get_map("ascent").name == "Ascent v2"
+    assert Catalog(str(tmp_path / "data")).get_map("ascent").name == "Ascent v2"
+    assert catalog.get_map("bind").name == "Bind"
+    assert catalog.misses == 1
+
+
+def test_bundle_is_used_for_files_checked_out_after_it(tmp_path):
+    DataBundle.from_directory(DATA_DIRECTORY).write(str(tmp_path / BUNDLE_FILE_NAME))
+    # A fresh clone writes the JSON files after the bundle
+    shutil.copytree(os.path.join(DATA_DIRECTORY, "maps"), tmp_path / "maps")
+    shutil.copytree(os.path.join(DATA_DIRECTORY, "agents"), tmp_path / "agents")
+    bundle_mtime = os.stat(tmp_path / BUNDLE_FILE_NAME).st_mtime_ns
+    for path in [*(tmp_path / "maps").iterdir(), *(tmp_path / "agents").iterdir()]:
+        os.utime(path, ns=(bundle_mtime, bundle_mtime + 1_000_000))
+    catalog = Catalog(str(tmp_path))
+
+    assert catalog.get_map("ascent") == catalog.get_map("ascent")
+    assert catalog.agents_by_role("duelist")
+    assert catalog.misses == 0
+    assert len(catalog._verified) == len(catalog.agent_uuids()) + 1
+
+
+def test_bundle_with_unknown_entries_falls_back_to_files(catalog, caplog):
+    payload = json.dumps({"maps": [{"uuid": "not-a-map"}], "agents": []}).encode()
+    header = {
+        "format": BUNDLE_FORMAT,
+        "version": BUNDLE_VERSION,
+        "codec": "json",
+        "size": len(payload),
+        "sha256": hashlib.sha256(payload).hexdigest(),
+        "sources": {},
+    }
+    with open(os.path.join(catalog.data_directory, BUNDLE_FILE_NAME), "wb") as file:
+        file.write(json.dumps(header).encode() + b"\n" + payload + b"\n")
+    catalog.bundle_path = os.path.join(catalog.data_directory, BUNDLE_FILE_NAME)
+
+    assert catalog.get_map(MapUUID.ASCENT).uuid == MapUUID.ASCENT
+    assert "Ignoring unreadable data bundle" in caplog.text
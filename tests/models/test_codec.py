@@ -0,0 +1,41 @@
+import pytest
+
+from src.models import codec as codec_module
+from src.models.codec import JsonCodec, get_codec
+
+DATA = {"uuid": "7eaecc1b-4337-bbf6-6ab9-04b8f06b3319", "callouts": [{"x": 1.5, "name": None}], "count": 3}
+
+
+@pytest.mark.parametrize("name", ["json", "orjson"])
+def test_round_trip(name):
+    codec = get_codec(name)
+
+    assert codec.decode(codec.encode(DATA)) == DATA
+
+
+def test_json_codecs_are_compact_and_interchangeable():
+    encoded = get_codec("orjson").encode(DATA)
+
+    assert b" " not in encoded
+    assert get_codec("json").decode(encoded) == DATA
+
+
+def test_msgpack_round_trip():
+    pytest.importorskip("msgpack")
+    codec = get_codec("msgpack")
+
+    assert codec.decode(codec.encode(DATA)) == DATA
+
+
+def test_orjson_falls_back_to_json(monkeypatch):
+    monkeypatch.setattr(codec_module, "_codecs", {})
+    monkeypatch.setattr(codec_module, "_import_optional", lambda module_name: None)
+
+    assert isinstance(get_codec("orjson"), JsonCodec)
+    with pytest.raises(RuntimeError, match="requires the msgpack package"):
+        get_codec("msgpack")
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError, match="Unknown codec: yaml"):
+        get_codec("yaml")
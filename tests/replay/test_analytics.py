@@ -0,0 +1,173 @@
+import json
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models.catalog import get_map
+from src.models.game_map.game_map import MapUUID
+from src.replay.analytics import (
+    AnalyticsRunner,
+    AnalyticsTask,
+    MatchAccumulator,
+    MatchStats,
+    analyze_replay,
+    build_tasks,
+    find_replays,
+    load_checkpoint,
+    parse_args,
+    summarize,
+)
+from src.replay.columnar import write_replay as write_columnar_replay
+from src.replay.frames import ReplayFrames
+from src.replay.streaming import iter_replay_chunks
+
+
+def write_replay(path, offset=0.0):
+    # Player 1 walks 5 units per frame, player 2 stands still and is dead for the last frame of round 1
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(
+        {
+            "roundNumber": [1, 1, 1, 2, 2],
+            "phase": ["buy", "combat", "combat", "buy", "combat"],
+            "1_x": [offset, offset + 3.0, offset + 6.0, 1000.0, 1003.0],
+            "1_y": [0.0, 4.0, 8.0, 0.0, 4.0],
+            "2_x": [-2000.0, -2000.0, np.nan, 1e7, 1e7],
+            "2_y": [-4000.0, -4000.0, np.nan, 1e7, 1e7],
+        }
+    ).to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.fixture()
+def replays(tmp_path):
+    return [
+        write_replay(tmp_path / "replays" / "ascent" / "match1.csv"),
+        write_replay(tmp_path / "replays" / "ascent" / "match2.csv", offset=10.0),
+        write_replay(tmp_path / "replays" / "bind" / "match3.csv"),
+    ]
+
+
+def test_analyze_replay(replays):
+    stats = analyze_replay(AnalyticsTask(replays[0], MapUUID.ASCENT, player_count=2))
+
+    assert stats.map_uuid == MapUUID.ASCENT
+    assert stats.frames == 5
+    first, second = stats.rounds
+    assert (first.round_number, first.frames, second.frames) == (1, 3, 2)
+    assert first.phase_frames == {"buy": 1, "combat": 2}
+    # The jump to round 2's spawn does not count as movement
+    assert first.distance == pytest.approx([10.0, 0.0])
+    assert second.distance == pytest.approx([5.0, 0.0])
+    assert first.visible_frames == [3, 2]
+    assert second.on_map_frames == [2, 0]
+
+
+def test_accumulator_carries_movement_across_chunks(replays):
+    game_map = get_map(MapUUID.ASCENT)
+    whole = MatchAccumulator("whole", game_map, player_count=2)
+    chunked = MatchAccumulator("chunked", game_map, player_count=2)
+
+    whole.add(ReplayFrames.from_dataframe(pd.read_csv(replays[0]), player_count=2))
+    for frames in iter_replay_chunks(replays[0], chunk_frames=2, player_count=2):
+        chunked.add(frames)
+
+    assert [round_stats.to_dict() for round_stats in chunked.stats.rounds] == [
+        round_stats.to_dict() for round_stats in whole.stats.rounds
+    ]
+
+
+def test_match_stats_round_trip(replays):
+    stats = analyze_replay(AnalyticsTask(replays[0], MapUUID.ASCENT, player_count=2))
+
+    assert MatchStats.from_dict(json.loads(json.dumps(stats.to_dict()))) == stats
+
+
+def test_find_replays_and_infer_maps(tmp_path, replays):
+    columnar = str(tmp_path / "replays" / "ascent" / "match4.replay")
+    write_columnar_replay(ReplayFrames.from_dataframe(pd.read_csv(replays[0]), player_count=2), columnar)
+    (tmp_path / "replays" / "notes.txt").write_text("not a replay")
+
+    assert list(find_replays([str(tmp_path / "replays")])) == [columnar, *replays]
+
+    tasks = build_tasks([str(tmp_path / "replays")], player_count=2)
+    assert [task.map_uuid for task in tasks] == [MapUUID.ASCENT] * 3 + [MapUUID.BIND]
+    assert {task.map_uuid for task in build_tasks(replays, map_name="haven")} == {MapUUID.HAVEN}
+
+
+def test_build_tasks_skips_replays_without_a_map(tmp_path, caplog):
+    path = write_replay(tmp_path / "unsorted" / "match.csv")
+
+    assert build_tasks([path]) == []
+    assert "Skipping" in caplog.text
+
+
+def test_summarize_groups_per_map(replays):
+    matches = [
+        analyze_replay(AnalyticsTask(path, map_uuid, player_count=2))
+        for path, map_uuid in zip(replays, [MapUUID.ASCENT, MapUUID.ASCENT, MapUUID.BIND])
+    ]
+
+    summary = summarize(matches)
+
+    assert list(summary.index) == ["ASCENT", "BIND"]
+    assert summary.loc["ASCENT", "matches"] == 2
+    assert summary.loc["ASCENT", "rounds"] == 4
+    assert summary.loc["ASCENT", "frames_per_round"] == 2.5
+    # 15 units per match over 4 player-rounds with a position
+    assert summary.loc["ASCENT", "distance_per_player_round"] == pytest.approx(3.75)
+    assert summary.loc["ASCENT", "on_map_fraction"] == pytest.approx(7 / 9)
+    assert summary.loc["ASCENT", "phase_combat_fraction"] == pytest.approx(0.6)
+    assert summarize([]).empty
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_runner(replays, workers):
+    tasks = build_tasks(replays, player_count=2)
+
+    matches = AnalyticsRunner(workers=workers).run(tasks)
+
+    assert [stats.match_id for stats in matches] == sorted(task.match_id for task in tasks)
+    assert matches == [analyze_replay(task) for task in sorted(tasks, key=lambda task: task.match_id)]
+
+
+def test_runner_resumes_from_checkpoint(tmp_path, replays, caplog):
+    caplog.set_level(logging.INFO)
+    checkpoint = str(tmp_path / "checkpoints" / "run.jsonl")
+    tasks = build_tasks(replays, player_count=2)
+    AnalyticsRunner(workers=1, checkpoint_path=checkpoint).run(tasks[:2])
+    with open(checkpoint, "a") as file:
+        file.write('{"match_id": "trunc')
+
+    runner = AnalyticsRunner(workers=1, checkpoint_path=checkpoint)
+    matches = runner.run(tasks)
+
+    assert len(matches) == 3
+    assert "Resuming with 2 matches" in caplog.text
+    assert "Analyzing 1 replays" in caplog.text
+    assert "Ignoring unreadable line 3" in caplog.text
+    assert set(load_checkpoint(checkpoint)) == {task.match_id for task in tasks}
+
+
+def test_runner_records_failures(tmp_path, replays):
+    checkpoint = str(tmp_path / "run.jsonl")
+    tasks = [*build_tasks(replays[:1], player_count=2), AnalyticsTask(str(tmp_path / "missing.csv"), MapUUID.ASCENT)]
+
+    runner = AnalyticsRunner(workers=1, checkpoint_path=checkpoint)
+    matches = runner.run(tasks)
+
+    assert len(matches) == 1
+    assert list(runner.failed) == [tasks[1].match_id]
+    assert list(load_checkpoint(checkpoint)) == [tasks[0].match_id]
+
+
+def test_runner_validation():
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+        AnalyticsRunner(workers=0)
+
+
+def test_parse_args():
+    args = parse_args(["replays", "--map", "ascent", "--workers", "4", "--no-checkpoint"])
+
+    assert (args.replays, args.map_name, args.workers, args.no_checkpoint) == (["replays"], "ascent", 4, True)
@@ -0,0 +1,109 @@
+import json
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.replay.columnar import (
+    METADATA_FILE,
+    convert_csv,
+    is_columnar_replay,
+    read_replay,
+    write_replay,
+)
+from src.replay.frames import ReplayFrames, position_columns
+
+
+@pytest.fixture()
+def replay_frames():
+    positions = np.arange(4 * 10 * 2, dtype=np.float32).reshape(4, 10, 2)
+    positions[1, 3] = np.nan
+    return ReplayFrames(
+        positions=positions,
+        round_numbers=np.array([1, 1, 2, 2], dtype=np.int32),
+        phase_codes=np.array([0, 1, 0, 1], dtype=np.uint8),
+        phases=["buy", "combat"],
+    )
+
+
+@pytest.fixture()
+def replay_csv(tmp_path, replay_frames):
+    data = {"roundNumber": replay_frames.round_numbers, "phase": ["buy", "combat", "buy", "combat"]}
+    data.update(zip(position_columns(), replay_frames.positions.reshape(4, -1).T))
+    path = tmp_path / "match.csv"
+    pd.DataFrame(data).to_csv(path, index=False)
+    return str(path)
+
+
+def assert_frames_equal(actual, expected):
+    np.testing.assert_array_equal(actual.positions, expected.positions)
+    np.testing.assert_array_equal(actual.round_numbers, expected.round_numbers)
+    np.testing.assert_array_equal(actual.phase_codes, expected.phase_codes)
+    assert actual.phases == expected.phases
+
+
+def test_write_and_read_replay(tmp_path, replay_frames):
+    path = str(tmp_path / "match.replay")
+    write_replay(replay_frames, path, source="match.csv")
+
+    assert is_columnar_replay(path)
+    assert not os.path.exists(f"{path}.tmp")
+    loaded = read_replay(path)
+    assert isinstance(loaded.positions, np.memmap)
+    assert_frames_equal(loaded, replay_frames)
+
+
+def test_overwrite_keeps_a_replay_on_disk(tmp_path, replay_frames):
+    path = str(tmp_path / "match.replay")
+    write_replay(replay_frames, path)
+    replaced = []
+    real_replace = os.replace
+
+    def crash_after_first_rename(source, destination):
+        real_replace(source, destination)
+        replaced.append(destination)
+        raise OSError("crashed")
+
+    with patch("src.replay.columnar.os.replace", crash_after_first_rename), pytest.raises(OSError):
+        write_replay(replay_frames, path)
+
+    assert replaced == [f"{path}.old"]
+    assert_frames_equal(read_replay(path), replay_frames)
+
+    write_replay(replay_frames, path)
+    assert os.listdir(tmp_path) == ["match.replay"]
+
+
+def test_read_replay_without_mmap(tmp_path, replay_frames):
+    path = str(tmp_path / "match.replay")
+    write_replay(replay_frames, path)
+
+    loaded = read_replay(path, mmap=False)
+    assert not isinstance(loaded.positions, np.memmap)
+    assert_frames_equal(loaded, replay_frames)
+
+
+def test_read_missing_replay(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Columnar replay not found"):
+        read_replay(str(tmp_path / "missing.replay"))
+
+
+def test_read_replay_with_unsupported_version(tmp_path, replay_frames):
+    path = str(tmp_path / "match.replay")
+    write_replay(replay_frames, path)
+    with open(os.path.join(path, METADATA_FILE), "w") as file:
+        json.dump({"version": 99}, file)
+
+    with pytest.raises(ValueError, match="Unsupported replay format version: 99"):
+        read_replay(path)
+
+
+def test_convert_csv(replay_csv, replay_frames):
+    output = convert_csv(replay_csv)
+
+    assert output == replay_csv.replace(".csv", ".replay")
+    assert_frames_equal(read_replay(output), replay_frames)
+    with open(os.path.join(output, METADATA_FILE)) as file:
+        assert json.load(file)["source"] == "match.csv"
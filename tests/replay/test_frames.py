@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models.game_map.game_map import GameMap
+from src.replay.frames import (
+    UNKNOWN_ROUND,
+    ReplayFrames,
+    extract_positions,
+    position_columns,
+    world_to_image,
+)
+
+
+@pytest.fixture()
+def game_map():
+    return GameMap.from_dict(
+        {
+            "uuid": "7eaecc1b-4337-bbf6-6ab9-04b8f06b3319",
+            "displayName": "Ascent",
+            "displayIcon": "icon.png",
+            "xMultiplier": 7e-05,
+            "yMultiplier": -7e-05,
+            "xScalarToAdd": 0.813895,
+            "yScalarToAdd": 0.573242,
+        }
+    )
+
+
+@pytest.fixture()
+def replay():
+    return pd.DataFrame(
+        {
+            "roundNumber": [1, 1, 2],
+            "phase": ["buy", "combat", "buy"],
+            "1_x": [100.0, np.nan, -2500.5],
+            "1_y": [-200.0, 50.0, 4000.0],
+            "2_x": [3000.0, 3100.0, np.nan],
+            "2_y": [-6000.0, -6100.0, np.nan],
+        }
+    )
+
+
+def test_position_columns():
+    assert position_columns(2) == ["1_x", "1_y", "2_x", "2_y"]
+    assert len(position_columns()) == 20
+
+
+def test_extract_positions(replay):
+    positions = extract_positions(replay, player_count=2)
+
+    assert positions.shape == (3, 2, 2)
+    assert positions.dtype == np.float32
+    np.testing.assert_array_equal(positions[0], [[100.0, -200.0], [3000.0, -6000.0]])
+    assert np.isnan(positions[1, 0, 0])
+
+
+def test_world_to_image_matches_scalar_transform(replay, game_map):
+    positions = extract_positions(replay, player_count=2)
+    image = world_to_image(positions, game_map, width=1024, height=512)
+
+    assert image.shape == positions.shape
+    assert image.dtype == np.float32
+    for frame in range(len(replay)):
+        for player in range(2):
+            x, y = replay.iloc[frame][f"{player + 1}_x"], replay.iloc[frame][f"{player + 1}_y"]
+            expected_x = (y * game_map.x_multiplier + game_map.x_scalar_to_add) * 1024
+            expected_y = (x * game_map.y_multiplier + game_map.y_scalar_to_add) * 512
+            np.testing.assert_allclose(image[frame, player], [expected_x, expected_y], rtol=1e-5)
+
+
+def test_world_to_image_propagates_nan(replay, game_map):
+    image = world_to_image(extract_positions(replay, player_count=2), game_map)
+
+    assert np.isnan(image[1, 0, 1])
+    assert not np.isnan(image[1, 0, 0])
+    assert np.isnan(image[2, 1]).all()
+
+
+def test_replay_frames_from_dataframe(replay):
+    frames = ReplayFrames.from_dataframe(replay, player_count=2)
+
+    assert len(frames) == 3
+    assert frames.player_count == 2
+    assert frames.positions.shape == (3, 2, 2)
+    np.testing.assert_array_equal(frames.round_numbers, [1, 1, 2])
+    assert frames.phases == ["buy", "combat"]
+    np.testing.assert_array_equal(frames.phase_codes, [0, 1, 0])
+    assert [frames.phase(frame) for frame in range(3)] == ["buy", "combat", "buy"]
+
+
+def test_replay_frames_fills_missing_round_numbers(replay):
+    replay["roundNumber"] = [np.nan, 1, np.nan]
+
+    frames = ReplayFrames.from_dataframe(replay, player_count=2)
+
+    np.testing.assert_array_equal(frames.round_numbers, [UNKNOWN_ROUND, 1, UNKNOWN_ROUND])
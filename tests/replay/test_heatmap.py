@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+import pytest
+from PIL import Image
+
+from src.models.game_map.game_map import GameMap, MapUUID
+from src.replay.frames import ReplayFrames
+from src.replay.heatmap import HeatmapFilter, HeatmapStore, PositionHeatmap
+
+
+@pytest.fixture()
+def game_map():
+    return GameMap.from_dict(
+        {
+            "uuid": "7eaecc1b-4337-bbf6-6ab9-04b8f06b3319",
+            "displayName": "Ascent",
+            "displayIcon": "icon.png",
+            "xMultiplier": 7e-05,
+            "yMultiplier": -7e-05,
+            "xScalarToAdd": 0.813895,
+            "yScalarToAdd": 0.573242,
+        }
+    )
+
+
+@pytest.fixture()
+def replay():
+    return pd.DataFrame(
+        {
+            "roundNumber": [1, 1, 2],
+            "phase": ["buy", "combat", "buy"],
+            "1_x": [100.0, np.nan, -2500.5],
+            "1_y": [-200.0, 50.0, 4000.0],
+            "2_x": [3000.0, 3100.0, np.nan],
+            "2_y": [-6000.0, -6100.0, np.nan],
+        }
+    )
+
+
+@pytest.fixture()
+def frames(replay):
+    return ReplayFrames.from_dataframe(replay, player_count=2)
+
+
+def test_accumulate_counts_valid_positions(frames, game_map):
+    heatmap = PositionHeatmap(MapUUID.ASCENT, bins=8)
+    heatmap.accumulate(frames, game_map)
+
+    # Player 1's round 2 position falls outside the minimap and is not counted
+    assert heatmap.counts.shape == (8, 8)
+    assert heatmap.total == 3
+    assert heatmap.density().sum() == pytest.approx(1.0)
+
+
+def test_accumulate_bins_in_image_space(frames, game_map):
+    heatmap = PositionHeatmap(
+        MapUUID.ASCENT, bins=4, filter=HeatmapFilter(rounds=frozenset({1}), players=frozenset({1}))
+    )
+    heatmap.accumulate(frames, game_map)
+
+    # Player 1 at (100, -200): image x = -200 * 7e-05 + 0.813895, image y = 100 * -7e-05 + 0.573242
+    expected = np.zeros((4, 4), dtype=np.int64)
+    expected[2, 3] = 1
+    np.testing.assert_array_equal(heatmap.counts, expected)
+
+
+def test_filters(frames, game_map):
+    by_phase = PositionHeatmap(MapUUID.ASCENT, bins=8, filter=HeatmapFilter(phases=frozenset({"combat"})))
+    by_phase.accumulate(frames, game_map)
+    by_player = PositionHeatmap(MapUUID.ASCENT, bins=8, filter=HeatmapFilter(players=frozenset({2})))
+    by_player.accumulate(frames, game_map)
+
+    assert by_phase.total == 1
+    assert by_player.total == 2
+
+
+def test_filter_on_slots_the_replay_does_not_have(frames, game_map):
+    heatmap = PositionHeatmap(MapUUID.ASCENT, bins=8, filter=HeatmapFilter(players=frozenset({5})))
+    heatmap.accumulate(frames, game_map)
+
+    assert heatmap.total == 0
+
+
+@pytest.mark.parametrize("player", [0, 11])
+def test_filter_rejects_invalid_slots(player):
+    with pytest.raises(ValueError, match=f"players must be slots 1 to 10, got \\[{player}\\]"):
+        HeatmapFilter(players=frozenset({1, player}))
+
+
+def test_accumulate_rejects_other_maps(frames, game_map):
+    with pytest.raises(ValueError, match="Cannot add ASCENT positions to a BIND heatmap"):
+        PositionHeatmap(MapUUID.BIND).accumulate(frames, game_map)
+
+
+def test_add_match_is_incremental(frames, game_map):
+    heatmap = PositionHeatmap(MapUUID.ASCENT, bins=8)
+
+    assert heatmap.add_match("match-1", [frames, frames], game_map)
+    assert not heatmap.add_match("match-1", [frames], game_map)
+    assert heatmap.total == 6
+    assert heatmap.matches == {"match-1"}
+
+
+def test_merge_partial_heatmaps(frames, game_map):
+    first = PositionHeatmap(MapUUID.ASCENT, bins=8)
+    first.add_match("match-1", [frames], game_map)
+    second = PositionHeatmap(MapUUID.ASCENT, bins=8)
+    second.add_match("match-2", [frames], game_map)
+
+    merged = first + second
+
+    np.testing.assert_array_equal(merged.counts, first.counts * 2)
+    assert merged.matches == {"match-1", "match-2"}
+    with pytest.raises(ValueError, match="would double count"):
+        merged + first
+    with pytest.raises(ValueError, match="same map, bins and filter"):
+        first + PositionHeatmap(MapUUID.ASCENT, bins=16)
+
+
+def test_save_and_load(tmp_path, frames, game_map):
+    heatmap = PositionHeatmap(MapUUID.ASCENT, bins=8, filter=HeatmapFilter(rounds=frozenset({1, 2})))
+    heatmap.add_match("match-1", [frames], game_map)
+    path = str(tmp_path / "ascent.heatmap.npz")
+    heatmap.save(path)
+
+    loaded = PositionHeatmap.load(path)
+
+    assert loaded.map_uuid == MapUUID.ASCENT
+    assert loaded.filter == heatmap.filter
+    assert loaded.matches == {"match-1"}
+    np.testing.assert_array_equal(loaded.counts, heatmap.counts)
+
+
+def test_store_only_processes_new_replays(tmp_path, replay, game_map):
+    first, second = tmp_path / "first.csv", tmp_path / "second.csv"
+    replay.to_csv(first, index=False)
+    replay.to_csv(second, index=False)
+    store = HeatmapStore(str(tmp_path / "heatmaps"), bins=8)
+
+    assert store.add_replays(game_map, [str(first)], player_count=2).total == 3
+    assert store.add_replays(game_map, [str(first), str(second)], player_count=2).total == 6
+    assert len(store.get(MapUUID.ASCENT).matches) == 2
+
+
+def test_store_rejects_mismatched_settings(tmp_path, frames, game_map):
+    PositionHeatmap(MapUUID.ASCENT, bins=8).save(str(tmp_path / "ascent.heatmap.npz"))
+
+    with pytest.raises(ValueError, match="different bins or filters"):
+        HeatmapStore(str(tmp_path), bins=16).get(MapUUID.ASCENT)
+
+
+def test_render_overlays_map_image(tmp_path, frames, game_map):
+    image_path = str(tmp_path / "display_icon.png")
+    Image.new("RGBA", (64, 64), "gray").save(image_path)
+    heatmap = PositionHeatmap(MapUUID.ASCENT, bins=8)
+    heatmap.accumulate(frames, game_map)
+    output = str(tmp_path / "heatmap.png")
+
+    heatmap.render(image_path, output)
+
+    assert Image.open(output).size == (1000, 1000)
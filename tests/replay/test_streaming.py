@@ -0,0 +1,82 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.replay.columnar import convert_csv
+from src.replay.frames import position_columns
+from src.replay.streaming import iter_replay_chunks, prefetch
+
+
+@pytest.fixture()
+def long_replay_csv(tmp_path):
+    frame_count = 25
+    data = {
+        "roundNumber": np.repeat([1, 2, 3, 4, 5], 5),
+        "phase": (["buy"] * 2 + ["combat"] * 3) * 4 + ["end"] * 5,
+    }
+    data.update({column: np.arange(frame_count, dtype=np.float32) + i for i, column in enumerate(position_columns())})
+    path = tmp_path / "long.csv"
+    pd.DataFrame(data).to_csv(path, index=False)
+    return str(path)
+
+
+def test_invalid_chunk_frames(long_replay_csv):
+    with pytest.raises(ValueError, match="chunk_frames must be at least 1"):
+        next(iter_replay_chunks(long_replay_csv, chunk_frames=0))
+
+
+def test_iter_replay_chunks_from_csv(long_replay_csv):
+    chunks = list(iter_replay_chunks(long_replay_csv, chunk_frames=10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert chunks[0].positions.dtype == np.float32
+    np.testing.assert_array_equal(chunks[2].positions[:, 0, 0], np.arange(20, 25))
+    np.testing.assert_array_equal(chunks[1].round_numbers, [3] * 5 + [4] * 5)
+    # Phase codes stay stable across chunks even when a phase first appears late
+    assert chunks[2].phases == ["buy", "combat", "end"]
+    assert [chunks[0].phase(frame) for frame in range(5)] == ["buy", "buy", "combat", "combat", "combat"]
+    assert chunks[2].phase(0) == "end"
+
+
+def test_iter_replay_chunks_from_columnar_replay(long_replay_csv):
+    csv_chunks = list(iter_replay_chunks(long_replay_csv, chunk_frames=10))
+    columnar_chunks = list(iter_replay_chunks(convert_csv(long_replay_csv), chunk_frames=10))
+
+    assert len(columnar_chunks) == len(csv_chunks)
+    for columnar_chunk, csv_chunk in zip(columnar_chunks, csv_chunks):
+        np.testing.assert_array_equal(columnar_chunk.positions, csv_chunk.positions)
+        np.testing.assert_array_equal(columnar_chunk.phase_codes, csv_chunk.phase_codes)
+
+
+def test_prefetch_preserves_order():
+    assert list(prefetch(range(100), depth=3)) == list(range(100))
+
+
+def test_prefetch_propagates_errors():
+    def failing():
+        yield 1
+        raise RuntimeError("Test error")
+
+    items = prefetch(failing())
+    assert next(items) == 1
+    with pytest.raises(RuntimeError, match="Test error"):
+        next(items)
+
+
+def test_prefetch_bounds_read_ahead():
+    produced = []
+    gate = threading.Event()
+
+    def source():
+        for item in range(10):
+            produced.append(item)
+            yield item
+        gate.set()
+
+    items = prefetch(source(), depth=2)
+    assert next(items) == 0
+    assert not gate.wait(timeout=0.2)
+    assert len(produced) <= 4
+    items.close()
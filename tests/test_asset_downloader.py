@@ -0,0 +1,286 @@
+import logging
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from asset_downloader import (
+    AssetDownloader,
+    AssetManifest,
+    ManifestEntry,
+    main,
+    parse_args,
+)
+from src.models.agent.agent import Agent
+from src.models.game_map.game_map import GameMap
+from tests.models.agent.test_ability import ALL_ABILITIES
+from tests.models.agent.test_role import ALL_ROLES
+
+
+@pytest.fixture()
+def game_map():
+    return GameMap.from_dict(
+        {
+            "uuid": "7eaecc1b-4337-bbf6-6ab9-04b8f06b3319",
+            "displayName": "Ascent",
+            "displayIcon": "https://media/ascent/displayicon.png",
+            "listViewIcon": "https://media/ascent/listviewicon.png",
+            "splash": None,
+        }
+    )
+
+
+@pytest.fixture()
+def agent():
+    return Agent.from_dict(
+        {
+            "uuid": "add6443a-41bd-e414-f6ad-e58d267f4e95",
+            "displayName": "Jett",
+            "displayIcon": "https://media/jett/displayicon.png",
+            "displayIconSmall": "https://media/jett/displayiconsmall.png",
+            "role": ALL_ROLES[1],
+            "abilities": ALL_ABILITIES,
+        }
+    )
+
+
+def make_response(chunks, error=None, status_code=200, headers=None):
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.iter_content.return_value = iter(chunks)
+    if error is not None:
+        response.raise_for_status.side_effect = error
+    return response
+
+
+@pytest.fixture()
+def session():
+    session = MagicMock()
+    session.get.side_effect = lambda url, stream, headers: make_response([url.encode(), b"-png"])
+    return session
+
+
+def test_invalid_max_workers(tmp_path):
+    with pytest.raises(ValueError, match="max_workers must be at least 1"):
+        AssetDownloader(str(tmp_path), max_workers=0)
+
+
+def test_save_map_assets_streams_to_disk(tmp_path, session, game_map, caplog):
+    downloader = AssetDownloader(str(tmp_path), session=session)
+    results = downloader.save_map_assets(game_map)
+
+    assert [result.path for result in results] == [
+        str(tmp_path / "maps" / "ascent" / "display_icon.png"),
+        str(tmp_path / "maps" / "ascent" / "list_view_icon.png"),
+    ]
+    assert all(result.success for result in results)
+    expected_content = b"https://media/ascent/displayicon.png-png"
+    assert (tmp_path / "maps" / "ascent" / "display_icon.png").read_bytes() == expected_content
+    assert results[0].size == len(expected_content)
+    assert "No URL found for asset type: splash in GameMap" in caplog.text
+    session.get.assert_any_call("https://media/ascent/displayicon.png", stream=True, headers=None)
+
+
+def test_save_agent_assets(tmp_path, session, agent):
+    downloader = AssetDownloader(str(tmp_path), session=session)
+    results = downloader.save_agent_assets(agent, ["display_icon_small"])
+
+    assert len(results) == 1
+    assert (tmp_path / "agents" / "jett" / "display_icon_small.png").exists()
+
+
+def test_unsupported_object_type(tmp_path, session):
+    downloader = AssetDownloader(str(tmp_path), session=session)
+    with pytest.raises(TypeError, match="Unsupported object type for asset downloading"):
+        downloader.save_assets([(object(), ["display_icon"])])
+
+
+def test_failed_download_keeps_existing_file(tmp_path, game_map):
+    path = tmp_path / "maps" / "ascent" / "display_icon.png"
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"old")
+
+    session = MagicMock()
+    session.get.return_value = make_response([b"partial"], error=Exception("Test error"))
+    downloader = AssetDownloader(str(tmp_path), session=session)
+    results = downloader.save_map_assets(game_map, ["display_icon"])
+
+    assert not results[0].success
+    assert results[0].error == "Test error"
+    assert path.read_bytes() == b"old"
+    assert [file.name for file in path.parent.iterdir()] == ["display_icon.png"]
+
+
+def test_interrupted_stream_removes_temp_file(tmp_path, game_map):
+    def broken_chunks():
+        yield b"partial"
+        raise ConnectionError("Connection reset")
+
+    session = MagicMock()
+    session.get.return_value = make_response(broken_chunks())
+    downloader = AssetDownloader(str(tmp_path), session=session)
+    results = downloader.save_map_assets(game_map, ["display_icon"])
+
+    assert not results[0].success
+    assert list((tmp_path / "maps" / "ascent").iterdir()) == []
+
+
+def test_save_assets_runs_in_parallel(tmp_path, game_map, agent):
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def slow_get(url, stream, headers):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return make_response([b"png"])
+
+    session = MagicMock()
+    session.get.side_effect = slow_get
+    downloader = AssetDownloader(str(tmp_path), max_workers=4, session=session)
+    results = downloader.save_assets([(game_map, None), (agent, None)])
+
+    assert len(results) == 4
+    assert peak > 1
+
+
+def test_log_summary(tmp_path, game_map, caplog):
+    caplog.set_level(logging.INFO)
+    session = MagicMock()
+    session.get.side_effect = [make_response([b"png"]), make_response([], error=Exception("Test error"))]
+    downloader = AssetDownloader(str(tmp_path), max_workers=1, session=session)
+    downloader.save_map_assets(game_map)
+    downloader.log_summary()
+
+    assert "Downloaded 1/2 assets (3 bytes), 0 unchanged, 1 failed" in caplog.text
+    assert "FAILED" in caplog.text and "Test error" in caplog.text
+
+
+@pytest.fixture()
+def manifest(tmp_path):
+    return AssetManifest.load(str(tmp_path / AssetManifest.FILE_NAME))
+
+
+def test_manifest_round_trip(manifest):
+    entry = ManifestEntry(url="https://media/icon.png", size=3, sha256="abc", etag='"v1"')
+    manifest.set("maps/ascent/display_icon.png", entry)
+    manifest.save()
+
+    assert AssetManifest.load(manifest.path).entries == {"maps/ascent/display_icon.png": entry}
+
+
+def test_manifest_records_downloaded_assets(tmp_path, manifest, game_map):
+    session = MagicMock()
+    session.get.return_value = make_response([b"png"], headers={"ETag": '"v1"', "Last-Modified": "yesterday"})
+    downloader = AssetDownloader(str(tmp_path), session=session, manifest=manifest)
+    downloader.save_map_assets(game_map, ["display_icon"])
+
+    size, sha256 = AssetManifest.file_digest(str(tmp_path / "maps" / "ascent" / "display_icon.png"))
+    assert manifest.get("maps/ascent/display_icon.png") == ManifestEntry(
+        url="https://media/ascent/displayicon.png", size=size, sha256=sha256, etag='"v1"', last_modified="yesterday"
+    )
+
+
+def test_unchanged_asset_is_revalidated(tmp_path, manifest, game_map):
+    session = MagicMock()
+    session.get.return_value = make_response([b"png"], headers={"ETag": '"v1"'})
+    AssetDownloader(str(tmp_path), session=session, manifest=manifest).save_map_assets(game_map, ["display_icon"])
+
+    session.get.return_value = make_response([], status_code=304)
+    downloader = AssetDownloader(str(tmp_path), session=session, manifest=manifest)
+    results = downloader.save_map_assets(game_map, ["display_icon"])
+
+    assert results[0].unchanged
+    session.get.assert_called_with(
+        "https://media/ascent/displayicon.png", stream=True, headers={"If-None-Match": '"v1"'}
+    )
+
+
+def test_unchanged_asset_is_skipped_without_revalidation(tmp_path, manifest, game_map):
+    session = MagicMock()
+    session.get.return_value = make_response([b"png"])
+    AssetDownloader(str(tmp_path), session=session, manifest=manifest).save_map_assets(game_map, ["display_icon"])
+
+    downloader = AssetDownloader(str(tmp_path), session=session, manifest=manifest, revalidate=False)
+    results = downloader.save_map_assets(game_map, ["display_icon"])
+
+    assert results[0].unchanged
+    assert session.get.call_count == 1
+
+
+def test_modified_local_asset_is_downloaded_again(tmp_path, manifest, game_map):
+    session = MagicMock()
+    session.get.return_value = make_response([b"png"], headers={"ETag": '"v1"'})
+    AssetDownloader(str(tmp_path), session=session, manifest=manifest).save_map_assets(game_map, ["display_icon"])
+    (tmp_path / "maps" / "ascent" / "display_icon.png").write_bytes(b"tampered")
+
+    session.get.return_value = make_response([b"png"], headers={"ETag": '"v1"'})
+    downloader = AssetDownloader(str(tmp_path), session=session, manifest=manifest)
+    results = downloader.save_map_assets(game_map, ["display_icon"])
+
+    assert not results[0].unchanged
+    session.get.assert_called_with("https://media/ascent/displayicon.png", stream=True, headers=None)
+    assert (tmp_path / "maps" / "ascent" / "display_icon.png").read_bytes() == b"png"
+
+
+def test_prune_orphans(tmp_path, manifest, game_map, agent):
+    session = MagicMock()
+    session.get.side_effect = lambda url, stream, headers: make_response([b"png"])
+    AssetDownloader(str(tmp_path), session=session, manifest=manifest).save_assets([(game_map, None), (agent, None)])
+
+    downloader = AssetDownloader(str(tmp_path), session=session, manifest=manifest)
+    downloader.save_map_assets(game_map, ["display_icon"])
+    removed = downloader.prune_orphans()
+
+    assert sorted(removed) == sorted(
+        [
+            str(tmp_path / "maps" / "ascent" / "list_view_icon.png"),
+            str(tmp_path / "agents" / "jett" / "display_icon.png"),
+            str(tmp_path / "agents" / "jett" / "display_icon_small.png"),
+        ]
+    )
+    assert list(manifest.entries) == ["maps/ascent/display_icon.png"]
+    assert not (tmp_path / "agents").exists()
+
+
+def test_prune_orphans_without_results_keeps_assets(tmp_path, manifest, game_map, session):
+    AssetDownloader(str(tmp_path), session=session, manifest=manifest).save_map_assets(game_map)
+
+    assert AssetDownloader(str(tmp_path), session=session, manifest=manifest).prune_orphans() == []
+    assert len(manifest.entries) == 2
+
+
+def test_prune_orphans_after_a_failed_download_keeps_assets(tmp_path, manifest, game_map, agent):
+    session = MagicMock()
+    session.get.side_effect = lambda url, stream, headers: make_response([b"png"])
+    AssetDownloader(str(tmp_path), session=session, manifest=manifest).save_assets([(game_map, None), (agent, None)])
+    session.get.side_effect = lambda url, stream, headers: make_response([], error=RuntimeError("boom"))
+
+    downloader = AssetDownloader(str(tmp_path), session=session, manifest=manifest)
+    downloader.save_map_assets(game_map, ["display_icon"])
+
+    assert not downloader.results[0].success
+    assert downloader.prune_orphans() == []
+    assert (tmp_path / "agents" / "jett" / "display_icon.png").exists()
+    assert len(manifest.entries) == 4
+
+
+def test_pruning_is_opt_in():
+    assert not parse_args([]).prune
+    assert parse_args(["--prune"]).prune
+
+
+def test_main_fails_when_a_download_fails(tmp_path, monkeypatch, game_map):
+    game_map.display_icon = "http://127.0.0.1:9/ascent/displayicon.png"
+    monkeypatch.chdir(tmp_path)
+
+    with patch("asset_downloader.fetch_objects", AsyncMock(return_value=([game_map], []))):
+        assert main(parse_args(["--retries", "0", "--rate", "0"])) == 1
@@ -0,0 +1,100 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from valorant_client.async_client import AsyncValorantClient
+from valorant_client.client import ValorantClient
+
+
+@pytest.fixture
+def sync_client():
+    return MagicMock(spec=ValorantClient)
+
+
+def test_invalid_max_concurrency(sync_client):
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        AsyncValorantClient(sync_client, max_concurrency=0)
+
+
+def test_async_methods_delegate_to_client(sync_client, uuid):
+    sync_client.get_all_maps.return_value = {"data": ["map"]}
+    sync_client.get_map_by_uuid.return_value = {"data": "map"}
+    sync_client.get_all_agents.return_value = {"data": ["agent"]}
+    sync_client.get_agent_by_uuid.return_value = {"data": "agent"}
+
+    async def run():
+        async with AsyncValorantClient(sync_client) as client:
+            return (
+                await client.get_all_maps(),
+                await client.get_map_by_uuid(uuid),
+                await client.get_all_agents("es-ES", False),
+                await client.get_agent_by_uuid(uuid, "es-ES"),
+            )
+
+    assert asyncio.run(run()) == ({"data": ["map"]}, {"data": "map"}, {"data": ["agent"]}, {"data": "agent"})
+    sync_client.get_map_by_uuid.assert_called_once_with(uuid)
+    sync_client.get_all_agents.assert_called_once_with("es-ES", False)
+    sync_client.get_agent_by_uuid.assert_called_once_with(uuid, "es-ES")
+    sync_client.close.assert_not_called()
+
+
+def test_close_closes_owned_client():
+    client = AsyncValorantClient()
+
+    with patch.object(client.client, "close") as close:
+        client.close()
+
+    close.assert_called_once()
+
+
+def test_get_maps_by_uuid_preserves_order(sync_client):
+    map_uuids = [uuid4() for _ in range(5)]
+    sync_client.get_map_by_uuid.side_effect = lambda map_uuid: {"data": str(map_uuid)}
+
+    async def run():
+        async with AsyncValorantClient(sync_client) as client:
+            return await client.get_maps_by_uuid(map_uuids)
+
+    assert asyncio.run(run()) == [{"data": str(map_uuid)} for map_uuid in map_uuids]
+
+
+def test_get_agents_by_uuid_returns_exceptions(sync_client):
+    agent_uuids = [uuid4(), uuid4()]
+    error = RuntimeError("Test error")
+    sync_client.get_agent_by_uuid.side_effect = [{"data": "agent"}, error]
+
+    async def run():
+        async with AsyncValorantClient(sync_client, max_concurrency=1) as client:
+            return await client.get_agents_by_uuid(agent_uuids, return_exceptions=True)
+
+    assert asyncio.run(run()) == [{"data": "agent"}, error]
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+def test_gather_respects_max_concurrency(sync_client, max_concurrency):
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def slow_get(map_uuid):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return {"data": str(map_uuid)}
+
+    sync_client.get_map_by_uuid.side_effect = slow_get
+
+    async def run():
+        async with AsyncValorantClient(sync_client, max_concurrency=max_concurrency) as client:
+            return await client.get_maps_by_uuid([uuid4() for _ in range(8)])
+
+    assert len(asyncio.run(run())) == 8
+    assert peak == max_concurrency
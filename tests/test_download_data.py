@@ -0,0 +1,59 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from download_data import download_data_bulk, save_bundle
+from src.models.agent.agent import AgentUUID
+from src.models.bundle import DataBundle
+from src.models.game_map.game_map import MapUUID
+from tests.models.agent.test_ability import ALL_ABILITIES
+from tests.models.agent.test_role import ALL_ROLES
+
+
+@pytest.fixture()
+def agent_entries():
+    return [
+        {
+            "uuid": AgentUUID.JETT.value,
+            "displayName": "Jett",
+            "displayIcon": "icon.png",
+            "displayIconSmall": "small_icon.png",
+            "role": ALL_ROLES[1],
+            "abilities": ALL_ABILITIES,
+        }
+    ]
+
+
+def test_download_data_bulk(tmp_path, map_entries, agent_entries):
+    client = AsyncMock()
+    client.get_all_maps.return_value = {"status": 200, "data": map_entries}
+    client.get_all_agents.return_value = {"status": 200, "data": agent_entries}
+
+    report = asyncio.run(download_data_bulk(client, str(tmp_path)))
+
+    client.get_all_maps.assert_awaited_once()
+    client.get_all_agents.assert_awaited_once()
+    client.get_map_by_uuid.assert_not_awaited()
+    client.get_agent_by_uuid.assert_not_awaited()
+
+    assert sorted(path.name for path in (tmp_path / "maps").iterdir()) == ["ascent.json", "bind.json"]
+    assert json.loads((tmp_path / "agents" / "jett.json").read_text())["displayName"] == "Jett"
+    assert report.unknown_maps == [map_entries[2]]
+    assert len(report.missing_maps) == len(MapUUID) - 2
+    assert report.unknown_agents == []
+    assert AgentUUID.JETT not in report.missing_agents
+
+
+def test_save_bundle(tmp_path, map_entries, agent_entries):
+    client = AsyncMock()
+    client.get_all_maps.return_value = {"status": 200, "data": map_entries}
+    client.get_all_agents.return_value = {"status": 200, "data": agent_entries}
+    asyncio.run(download_data_bulk(client, str(tmp_path)))
+
+    save_bundle(str(tmp_path))
+
+    bundle = DataBundle.read(str(tmp_path / "data.bundle"))
+    assert sorted(map_uuid.name for map_uuid in bundle.maps) == ["ASCENT", "BIND"]
+    assert list(bundle.agents) == [AgentUUID.JETT]
@@ -0,0 +1,140 @@
+import json
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+import pytest
+
+from asset_downloader import AssetDownloader, AssetManifest
+from src.models.game_map.game_map import GameMap, MapUUID
+from valorant_client.cache import DiskResponseCache
+from valorant_client.client import ValorantClient
+from valorant_client.metrics import NULL_METRICS, Histogram, Metrics, MetricsRecorder
+from valorant_client.stub_server import StubServer
+from valorant_client.throttle import RetryPolicy, Throttle
+
+
+@pytest.fixture()
+def throttle():
+    return Throttle(rate=None, retry_policy=RetryPolicy(max_retries=10, base_delay=0.001), seed=0)
+
+
+def test_histogram_quantiles():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.cumulative() == [("0.1", 2), ("1", 3), ("+Inf", 4)]
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(0.99) == 3.0
+    assert Histogram().quantile(0.5) == 0.0
+
+
+def test_null_metrics_is_the_default():
+    assert ValorantClient().metrics is NULL_METRICS
+    assert AssetDownloader("assets").metrics is NULL_METRICS
+    NULL_METRICS.request_finished("api", 200, 0.1)
+
+
+def test_custom_hooks():
+    class CountingMetrics(Metrics):
+        def __init__(self):
+            self.finished = []
+
+        def request_finished(self, client, status, seconds):
+            self.finished.append((client, status))
+
+    metrics = CountingMetrics()
+    response = MagicMock(status_code=200)
+    client = ValorantClient(throttle=Throttle(rate=None), metrics=metrics)
+
+    with patch.object(client.session, "get", return_value=response):
+        client._get("https://testurl")
+
+    assert metrics.finished == [("api", 200)]
+
+
+def test_records_client_requests(tmp_path, throttle):
+    metrics = MetricsRecorder()
+    with StubServer(failure_rate=0.3, seed=1) as server:
+        cache = DiskResponseCache(str(tmp_path))
+        with ValorantClient(base_url=server.base_url, cache=cache, throttle=throttle, metrics=metrics) as client:
+            client.get_all_maps()
+            client.get_all_maps()
+            client.get_map_by_uuid(UUID(MapUUID.ASCENT.value))
+
+    data = metrics.to_dict()["api"]
+    assert data["requests"] == {"200": 2, "304": 1, "503": server.status_counts[503]}
+    assert data["retries"] == ({"503": server.status_counts[503]} if server.status_counts[503] else {})
+    assert data["latency_seconds"]["count"] == sum(server.status_counts.values())
+    assert data["bytes"] > 0
+    assert (data["cache_hits"], data["cache_misses"]) == (1, 2)
+    assert data["peak_in_flight"] == 1
+    assert metrics.in_flight["api"] == 0
+
+
+def test_records_asset_downloads(tmp_path, throttle):
+    metrics = MetricsRecorder()
+    game_maps = [GameMap(uuid=MapUUID.ASCENT, name=f"map{index}", display_icon=f"/{index}.png") for index in range(4)]
+    with StubServer() as server:
+        downloader = AssetDownloader(
+            str(tmp_path),
+            manifest=AssetManifest(str(tmp_path / AssetManifest.FILE_NAME)),
+            asset_base_url=server.asset_base_url,
+            throttle=throttle,
+            metrics=metrics,
+        )
+        downloader.save_assets([(game_map, ["display_icon"]) for game_map in game_maps])
+        downloader.save_assets([(game_maps[0], ["display_icon"])])
+        downloader.close()
+
+    data = metrics.to_dict()["assets"]
+    assert data["requests"] == {"200": 4, "304": 1}
+    assert data["bytes"] == 4 * len(server.synthetic_asset)
+    assert (data["cache_hits"], data["cache_misses"]) == (1, 4)
+    assert 1 <= data["peak_in_flight"] <= AssetDownloader.DEFAULT_MAX_WORKERS
+
+
+def test_records_connection_errors():
+    metrics = MetricsRecorder()
+    client = ValorantClient(base_url="http://127.0.0.1:9/v1", throttle=Throttle(rate=None), metrics=metrics)
+    client.throttle.retry_policy = RetryPolicy(max_retries=1, base_delay=0.001)
+
+    with pytest.raises(Exception):
+        client.get_all_maps()
+
+    assert metrics.requests == {("api", "error"): 2}
+    assert metrics.retries == {("api", "ConnectionError"): 1}
+
+
+def test_prometheus_export():
+    metrics = MetricsRecorder(buckets=(0.1, 1.0))
+    metrics.request_started("api")
+    metrics.request_finished("api", 200, 0.05)
+    metrics.retried("api", "429")
+    metrics.bytes_received("assets", 128)
+    metrics.cache_hit("api")
+
+    lines = metrics.to_prometheus().splitlines()
+
+    assert "# TYPE valostats_request_duration_seconds histogram" in lines
+    assert 'valostats_request_duration_seconds_bucket{client="api",le="0.1"} 1' in lines
+    assert 'valostats_request_duration_seconds_bucket{client="api",le="+Inf"} 1' in lines
+    assert 'valostats_request_duration_seconds_count{client="api"} 1' in lines
+    assert 'valostats_requests_total{client="api",status="200"} 1' in lines
+    assert 'valostats_retries_total{client="api",reason="429"} 1' in lines
+    assert 'valostats_received_bytes_total{client="assets"} 128' in lines
+    assert 'valostats_cache_hits_total{client="api"} 1' in lines
+    assert 'valostats_in_flight_peak{client="api"} 1' in lines
+
+
+def test_write_picks_format_from_extension(tmp_path):
+    metrics = MetricsRecorder()
+    metrics.bytes_received("api", 10)
+
+    metrics.write(str(tmp_path / "metrics.json"))
+    metrics.write(str(tmp_path / "out" / "metrics.prom"))
+
+    assert json.loads((tmp_path / "metrics.json").read_text())["api"]["bytes"] == 10
+    assert 'valostats_received_bytes_total{client="api"} 10' in (tmp_path / "out" / "metrics.prom").read_text()
@@ -0,0 +1,99 @@
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from valorant_client.cache import CachedResponse, DiskResponseCache
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    return DiskResponseCache(str(tmp_path))
+
+
+@pytest.fixture
+def cached_response():
+    return CachedResponse(body={"status": 200, "data": {"uuid": "test"}}, etag='"abc"', stored_at=time.time(), ttl=60)
+
+
+def test_cached_response_is_fresh(cached_response):
+    assert cached_response.is_fresh()
+    assert not cached_response.is_fresh(now=cached_response.stored_at + 60)
+
+
+def test_cached_response_conditional_headers():
+    response = CachedResponse(body={}, etag='"abc"', last_modified="Tue, 01 Oct 2024 00:00:00 GMT")
+    assert response.conditional_headers() == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Tue, 01 Oct 2024 00:00:00 GMT",
+    }
+    assert CachedResponse(body={}).conditional_headers() == {}
+
+
+def test_disk_cache_round_trip(disk_cache, cached_response):
+    disk_cache.set("https://testurl", cached_response)
+    assert disk_cache.get("https://testurl") == cached_response
+    assert disk_cache.get("https://otherurl") is None
+
+
+def test_disk_cache_delete_and_clear(disk_cache, cached_response):
+    disk_cache.set("https://testurl/1", cached_response)
+    disk_cache.set("https://testurl/2", cached_response)
+
+    disk_cache.delete("https://testurl/1")
+    assert disk_cache.get("https://testurl/1") is None
+    assert disk_cache.get("https://testurl/2") == cached_response
+
+    disk_cache.clear()
+    assert disk_cache.size() == 0
+
+
+def test_disk_cache_discards_corrupt_entries(disk_cache, cached_response):
+    disk_cache.set("https://testurl", cached_response)
+    with open(disk_cache._path("https://testurl"), "w") as file:
+        file.write("{not json")
+
+    assert disk_cache.get("https://testurl") is None
+    assert not os.path.exists(disk_cache._path("https://testurl"))
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path, cached_response):
+    disk_cache = DiskResponseCache(str(tmp_path), max_size=10**6)
+    disk_cache.set("https://testurl/old", cached_response)
+    disk_cache.set("https://testurl/recent", cached_response)
+    entry_size = disk_cache.size() // 2
+
+    os.utime(disk_cache._path("https://testurl/old"), (1, 1))
+    os.utime(disk_cache._path("https://testurl/recent"), (2, 2))
+    disk_cache.get("https://testurl/old")
+
+    disk_cache.max_size = entry_size * 2
+    disk_cache.set("https://testurl/new", cached_response)
+
+    assert disk_cache.get("https://testurl/recent") is None
+    assert disk_cache.get("https://testurl/old") == cached_response
+    assert disk_cache.get("https://testurl/new") == cached_response
+
+
+def test_disk_cache_removes_temp_file_on_failed_write(disk_cache, cached_response):
+    with patch("valorant_client.cache.os.replace", side_effect=OSError("disk full")), pytest.raises(OSError):
+        disk_cache.set("https://testurl", cached_response)
+    with pytest.raises(TypeError):
+        disk_cache.set("https://testurl", CachedResponse(body={"data": object()}))
+
+    assert os.listdir(disk_cache.directory) == []
+    assert disk_cache.size() == 0
+
+
+def test_disk_cache_tracks_size_without_rescanning(tmp_path, cached_response):
+    DiskResponseCache(str(tmp_path)).set("https://testurl/1", cached_response)
+    disk_cache = DiskResponseCache(str(tmp_path))
+    entry_size = disk_cache.size()
+
+    with patch.object(disk_cache, "_entries", side_effect=AssertionError("rescanned")):
+        disk_cache.set("https://testurl/2", cached_response)
+        disk_cache.set("https://testurl/2", cached_response)
+        disk_cache.delete("https://testurl/1")
+
+    assert disk_cache.size() == entry_size == os.path.getsize(disk_cache._path("https://testurl/2"))
@@ -0,0 +1,115 @@
+import time
+from uuid import UUID
+
+import pytest
+import requests
+
+from asset_downloader import AssetDownloader
+from src.models.game_map.game_map import GameMap, MapUUID
+from valorant_client.client import ValorantClient
+from valorant_client.stub_server import StubServer
+
+
+@pytest.fixture()
+def server():
+    with StubServer() as server:
+        yield server
+
+
+@pytest.fixture()
+def client(server):
+    client = ValorantClient(base_url=server.base_url)
+    yield client
+    client.close()
+
+
+def test_serves_collections(client):
+    assert len(client.get_all_maps()["data"]) == len(MapUUID)
+    assert {agent["displayName"] for agent in client.get_all_agents()["data"]} >= {"Jett", "Sage"}
+
+
+def test_serves_single_entries(client):
+    response = client.get_map_by_uuid(UUID(MapUUID.ASCENT.value))
+
+    assert response["status"] == 200
+    assert response["data"]["displayName"] == "Ascent"
+
+
+def test_unknown_entry(client):
+    with pytest.raises(requests.HTTPError):
+        client.get_map_by_uuid(UUID(int=0))
+
+
+def test_serves_assets(server):
+    response = requests.get(server.asset_url("icon.png"))
+
+    assert response.headers["Content-Type"] == "image/png"
+    assert response.content == server.synthetic_asset
+
+
+def test_client_base_url():
+    client = ValorantClient(base_url="http://localhost:8000/v1/")
+
+    assert client.base_url == "http://localhost:8000/v1"
+    assert ValorantClient().base_url == ValorantClient.DEFAULT_BASE_URL
+
+
+def test_injects_latency():
+    with StubServer(latency=0.05) as server:
+        start = time.perf_counter()
+        requests.get(server.asset_url("icon.png"))
+
+        assert time.perf_counter() - start >= 0.05
+
+
+def test_throttles_above_rate():
+    with StubServer(rate=1.0, burst=2) as server:
+        responses = [requests.get(server.asset_url("icon.png")) for _ in range(3)]
+
+        assert [response.status_code for response in responses] == [200, 200, 429]
+        assert int(responses[2].headers["Retry-After"]) >= 1
+        assert server.status_counts == {200: 2, 429: 1}
+
+
+def test_injects_failures():
+    with StubServer(failure_rate=1.0, failure_status=502, seed=0) as server:
+        response = requests.get(server.asset_url("icon.png"))
+
+        assert response.status_code == 502
+        assert response.json()["error"] == "Injected failure"
+
+
+def test_revalidates_with_etag(server):
+    first = requests.get(server.asset_url("icon.png"))
+    second = requests.get(server.asset_url("icon.png"), headers={"If-None-Match": first.headers["ETag"]})
+
+    assert second.status_code == 304
+    assert second.content == b""
+
+
+def test_serves_recorded_assets(tmp_path):
+    asset_path = tmp_path / "maps" / "ascent" / "display_icon.png"
+    asset_path.parent.mkdir(parents=True)
+    asset_path.write_bytes(b"recorded")
+
+    with StubServer(assets_directory=str(tmp_path)) as server:
+        display_icon = server.entries["maps"][MapUUID.ASCENT.value]["displayIcon"]
+        response = requests.get(
+            AssetDownloader(str(tmp_path), asset_base_url=server.asset_base_url).resolve_url(display_icon)
+        )
+
+    assert response.content == b"recorded"
+
+
+def test_asset_downloader_uses_asset_base_url(server, tmp_path):
+    url = "https://media.valorant-api.com/maps/uuid/displayicon.png"
+    game_map = GameMap(uuid=MapUUID.ASCENT, name="Ascent", display_icon=url)
+    downloader = AssetDownloader(str(tmp_path), asset_base_url=server.asset_base_url + "/")
+
+    downloader.save_assets([(game_map, ["display_icon"])])
+    downloader.close()
+
+    assert downloader.resolve_url(f"{url}?v=1") == f"{server.asset_base_url}/maps/uuid/displayicon.png?v=1"
+    assert downloader.results[0].success
+    assert downloader.results[0].url == url
+    assert (tmp_path / "maps" / "ascent" / "display_icon.png").read_bytes() == server.synthetic_asset
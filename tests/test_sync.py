@@ -0,0 +1,32 @@
+import logging
+
+from src.models.agent.agent import AgentUUID
+from src.models.game_map.game_map import MapUUID
+from valorant_client.sync import SyncReport, match_entries
+
+
+def test_match_entries(map_entries):
+    matched, unknown, missing = match_entries(map_entries, MapUUID)
+
+    assert list(matched) == [MapUUID.ASCENT, MapUUID.BIND]
+    assert matched[MapUUID.BIND] is map_entries[1]
+    assert unknown == [map_entries[2]]
+    assert set(missing) == set(MapUUID) - {MapUUID.ASCENT, MapUUID.BIND}
+
+
+def test_sync_report_logs_drift(map_entries, caplog):
+    report = SyncReport(unknown_maps=[map_entries[2]], missing_agents=[AgentUUID.JETT])
+    report.log()
+
+    assert report.has_drift
+    assert "Map not in MapUUID: The Range (ee613ee9-28b7-4beb-9666-08db13bb2244)" in caplog.text
+    assert "AgentUUID member missing from the API: JETT" in caplog.text
+
+
+def test_sync_report_without_drift(caplog):
+    caplog.set_level(logging.INFO)
+    report = SyncReport()
+    report.log()
+
+    assert not report.has_drift
+    assert "API entries match MapUUID and AgentUUID" in caplog.text
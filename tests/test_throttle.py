@@ -0,0 +1,244 @@
+import threading
+import time
+from email.utils import formatdate
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+import requests
+
+from asset_downloader import AssetDownloader
+from src.models.game_map.game_map import GameMap, MapUUID
+from valorant_client.client import ValorantClient
+from valorant_client.stub_server import StubServer
+from valorant_client.throttle import (
+    UNTHROTTLED,
+    RetryPolicy,
+    Throttle,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+def make_response(status_code, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+def test_token_bucket_allows_burst_then_paces():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10.0, burst=2, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.1)
+    assert clock.now == pytest.approx(0.2)
+
+
+def test_token_bucket_pause():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=100.0, clock=clock, sleep=clock.sleep)
+
+    bucket.pause(2.0)
+
+    assert bucket.acquire() == pytest.approx(2.0)
+
+
+def test_token_bucket_validation():
+    with pytest.raises(ValueError, match="rate must be positive"):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError, match="burst must be at least 1"):
+        TokenBucket(rate=1, burst=0)
+
+
+def test_parse_retry_after():
+    now = time.time()
+
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(formatdate(now + 10, usegmt=True), now=now) == pytest.approx(10, abs=1)
+    assert parse_retry_after(formatdate(now - 10, usegmt=True), now=now) == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+    throttle = Throttle(seed=0)
+
+    delays = [policy.backoff(attempt, throttle._random) for attempt in range(10)]
+
+    assert all(0.0 <= delay <= min(4.0, 2**attempt) for attempt, delay in enumerate(delays))
+    assert len(set(delays)) == len(delays)
+    assert policy.delay(0, throttle._random, retry_after="3") == 3.0
+    assert policy.delay(0, throttle._random, retry_after="86400") == 4.0
+
+
+def test_retries_until_success():
+    clock = FakeClock()
+    throttle = Throttle(rate=None, seed=0, clock=clock, sleep=clock.sleep)
+    session = MagicMock()
+    session.get.side_effect = [make_response(503), make_response(502), make_response(200)]
+
+    with throttle.request(session, "https://testurl", params={"a": 1}) as response:
+        assert response.status_code == 200
+
+    assert session.get.call_count == 3
+    session.get.assert_called_with("https://testurl", params={"a": 1})
+    assert throttle.retries == 2
+    assert len(clock.sleeps) == 2
+
+
+def test_honours_retry_after_for_the_whole_host():
+    clock = FakeClock()
+    throttle = Throttle(rate=100.0, seed=0, clock=clock, sleep=clock.sleep)
+    session = MagicMock()
+    session.get.side_effect = [make_response(429, {"Retry-After": "5"}), make_response(200)]
+
+    with throttle.request(session, "https://testurl/maps") as response:
+        assert response.status_code == 200
+
+    assert clock.sleeps[0] == 5.0
+    assert throttle.bucket("https://testurl/agents")._paused_until == 5.0
+
+
+def test_gives_up_after_max_retries():
+    clock = FakeClock()
+    throttle = Throttle(rate=None, retry_policy=RetryPolicy(max_retries=2), clock=clock, sleep=clock.sleep)
+    session = MagicMock()
+    session.get.return_value = make_response(500)
+
+    with throttle.request(session, "https://testurl") as response:
+        assert response.status_code == 500
+    assert session.get.call_count == 3
+
+    session.get.side_effect = requests.ConnectionError("Connection refused")
+    with pytest.raises(requests.ConnectionError):
+        with throttle.request(session, "https://testurl"):
+            pass
+    assert session.get.call_count == 6
+
+
+def test_does_not_retry_client_errors():
+    throttle = Throttle(rate=None)
+    session = MagicMock()
+    session.get.return_value = make_response(404)
+
+    with throttle.request(session, "https://testurl") as response:
+        assert response.status_code == 404
+    assert session.get.call_count == 1
+    response.close.assert_called_once()
+
+
+def test_caps_requests_in_flight():
+    throttle = Throttle(rate=None, max_in_flight=2)
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def slow_get(url):
+        with lock:
+            in_flight.append(url)
+            peak.append(len(in_flight))
+        time.sleep(0.02)
+        with lock:
+            in_flight.remove(url)
+        return make_response(200)
+
+    session = MagicMock()
+    session.get.side_effect = slow_get
+
+    def request(index):
+        with throttle.request(session, f"https://testurl/{index}"):
+            pass
+
+    threads = [threading.Thread(target=request, args=(index,)) for index in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 2
+
+
+def test_paused_host_does_not_hold_slots():
+    waiting = threading.Event()
+    resume = threading.Event()
+
+    def sleep(delay):
+        waiting.set()
+        resume.wait()
+
+    throttle = Throttle(rate=100.0, max_in_flight=1, sleep=sleep)
+    throttle.bucket("https://paused").pause(60.0)
+    session = MagicMock()
+    session.get.return_value = make_response(200)
+
+    def request():
+        with throttle.request(session, "https://paused/maps"):
+            pass
+
+    thread = threading.Thread(target=request)
+    thread.start()
+    assert waiting.wait(timeout=5)
+    with throttle.request(session, "https://other/maps") as response:
+        assert response.status_code == 200
+    resume.set()
+    thread.join()
+
+    assert session.get.call_count == 2
+
+
+def test_unthrottled_by_default():
+    session = MagicMock()
+    session.get.return_value = make_response(503)
+
+    assert ValorantClient().throttle is AssetDownloader("assets").throttle is UNTHROTTLED
+    with UNTHROTTLED.request(session, "https://testurl") as response:
+        assert response.status_code == 503
+    assert session.get.call_count == 1
+
+
+def test_validation():
+    with pytest.raises(ValueError, match="max_in_flight must be at least 1"):
+        Throttle(max_in_flight=0)
+
+
+def test_client_recovers_from_injected_failures():
+    throttle = Throttle(rate=None, retry_policy=RetryPolicy(max_retries=10, base_delay=0.001), seed=0)
+    with StubServer(failure_rate=0.5, seed=0) as server:
+        with ValorantClient(base_url=server.base_url, throttle=throttle) as client:
+            responses = [client.get_map_by_uuid(UUID(map_uuid.value)) for map_uuid in MapUUID]
+
+    assert [response["data"]["uuid"] for response in responses] == [map_uuid.value for map_uuid in MapUUID]
+    assert server.status_counts[503] == throttle.retries > 0
+
+
+def test_asset_downloader_recovers_from_throttling(tmp_path):
+    throttle = Throttle(rate=None, retry_policy=RetryPolicy(max_retries=20, base_delay=0.001), seed=0)
+    game_maps = [GameMap(uuid=MapUUID.ASCENT, name=f"map{index}", display_icon=f"/{index}.png") for index in range(4)]
+    with StubServer(rate=50.0, burst=1) as server:
+        downloader = AssetDownloader(str(tmp_path), asset_base_url=server.asset_base_url, throttle=throttle)
+        # Retry-After rounds up to whole seconds, so keep the test from waiting on it
+        throttle._sleep = lambda delay: time.sleep(min(delay, 0.01))
+        downloader.save_assets([(game_map, ["display_icon"]) for game_map in game_maps])
+        downloader.close()
+
+    assert all(result.success for result in downloader.results)
+    assert server.status_counts[200] == len(game_maps)
+    assert server.status_counts[429] == throttle.retries > 0
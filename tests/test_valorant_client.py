@@ -1,7 +1,9 @@
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from valorant_client.cache import CachedResponse, CacheMissError, DiskResponseCache
 from valorant_client.client import ValorantClient
 
 
@@ -10,32 +12,123 @@ def api_client():
     return ValorantClient()
 
 
-@patch("valorant_client.client.get")
-def test_success__get(mock_get, api_client):
+def test_client_uses_pooled_session(api_client):
+    adapter = api_client.session.get_adapter("https://valorant-api.com")
+    assert adapter._pool_maxsize == ValorantClient.DEFAULT_POOL_SIZE
+
+
+def test_client_reuses_injected_session():
+    session = MagicMock()
+    with ValorantClient(session=session) as client:
+        assert client.session is session
+    session.close.assert_called_once()
+
+
+def test_success__get(api_client):
     url = "https://testurl"
     params = {"parameter": 1}
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.json.return_value = {"status": "success"}
-    mock_get.return_value = mock_response
 
-    response = api_client._get(url, params=params)
+    with patch.object(api_client.session, "get", return_value=mock_response) as mock_get:
+        response = api_client._get(url, params=params)
 
-    mock_get.assert_called_once_with(url, params=params)
+    mock_get.assert_called_once_with(url, params=params, headers=None)
     assert response == {"status": "success"}
 
 
-@patch("valorant_client.client.get")
-def test_exception__get(mock_get, api_client, caplog):
+def test_exception__get(api_client, caplog):
     url = "https://testurl"
-    mock_get.side_effect = Exception("Test error")
 
-    with pytest.raises(Exception, match="Test error"):
-        api_client._get(url)
+    with patch.object(api_client.session, "get", side_effect=Exception("Test error")):
+        with pytest.raises(Exception, match="Test error"):
+            api_client._get(url)
 
     assert "Error during get request: Test error" in caplog.text
 
 
+@pytest.fixture
+def disk_cache(tmp_path):
+    return DiskResponseCache(str(tmp_path))
+
+
+def make_response(status_code, body=None, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = body
+    return response
+
+
+def test_offline_mode_requires_cache():
+    with pytest.raises(ValueError, match="Offline mode requires a response cache"):
+        ValorantClient(offline=True)
+
+
+def test_cache_key_sorts_params():
+    assert ValorantClient._cache_key("https://testurl") == "https://testurl"
+    assert ValorantClient._cache_key("https://testurl", {"b": 2, "a": 1}) == "https://testurl?a=1&b=2"
+
+
+def test__get_stores_response_validators(disk_cache):
+    client = ValorantClient(cache=disk_cache)
+    response = make_response(200, {"status": 200}, {"ETag": '"abc"', "Last-Modified": "yesterday"})
+
+    with patch.object(client.session, "get", return_value=response):
+        assert client._get("https://testurl") == {"status": 200}
+
+    cached = disk_cache.get("https://testurl")
+    assert cached.body == {"status": 200}
+    assert cached.etag == '"abc"'
+    assert cached.last_modified == "yesterday"
+
+
+def test__get_revalidates_stale_cache_entry(disk_cache):
+    client = ValorantClient(cache=disk_cache)
+    disk_cache.set("https://testurl", CachedResponse(body={"status": 200}, etag='"abc"', stored_at=0.0))
+
+    with patch.object(client.session, "get", return_value=make_response(304)) as mock_get:
+        assert client._get("https://testurl") == {"status": 200}
+
+    mock_get.assert_called_once_with("https://testurl", params=None, headers={"If-None-Match": '"abc"'})
+    cached = disk_cache.get("https://testurl")
+    assert cached.etag == '"abc"'
+    assert cached.stored_at > 0.0
+
+
+def test__get_replaces_changed_cache_entry(disk_cache):
+    client = ValorantClient(cache=disk_cache)
+    disk_cache.set("https://testurl", CachedResponse(body={"version": 1}, etag='"v1"'))
+
+    with patch.object(client.session, "get", return_value=make_response(200, {"version": 2}, {"ETag": '"v2"'})):
+        assert client._get("https://testurl") == {"version": 2}
+
+    assert disk_cache.get("https://testurl").etag == '"v2"'
+
+
+def test__get_serves_fresh_cache_entry_without_request(disk_cache):
+    client = ValorantClient(cache=disk_cache, cache_ttl=60)
+    disk_cache.set("https://testurl", CachedResponse(body={"status": 200}, stored_at=time.time(), ttl=60))
+
+    with patch.object(client.session, "get") as mock_get:
+        assert client._get("https://testurl") == {"status": 200}
+
+    mock_get.assert_not_called()
+
+
+def test__get_offline_mode(disk_cache):
+    client = ValorantClient(cache=disk_cache, offline=True)
+    disk_cache.set("https://testurl", CachedResponse(body={"status": 200}))
+
+    with patch.object(client.session, "get") as mock_get:
+        assert client._get("https://testurl") == {"status": 200}
+        with pytest.raises(CacheMissError, match="No cached response for https://otherurl in offline mode"):
+            client._get("https://otherurl")
+
+    mock_get.assert_not_called()
+
+
 @patch.object(ValorantClient, "_get")
 def test_get_all_maps(mock_get, api_client):
     expected_url = f"{api_client.base_url}/maps"
@@ -0,0 +1,86 @@
+import os
+import subprocess
+import sys
+import types
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+import valostats
+from src.replay.columnar import is_columnar_replay
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ["numpy", "pandas", "matplotlib", "PIL", "requests", "asyncio"]
+# Import cost on top of a bare interpreter, generous enough for slow CI runners
+STARTUP_BUDGET_US = 100_000
+
+
+def import_times(*args: str) -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], capture_output=True, text=True, check=True, cwd=ROOT
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def test_help_does_not_import_heavy_modules():
+    imported = import_times("valostats.py", "--help")
+
+    for heavy in HEAVY_MODULES:
+        assert not [name for name in imported if name == heavy or name.startswith(f"{heavy}.")], heavy
+
+
+def test_startup_budget():
+    baseline = import_times("-c", "pass")
+    imported = import_times("valostats.py", "--help")
+
+    assert sum(self_us for name, self_us in imported.items() if name not in baseline) < STARTUP_BUDGET_US
+
+
+def test_subcommand_help_uses_command_name(capsys):
+    with pytest.raises(SystemExit):
+        valostats.main(["sync-data", "--help"])
+
+    assert capsys.readouterr().out.startswith("usage: valostats sync-data")
+
+
+def test_unknown_command():
+    with pytest.raises(SystemExit) as excinfo:
+        valostats.main(["dance"])
+
+    assert excinfo.value.code == 2
+
+
+def test_convert(tmp_path):
+    csv_path = tmp_path / "match.csv"
+    pd.DataFrame(
+        {"roundNumber": [1], "phase": ["buy"]} | {f"{i}_{axis}": [0.0] for i in range(1, 11) for axis in "xy"}
+    ).to_csv(csv_path, index=False)
+
+    assert valostats.main(["convert", str(csv_path)]) == 0
+    assert is_columnar_replay(str(tmp_path / "match.replay"))
+
+
+def test_heatmap_aggregation_does_not_import_matplotlib():
+    imported = import_times("-c", "import src.replay.heatmap")
+
+    assert not [name for name in imported if name.startswith(("matplotlib", "PIL"))]
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+def test_runs_sync_and_async_commands(is_async):
+    async def async_main(args):
+        return 3
+
+    module = types.SimpleNamespace(
+        parse_args=lambda argv, prog: argv, main=async_main if is_async else (lambda args: 3)
+    )
+
+    with patch("valostats.importlib.import_module", return_value=module):
+        assert valostats.main(["convert", "match.csv"]) == 3
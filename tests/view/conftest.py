@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture()
+def replay_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    frame_count = 12
+    data = {
+        "roundNumber": np.repeat([1, 2], frame_count // 2),
+        "phase": ["buy"] * 3 + ["combat"] * 3 + ["buy"] * 6,
+    }
+    for i in range(1, 11):
+        data[f"{i}_x"] = rng.uniform(-5000, 5000, frame_count)
+        data[f"{i}_y"] = rng.uniform(-8000, 0, frame_count)
+    data["3_x"][4] = np.nan
+
+    path = tmp_path / "replay.csv"
+    pd.DataFrame(data).to_csv(path, index=False)
+    return str(path)
@@ -0,0 +1,52 @@
+import pickle
+
+import pytest
+from PIL import Image
+
+from src.view.export import ReplayExporter, render_worker_chunk
+from src.view.ViewMap import ViewMap
+
+
+@pytest.fixture()
+def view_map(replay_csv):
+    return ViewMap("ascent", replay_csv)
+
+
+def test_invalid_stride(view_map):
+    with pytest.raises(ValueError, match="stride must be at least 1"):
+        ReplayExporter(view_map, stride=0)
+
+
+def test_unsupported_format(view_map, tmp_path):
+    with pytest.raises(ValueError, match="Unsupported export format: avi"):
+        ReplayExporter(view_map, workers=1).export(str(tmp_path / "replay.avi"))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_export_png_frames(view_map, tmp_path, workers):
+    output = tmp_path / "frames"
+    ReplayExporter(view_map, stride=2, workers=workers, figsize=(2, 2), dpi=50).export(str(output), "png")
+
+    frames = sorted(path.name for path in output.iterdir())
+    assert frames == [f"frame_{index:06d}.png" for index in range(6)]
+    assert Image.open(output / frames[0]).size == (100, 100)
+
+
+def test_export_gif(view_map, tmp_path):
+    output = tmp_path / "replay.gif"
+    ReplayExporter(view_map, stride=3, workers=2, figsize=(2, 2), dpi=50).export(str(output))
+
+    with Image.open(output) as gif:
+        assert gif.n_frames == 4
+
+
+def test_chunks_do_not_carry_the_map_image(view_map, tmp_path):
+    chunks = ReplayExporter(view_map, workers=2)._chunks(str(tmp_path))
+
+    map_image_size = view_map.map_img.width * view_map.map_img.height * 4
+    assert all(len(pickle.dumps(chunk)) < map_image_size for chunk in chunks)
+
+
+def test_uninitialized_worker(view_map, tmp_path):
+    with pytest.raises(RuntimeError, match="Worker was not initialized"):
+        render_worker_chunk(ReplayExporter(view_map, workers=1)._chunks(str(tmp_path))[0])
@@ -0,0 +1,29 @@
+import logging
+from unittest.mock import patch
+
+from src.view.playback import FrameRateMeter
+
+
+def test_frame_rate_meter_without_frames():
+    assert FrameRateMeter().fps == 0.0
+
+
+@patch("src.view.playback.time.perf_counter", side_effect=[10.0, 10.5, 11.0])
+def test_frame_rate_meter_fps(_):
+    meter = FrameRateMeter()
+    for _ in range(3):
+        meter.tick()
+
+    assert meter.frames == 3
+    assert meter.fps == 2.0
+
+
+def test_frame_rate_meter_report(caplog):
+    caplog.set_level(logging.INFO)
+    meter = FrameRateMeter()
+    with patch("src.view.playback.time.perf_counter", side_effect=[0.0, 0.25]):
+        meter.tick()
+        meter.tick()
+    meter.report(target_fps=200)
+
+    assert "Rendered 2 frames at 4.0 FPS (target 200.0 FPS)" in caplog.text
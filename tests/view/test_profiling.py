@@ -0,0 +1,136 @@
+import json
+import logging
+from itertools import count
+from unittest.mock import patch
+
+import pytest
+
+from src.view.profiling import STAGES, FrameProfiler
+from src.view.ViewMap import ViewMap, parse_args
+
+
+def fake_clock(step=0.001):
+    ticks = count()
+    return lambda: next(ticks) * step
+
+
+def play_frame(profiler, frame, stages=STAGES):
+    profiler.begin_frame(frame)
+    for stage in stages:
+        profiler.lap(stage)
+    profiler.end_frame()
+
+
+def test_profiler_splits_frames_into_stages():
+    with patch("src.view.profiling.time.perf_counter", fake_clock()):
+        profiler = FrameProfiler()
+        for frame in range(3):
+            play_frame(profiler, frame)
+
+    assert profiler.frames == 3
+    for stage in STAGES:
+        assert profiler.percentiles(stage) == pytest.approx({"p50": 0.001, "p95": 0.001, "p99": 0.001})
+    assert profiler.percentiles("frame")["p50"] == pytest.approx(0.004)
+
+
+def test_profiler_charges_work_between_frames_to_the_next_frame():
+    with patch("src.view.profiling.time.perf_counter", fake_clock()):
+        profiler = FrameProfiler()
+        play_frame(profiler, 0)
+        profiler.add("transform", 0.5)
+        play_frame(profiler, 1)
+
+    assert list(profiler.samples["transform"]) == pytest.approx([0.001, 0.501])
+
+
+def test_profiler_counts_dropped_frames():
+    profiler = FrameProfiler(target_fps=100)
+    with patch("src.view.profiling.time.perf_counter", side_effect=[0.0, 0.0, 0.01, 0.01, 0.04, 0.04, 0.045]):
+        for frame in range(3):
+            profiler.begin_frame(frame)
+            profiler.end_frame()
+        profiler.begin_frame(3)
+
+    # 10 ms is on budget, 30 ms means two refreshes went by without a new frame
+    assert profiler.dropped == 2
+    assert list(profiler.intervals) == pytest.approx([0.01, 0.03, 0.005])
+
+
+def test_profiler_rolling_percentiles(caplog):
+    caplog.set_level(logging.INFO)
+    with patch("src.view.profiling.time.perf_counter", fake_clock()):
+        profiler = FrameProfiler(window=2)
+        play_frame(profiler, 0, stages=["fetch"] * 5)
+        play_frame(profiler, 1)
+        play_frame(profiler, 2)
+
+    assert profiler.percentiles("fetch", rolling=True)["p99"] == pytest.approx(0.001)
+    assert profiler.percentiles("fetch")["p99"] == pytest.approx(0.005, rel=0.1)
+    assert "Last 2 frames: fetch " in caplog.text
+
+
+def test_profiler_window_validation():
+    with pytest.raises(ValueError, match="window must be at least 1"):
+        FrameProfiler(window=0)
+
+
+def test_profiler_instrument_draw_closes_the_frame():
+    calls = []
+    profiler = FrameProfiler()
+    draw = profiler.instrument_draw(lambda bbox: calls.append(bbox))
+
+    draw("bbox")
+    profiler.begin_frame(0)
+    profiler.lap("artists")
+    draw("bbox")
+
+    assert calls == ["bbox", "bbox"]
+    assert profiler.frames == 1
+    assert profiler.samples["draw"][0] > 0
+
+
+def test_profiler_report_writes_chrome_trace(tmp_path, caplog):
+    caplog.set_level(logging.INFO)
+    trace_path = tmp_path / "trace" / "frames.json"
+    with patch("src.view.profiling.time.perf_counter", fake_clock()):
+        profiler = FrameProfiler(trace_path=str(trace_path))
+        play_frame(profiler, 0)
+        profiler.begin_frame(1)
+        profiler.lap("fetch")
+        profiler.report()
+
+    events = json.loads(trace_path.read_text())["traceEvents"]
+    assert [event["name"] for event in events] == ["frame", *STAGES, "frame", "fetch"]
+    assert all(event["ph"] == "X" for event in events)
+    assert events[1]["ts"] == events[0]["ts"]
+    assert events[2]["ts"] == events[1]["ts"] + events[1]["dur"]
+    assert events[5]["args"] == {"frame": 1}
+    assert "Profiled 2 frames, 0 dropped: fetch " in caplog.text
+
+
+def test_view_map_profiles_update(replay_csv):
+    import matplotlib.pyplot as plt
+
+    profiler = FrameProfiler()
+    view_map = ViewMap("ascent", replay_csv, stream=True, chunk_frames=5, profiler=profiler)
+    fig, ax = plt.subplots()
+    players = ax.scatter([], [])
+    title = ax.text(0, 0, "")
+    blit = profiler.instrument_draw(fig.canvas.blit)
+
+    for frame in view_map.iter_frame_indices():
+        view_map.update(frame, players, title)
+        blit(ax.bbox)
+    plt.close(fig)
+
+    assert profiler.frames == 12
+    assert all(len(samples) == 12 for samples in profiler.samples.values())
+    # The second and third chunks are converted between frames and charged to their first frame
+    assert profiler.samples["transform"][5] > profiler.samples["transform"][4]
+
+
+def test_view_map_profile_arguments():
+    args = parse_args(["ascent", "replay.csv", "--trace", "trace.json"])
+
+    assert args.trace == "trace.json"
+    assert not args.profile
@@ -0,0 +1,78 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.models.game_map.game_map import GameMap
+from src.replay.columnar import convert_csv
+from src.view.ViewMap import ViewMap
+
+
+def test_view_map_loads_csv(replay_csv):
+    view_map = ViewMap("ascent", replay_csv)
+
+    assert view_map.current_game is not None
+    assert len(view_map.frames) == 12
+    assert view_map.player_positions.shape == (12, 10, 2)
+    assert view_map.title_for_frame(3) == "ascent Map - Phase: combat, Round: 1"
+
+
+def test_view_map_opens_columnar_replay_without_parsing(replay_csv):
+    csv_view = ViewMap("ascent", replay_csv)
+    columnar_view = ViewMap("ascent", convert_csv(replay_csv))
+
+    assert columnar_view.current_game is None
+    assert isinstance(columnar_view.frames.positions, np.memmap)
+    np.testing.assert_allclose(columnar_view.player_positions, csv_view.player_positions, rtol=1e-6)
+    assert columnar_view.title_for_frame(7) == csv_view.title_for_frame(7)
+
+
+def test_view_map_missing_csv(tmp_path):
+    with pytest.raises(FileNotFoundError, match="CSV file not found"):
+        ViewMap("ascent", str(tmp_path / "missing.csv"))
+
+
+def test_view_map_streams_frames_in_chunks(replay_csv):
+    full_view = ViewMap("ascent", replay_csv)
+    stream_view = ViewMap("ascent", replay_csv, stream=True, chunk_frames=5)
+
+    assert stream_view.current_game is None
+    assert len(stream_view.frames) == 5
+
+    streamed_positions = []
+    titles = []
+    for frame in stream_view.iter_frame_indices():
+        streamed_positions.append(stream_view.player_positions[frame])
+        titles.append(stream_view.title_for_frame(frame))
+
+    np.testing.assert_allclose(streamed_positions, full_view.player_positions, rtol=1e-6)
+    assert titles == [full_view.title_for_frame(frame) for frame in range(len(full_view.frames))]
+
+
+def test_view_map_stream_restarts_on_repeat(replay_csv):
+    stream_view = ViewMap("ascent", replay_csv, stream=True, chunk_frames=5)
+
+    first_pass = [stream_view.title_for_frame(frame) for frame in stream_view.iter_frame_indices()]
+    second_pass = [stream_view.title_for_frame(frame) for frame in stream_view.iter_frame_indices()]
+
+    assert len(first_pass) == 12
+    assert second_pass == first_pass
+
+
+def test_view_map_stream_of_empty_replay(tmp_path):
+    path = tmp_path / "empty.csv"
+    path.write_text("roundNumber,phase," + ",".join(f"{i}_x,{i}_y" for i in range(1, 11)) + "\n")
+
+    with pytest.raises(RuntimeError, match="Replay contains no frames"):
+        ViewMap("ascent", str(path), stream=True)
+
+
+def test_convert_coordinates_stays_on_the_scalar_path(replay_csv):
+    view_map = ViewMap("ascent", replay_csv)
+    expected = tuple(view_map.selected_map.world_to_image(np.array([1200.0, -3400.0])))
+
+    with patch.object(GameMap, "world_to_image", side_effect=AssertionError("batched transform used")):
+        x, y = view_map.convert_coordinates(1200.0, -3400.0, view_map.selected_map)
+
+    assert (x, y) == pytest.approx(expected)
+    assert type(x) is float and type(y) is float
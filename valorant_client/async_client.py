@@ -0,0 +1,69 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, TypeVar
+from uuid import UUID
+
+from valorant_client.client import ValorantClient
+
+T = TypeVar("T")
+
+
+class AsyncValorantClient:
+    DEFAULT_MAX_CONCURRENCY = 8
+
+    def __init__(self, client: ValorantClient | None = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        # A client passed in belongs to the caller and is left open on close
+        self._owns_client = client is None
+        self.client = client if client is not None else ValorantClient(pool_size=max_concurrency)
+        # Requests are blocking, so they run on a dedicated pool whose size is the in-flight cap
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="valorant-client")
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def get_all_maps(self) -> dict[str, Any]:
+        return await self._run(self.client.get_all_maps)
+
+    async def get_map_by_uuid(self, map_uuid: UUID) -> dict[str, Any]:
+        return await self._run(self.client.get_map_by_uuid, map_uuid)
+
+    async def get_all_agents(self, language: str = "en-US", is_playable_character: bool = True) -> dict[str, Any]:
+        return await self._run(self.client.get_all_agents, language, is_playable_character)
+
+    async def get_agent_by_uuid(self, agent_uuid: UUID, language: str = "en-US") -> dict[str, Any]:
+        return await self._run(self.client.get_agent_by_uuid, agent_uuid, language)
+
+    async def gather(self, *awaitables: Awaitable[T], return_exceptions: bool = False) -> list[T | BaseException]:
+        return list(await asyncio.gather(*awaitables, return_exceptions=return_exceptions))
+
+    async def get_maps_by_uuid(
+        self, map_uuids: Iterable[UUID], return_exceptions: bool = False
+    ) -> list[dict[str, Any] | BaseException]:
+        return await self.gather(
+            *(self.get_map_by_uuid(map_uuid) for map_uuid in map_uuids), return_exceptions=return_exceptions
+        )
+
+    async def get_agents_by_uuid(
+        self, agent_uuids: Iterable[UUID], language: str = "en-US", return_exceptions: bool = False
+    ) -> list[dict[str, Any] | BaseException]:
+        return await self.gather(
+            *(self.get_agent_by_uuid(agent_uuid, language) for agent_uuid in agent_uuids),
+            return_exceptions=return_exceptions,
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        if self._owns_client:
+            self.client.close()
+
+    async def __aenter__(self) -> "AsyncValorantClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
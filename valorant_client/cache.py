@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from logging import getLogger
+from typing import Any
+
+logger = getLogger(__name__)
+
+DEFAULT_CACHE_DIRECTORY = os.path.join(".cache", "valorant-api")
+
+
+class CacheMissError(LookupError):
+    pass
+
+
+def conditional_headers(etag: str | None, last_modified: str | None) -> dict[str, str]:
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+@dataclass
+class CachedResponse:
+    body: dict[str, Any]
+    etag: str | None = None
+    last_modified: str | None = None
+    stored_at: float = 0.0
+    ttl: float = 0.0
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        now = time.time() if now is None else now
+        return now - self.stored_at < self.ttl
+
+    def conditional_headers(self) -> dict[str, str]:
+        return conditional_headers(self.etag, self.last_modified)
+
+
+class ResponseCache(ABC):
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, response: CachedResponse) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class DiskResponseCache(ResponseCache):
+    DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIRECTORY, max_size: int = DEFAULT_MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        # Entry sizes in least to most recently used order; the directory is only scanned once, on startup, with the
+        # file mtimes carrying the access order over from previous runs
+        self._sizes: OrderedDict[str, int] = OrderedDict()
+        self._total_size = 0
+        self._load_sizes()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{hashlib.sha256(key.encode()).hexdigest()}.json")
+
+    def _load_sizes(self) -> None:
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, entry.path, stat.st_size))
+        for _, path, size in sorted(entries):
+            self._track(path, size)
+
+    def _track(self, path: str, size: int) -> None:
+        self._untrack(path)
+        self._sizes[path] = size
+        self._total_size += size
+
+    def _untrack(self, path: str) -> None:
+        self._total_size -= self._sizes.pop(path, 0)
+
+    def get(self, key: str) -> CachedResponse | None:
+        path = self._path(key)
+        try:
+            with open(path) as file:
+                entry = json.load(file)
+            # The file mtime doubles as the last access time used for LRU eviction after a restart
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+            self.delete(key)
+            return None
+
+        with self._lock:
+            if path in self._sizes:
+                self._sizes.move_to_end(path)
+        if entry.pop("key", None) != key:
+            return None
+        return CachedResponse(**entry)
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        path = self._path(key)
+        file = tempfile.NamedTemporaryFile("w", dir=self.directory, suffix=".tmp", delete=False)
+        try:
+            with file:
+                json.dump({"key": key, **asdict(response)}, file, separators=(",", ":"))
+            size = os.path.getsize(file.name)
+            os.replace(file.name, path)
+        except BaseException:
+            try:
+                os.remove(file.name)
+            except FileNotFoundError:
+                pass
+            raise
+        with self._lock:
+            self._track(path, size)
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        path = self._path(key)
+        with self._lock:
+            self._untrack(path)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sizes.clear()
+            self._total_size = 0
+        for entry in self._entries():
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+    def size(self) -> int:
+        return self._total_size
+
+    def _entries(self) -> list[os.DirEntry]:
+        return [entry for entry in os.scandir(self.directory) if entry.is_file() and entry.name.endswith(".json")]
+
+    def _evict(self) -> None:
+        while self._total_size > self.max_size and self._sizes:
+            path, size = self._sizes.popitem(last=False)
+            self._total_size -= size
+            try:
+                os.remove(path)
+                logger.debug(f"Evicted cache entry {path}")
+            except FileNotFoundError:
+                pass
@@ -1,27 +1,123 @@
+import time
+from collections.abc import Mapping
 from logging import INFO, basicConfig, getLogger
 from typing import Any
 from uuid import UUID
 
-from requests import get
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from valorant_client.cache import CachedResponse, CacheMissError, ResponseCache
+from valorant_client.metrics import NULL_METRICS, Metrics
+from valorant_client.throttle import UNTHROTTLED, Throttle
 
 basicConfig(level=INFO)
 logger = getLogger(__name__)
 
 
+def create_session(pool_size: int) -> Session:
+    # A single keep-alive pool lets consecutive requests reuse the same TCP+TLS connection
+    session = Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class ValorantClient:
-    def __init__(self):
-        self.base_url = "https://valorant-api.com/v1"
+    DEFAULT_BASE_URL = "https://valorant-api.com/v1"
+    DEFAULT_POOL_SIZE = 10
+    DEFAULT_CACHE_TTL = 0.0
+
+    def __init__(
+        self,
+        session: Session | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        cache: ResponseCache | None = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        offline: bool = False,
+        base_url: str = DEFAULT_BASE_URL,
+        throttle: Throttle | None = None,
+        metrics: Metrics = NULL_METRICS,
+    ):
+        if offline and cache is None:
+            raise ValueError("Offline mode requires a response cache")
+        self.base_url = base_url.rstrip("/")
+        self.session = session if session is not None else create_session(pool_size)
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.offline = offline
+        self.throttle = throttle if throttle is not None else UNTHROTTLED
+        self.metrics = metrics
 
     @staticmethod
-    def _get(url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+    def _cache_key(url: str, params: dict[str, Any] | None = None) -> str:
+        if not params:
+            return url
+        query = "&".join(f"{key}={value}" for key, value in sorted(params.items()))
+        return f"{url}?{query}"
+
+    def _get(self, url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        key = self._cache_key(url, params)
+        cached = self.cache.get(key) if self.cache is not None else None
+
+        if self.offline:
+            if cached is None:
+                self.metrics.cache_miss("api")
+                raise CacheMissError(f"No cached response for {key} in offline mode")
+            self.metrics.cache_hit("api")
+            return cached.body
+        if cached is not None and cached.is_fresh():
+            logger.debug(f"Serving fresh cached response for {key}")
+            self.metrics.cache_hit("api")
+            return cached.body
+
+        headers = cached.conditional_headers() if cached is not None else None
         try:
-            response = get(url, params=params)
-            response.raise_for_status()
+            with self.throttle.request(
+                self.session, url, self.metrics, "api", params=params, headers=headers
+            ) as response:
+                if response.status_code == 304 and cached is not None:
+                    logger.debug(f"Revalidated cached response for {key}")
+                    self.metrics.cache_hit("api")
+                    self._store(key, cached.body, response.headers, cached)
+                    return cached.body
+                response.raise_for_status()
+                body = response.json()
+                self.metrics.bytes_received("api", len(response.content))
+                if self.cache is not None:
+                    self.metrics.cache_miss("api")
         except Exception as e:
             logger.exception(f"Error during get request: {e}")
             raise
 
-        return response.json()
+        self._store(key, body, response.headers)
+        return body
+
+    def _store(
+        self, key: str, body: dict[str, Any], headers: Mapping[str, str], previous: CachedResponse | None = None
+    ) -> None:
+        if self.cache is None:
+            return
+        self.cache.set(
+            key,
+            CachedResponse(
+                body=body,
+                etag=headers.get("ETag") or (previous.etag if previous else None),
+                last_modified=headers.get("Last-Modified") or (previous.last_modified if previous else None),
+                stored_at=time.time(),
+                ttl=self.cache_ttl,
+            ),
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "ValorantClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def get_all_maps(self) -> dict[str, Any]:
         url = f"{self.base_url}/maps"
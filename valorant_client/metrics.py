@@ -0,0 +1,200 @@
+import json
+import math
+import os
+import tempfile
+import threading
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from typing import Any
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRIC_PREFIX = "valostats"
+
+
+class Metrics:
+    # The hooks the client, downloader and throttle call. Every hook is a no-op here, so the default costs one
+    # method call per event; subclass and override the hooks you need
+    def request_started(self, client: str) -> None:
+        pass
+
+    def request_finished(self, client: str, status: int | None, seconds: float) -> None:
+        pass
+
+    def bytes_received(self, client: str, size: int) -> None:
+        pass
+
+    def retried(self, client: str, reason: str) -> None:
+        pass
+
+    def cache_hit(self, client: str) -> None:
+        pass
+
+    def cache_miss(self, client: str) -> None:
+        pass
+
+
+NULL_METRICS = Metrics()
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        # One count per upper bound plus the +Inf overflow bucket, not cumulative
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, fraction: float) -> float:
+        # Upper bound of the bucket holding the requested rank; the overflow bucket reports the largest value seen
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        bounds = [f"{bound:g}" for bound in self.buckets] + ["+Inf"]
+        totals, seen = [], 0
+        for count in self.counts:
+            seen += count
+            totals.append(seen)
+        return list(zip(bounds, totals))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(self.cumulative()),
+        }
+
+
+class MetricsRecorder(Metrics):
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.latency: dict[str, Histogram] = defaultdict(lambda: Histogram(self.buckets))
+        self.requests: Counter[tuple[str, str]] = Counter()
+        self.bytes: Counter[str] = Counter()
+        self.retries: Counter[tuple[str, str]] = Counter()
+        self.cache_hits: Counter[str] = Counter()
+        self.cache_misses: Counter[str] = Counter()
+        self.in_flight: Counter[str] = Counter()
+        self.peak_in_flight: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def request_started(self, client: str) -> None:
+        with self._lock:
+            self.in_flight[client] += 1
+            self.peak_in_flight[client] = max(self.peak_in_flight[client], self.in_flight[client])
+
+    def request_finished(self, client: str, status: int | None, seconds: float) -> None:
+        with self._lock:
+            self.in_flight[client] -= 1
+            self.requests[client, "error" if status is None else str(status)] += 1
+            self.latency[client].observe(seconds)
+
+    def bytes_received(self, client: str, size: int) -> None:
+        with self._lock:
+            self.bytes[client] += size
+
+    def retried(self, client: str, reason: str) -> None:
+        with self._lock:
+            self.retries[client, reason] += 1
+
+    def cache_hit(self, client: str) -> None:
+        with self._lock:
+            self.cache_hits[client] += 1
+
+    def cache_miss(self, client: str) -> None:
+        with self._lock:
+            self.cache_misses[client] += 1
+
+    @property
+    def clients(self) -> list[str]:
+        names = set(self.latency) | set(self.bytes) | set(self.cache_hits) | set(self.cache_misses)
+        return sorted(names | {client for client, _ in self.requests} | {client for client, _ in self.retries})
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                client: {
+                    "requests": {
+                        status: count for (name, status), count in sorted(self.requests.items()) if name == client
+                    },
+                    "latency_seconds": self.latency[client].to_dict() if client in self.latency else None,
+                    "bytes": self.bytes[client],
+                    "retries": {
+                        reason: count for (name, reason), count in sorted(self.retries.items()) if name == client
+                    },
+                    "cache_hits": self.cache_hits[client],
+                    "cache_misses": self.cache_misses[client],
+                    "peak_in_flight": self.peak_in_flight[client],
+                }
+                for client in self.clients
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        # Prometheus text exposition format 0.0.4
+        name = METRIC_PREFIX
+        lines = []
+        with self._lock:
+            lines += [
+                f"# HELP {name}_request_duration_seconds Time from sending a request to releasing its response",
+                f"# TYPE {name}_request_duration_seconds histogram",
+            ]
+            for client, histogram in sorted(self.latency.items()):
+                for bound, total in histogram.cumulative():
+                    lines.append(f'{name}_request_duration_seconds_bucket{{client="{client}",le="{bound}"}} {total}')
+                lines.append(f'{name}_request_duration_seconds_sum{{client="{client}"}} {histogram.sum}')
+                lines.append(f'{name}_request_duration_seconds_count{{client="{client}"}} {histogram.count}')
+
+            lines += [f"# HELP {name}_requests_total Responses by status", f"# TYPE {name}_requests_total counter"]
+            for (client, status), count in sorted(self.requests.items()):
+                lines.append(f'{name}_requests_total{{client="{client}",status="{status}"}} {count}')
+
+            lines += [f"# HELP {name}_retries_total Retried requests", f"# TYPE {name}_retries_total counter"]
+            for (client, reason), count in sorted(self.retries.items()):
+                lines.append(f'{name}_retries_total{{client="{client}",reason="{reason}"}} {count}')
+
+            counters = [
+                ("received_bytes_total", "Response body bytes received", self.bytes),
+                ("cache_hits_total", "Requests answered from a cache or revalidated", self.cache_hits),
+                ("cache_misses_total", "Requests that had to download a body", self.cache_misses),
+            ]
+            for metric, description, values in counters:
+                lines += [f"# HELP {name}_{metric} {description}", f"# TYPE {name}_{metric} counter"]
+                lines += [f'{name}_{metric}{{client="{client}"}} {value}' for client, value in sorted(values.items())]
+
+            lines += [
+                f"# HELP {name}_in_flight_peak Most requests in flight at once",
+                f"# TYPE {name}_in_flight_peak gauge",
+            ]
+            for client, peak in sorted(self.peak_in_flight.items()):
+                lines.append(f'{name}_in_flight_peak{{client="{client}"}} {peak}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        # .prom and .txt files get the Prometheus text format, anything else JSON
+        text = self.to_prometheus() if path.endswith((".prom", ".txt")) else self.to_json() + "\n"
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=directory, suffix=".tmp", delete=False) as file:
+            file.write(text)
+        os.replace(file.name, path)
@@ -0,0 +1,238 @@
+import argparse
+import glob
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import INFO, basicConfig, getLogger
+from typing import Any
+from urllib.parse import urlsplit
+
+basicConfig(level=INFO)
+logger = getLogger(__name__)
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIRECTORY = os.path.join(ROOT_DIRECTORY, "src", "data")
+ASSETS_DIRECTORY = os.path.join(ROOT_DIRECTORY, "src", "assets")
+DEFAULT_ASSET_SIZE = 64 * 1024
+ASSET_FIELDS = {
+    "maps": {"displayIcon": "display_icon", "listViewIcon": "list_view_icon", "splash": "splash"},
+    "agents": {"displayIcon": "display_icon", "displayIconSmall": "display_icon_small"},
+}
+
+
+def load_entries(data_directory: str, kind: str) -> dict[str, dict[str, Any]]:
+    entries = {}
+    for path in sorted(glob.glob(os.path.join(data_directory, kind, "*.json"))):
+        with open(path) as file:
+            entry = json.load(file)
+        entries[entry["uuid"]] = entry
+    return entries
+
+
+def index_assets(entries: dict[str, dict[str, dict[str, Any]]], assets_directory: str) -> dict[str, str]:
+    # Maps the path of every media URL in the data to the file asset_downloader saved for it, if present
+    assets = {}
+    for kind, fields in ASSET_FIELDS.items():
+        for entry in entries.get(kind, {}).values():
+            directory = os.path.join(assets_directory, kind, entry["displayName"].replace("/", "").lower())
+            for field, asset_name in fields.items():
+                path = os.path.join(directory, f"{asset_name}.png")
+                if entry.get(field) and os.path.isfile(path):
+                    assets[urlsplit(entry[field]).path] = path
+    return assets
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    server: "StubServer"
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle on, keep-alive clients stall on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path.rstrip("/")
+        status = self.server.inject_fault()
+        if status is not None:
+            retry_after = self.server.retry_after() if status == 429 else None
+            self._send_json(status, {"status": status, "error": "Injected failure"}, retry_after=retry_after)
+            return
+
+        parts = path.split("/")[1:]
+        if parts[:1] == ["media"] and len(parts) > 1:
+            self._send(200, self.server.asset_body(path.removeprefix("/media")), "image/png")
+        elif parts[:1] == ["v1"] and len(parts) in (2, 3) and parts[1] in self.server.entries:
+            entries = self.server.entries[parts[1]]
+            if len(parts) == 2:
+                self._send_json(200, {"status": 200, "data": list(entries.values())})
+            elif parts[2] in entries:
+                self._send_json(200, {"status": 200, "data": entries[parts[2]]})
+            else:
+                self._send_json(404, {"status": 404, "error": f"{parts[1][:-1]} not found"})
+        else:
+            self._send_json(404, {"status": 404, "error": "Not found"})
+
+    def _send_json(self, status: int, body: dict[str, Any], retry_after: int | None = None) -> None:
+        self._send(status, json.dumps(body).encode(), "application/json", retry_after)
+
+    def _send(self, status: int, body: bytes, content_type: str, retry_after: int | None = None) -> None:
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            status, body = 304, b""
+        self.server.record(status)
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if status in (200, 304):
+            self.send_header("ETag", etag)
+        if retry_after is not None:
+            self.send_header("Retry-After", str(retry_after))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        data_directory: str = DATA_DIRECTORY,
+        assets_directory: str = ASSETS_DIRECTORY,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        asset_size: int = DEFAULT_ASSET_SIZE,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate: float | None = None,
+        burst: int | None = None,
+        failure_rate: float = 0.0,
+        failure_status: int = 503,
+        seed: int | None = None,
+    ):
+        # Serves the committed src/data snapshot and downloaded assets in valorant-api.com's shape, for offline
+        # tests and load tests. Latency, 429 throttling above `rate` requests/s and random failures are injectable
+        super().__init__((host, port), StubRequestHandler)
+        self.entries = {kind: load_entries(data_directory, kind) for kind in ASSET_FIELDS}
+        self.assets = index_assets(self.entries, assets_directory)
+        self.synthetic_asset = bytes(index % 251 for index in range(asset_size))
+        self.latency = latency
+        self.jitter = jitter
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, math.ceil(rate or 1))
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.status_counts: Counter[int] = Counter()
+        self._random = random.Random(seed)
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @property
+    def base_url(self) -> str:
+        return f"{self.url}/v1"
+
+    @property
+    def asset_base_url(self) -> str:
+        return f"{self.url}/media"
+
+    def asset_url(self, name: str) -> str:
+        return f"{self.asset_base_url}/{name}"
+
+    def asset_body(self, path: str) -> bytes:
+        # Recorded assets are served from disk, anything else gets a synthetic payload of asset_size bytes
+        asset_path = self.assets.get(path)
+        if asset_path is None:
+            return self.synthetic_asset
+        with open(asset_path, "rb") as file:
+            return file.read()
+
+    def inject_fault(self) -> int | None:
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0.0, self.jitter) if self.jitter else 0.0)
+            failed = self.failure_rate > 0 and self._random.random() < self.failure_rate
+            throttled = False
+            if self.rate is not None:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+                self._refilled_at = now
+                throttled = self._tokens < 1.0
+                if not throttled:
+                    self._tokens -= 1.0
+        if delay:
+            time.sleep(delay)
+        if throttled:
+            return 429
+        return self.failure_status if failed else None
+
+    def retry_after(self) -> int:
+        with self._lock:
+            missing = max(0.0, 1.0 - self._tokens)
+        return max(1, math.ceil(missing / self.rate)) if self.rate else 1
+
+    def record(self, status: int) -> None:
+        with self._lock:
+            self.status_counts[status] += 1
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve the local data snapshot as a stand-in for valorant-api.com")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--data-directory", default=DATA_DIRECTORY)
+    parser.add_argument("--assets-directory", default=ASSETS_DIRECTORY)
+    parser.add_argument("--latency", type=float, default=0.0, help="Added delay per request in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay of up to this many seconds")
+    parser.add_argument("--rate", type=float, help="Requests per second before answering 429")
+    parser.add_argument("--burst", type=int, help="Requests allowed at once before throttling, defaults to the rate")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of requests that fail")
+    parser.add_argument("--failure-status", type=int, default=503, help="Status code of injected failures")
+    parser.add_argument("--seed", type=int, help="Seed for latency jitter and failure injection")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    server = StubServer(
+        args.data_directory,
+        args.assets_directory,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        rate=args.rate,
+        burst=args.burst,
+        failure_rate=args.failure_rate,
+        failure_status=args.failure_status,
+        seed=args.seed,
+    )
+    logger.info(f"Serving {args.data_directory} at {server.base_url} and assets at {server.asset_base_url}")
+    server.serve_forever()
@@ -0,0 +1,77 @@
+import asyncio
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Any, TypeVar
+
+from src.models.agent.agent import Agent, AgentUUID
+from src.models.game_map.game_map import GameMap, MapUUID
+from valorant_client.async_client import AsyncValorantClient
+
+logger = getLogger(__name__)
+
+
+EnumT = TypeVar("EnumT", MapUUID, AgentUUID)
+
+
+@dataclass
+class SyncReport:
+    unknown_maps: list[dict[str, Any]] = field(default_factory=list)
+    missing_maps: list[MapUUID] = field(default_factory=list)
+    unknown_agents: list[dict[str, Any]] = field(default_factory=list)
+    missing_agents: list[AgentUUID] = field(default_factory=list)
+
+    @property
+    def has_drift(self) -> bool:
+        return bool(self.unknown_maps or self.missing_maps or self.unknown_agents or self.missing_agents)
+
+    def log(self) -> None:
+        for entry in self.unknown_maps:
+            logger.warning(f"Map not in MapUUID: {entry.get('displayName')} ({entry.get('uuid')})")
+        for map_uuid in self.missing_maps:
+            logger.warning(f"MapUUID member missing from the API: {map_uuid.name}")
+        for entry in self.unknown_agents:
+            logger.warning(f"Agent not in AgentUUID: {entry.get('displayName')} ({entry.get('uuid')})")
+        for agent_uuid in self.missing_agents:
+            logger.warning(f"AgentUUID member missing from the API: {agent_uuid.name}")
+        if not self.has_drift:
+            logger.info("API entries match MapUUID and AgentUUID")
+
+
+def match_entries(
+    entries: list[dict[str, Any]], enum_type: type[EnumT]
+) -> tuple[dict[EnumT, dict[str, Any]], list[dict[str, Any]], list[EnumT]]:
+    members_by_value = {member.value: member for member in enum_type}
+    matched: dict[EnumT, dict[str, Any]] = {}
+    unknown = []
+    for entry in entries:
+        member = members_by_value.get(entry.get("uuid", ""))
+        if member is None:
+            unknown.append(entry)
+        else:
+            matched[member] = entry
+    missing = [member for member in enum_type if member not in matched]
+    return matched, unknown, missing
+
+
+async def fetch_bulk(client: AsyncValorantClient) -> tuple[list[GameMap], list[Agent], SyncReport]:
+    all_maps, all_agents = await asyncio.gather(client.get_all_maps(), client.get_all_agents())
+
+    matched_maps, unknown_maps, missing_maps = match_entries(all_maps.get("data", []), MapUUID)
+    matched_agents, unknown_agents, missing_agents = match_entries(all_agents.get("data", []), AgentUUID)
+    report = SyncReport(unknown_maps, missing_maps, unknown_agents, missing_agents)
+
+    game_maps = []
+    for map_uuid, map_data in matched_maps.items():
+        try:
+            game_maps.append(GameMap.from_dict(map_data))
+        except Exception as e:
+            logger.exception(f"Error parsing data for {map_uuid.name.lower()}: {e}")
+
+    agents = []
+    for agent_uuid, agent_data in matched_agents.items():
+        try:
+            agents.append(Agent.from_dict(agent_data))
+        except Exception as e:
+            logger.exception(f"Error parsing data for {agent_uuid.name.lower()}: {e}")
+
+    return game_maps, agents, report
@@ -0,0 +1,210 @@
+import argparse
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from logging import getLogger
+from typing import Any
+from urllib.parse import urlsplit
+
+from requests import Response, Session
+from requests.exceptions import ConnectionError, Timeout
+
+from valorant_client.metrics import NULL_METRICS, Metrics
+
+logger = getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float,
+        burst: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        # Takes a token, possibly going into debt, and returns how long the caller has to wait for it
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def acquire(self) -> float:
+        wait = self._reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def pause(self, delay: float) -> None:
+        # A 429 applies to every caller of the host, not just the one that received it
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + delay)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_retries: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    statuses: frozenset[int] = RETRY_STATUSES
+
+    def backoff(self, attempt: int, rng: random.Random) -> float:
+        # Full jitter keeps concurrent retries from arriving at the server in lockstep
+        return rng.uniform(0.0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def delay(self, attempt: int, rng: random.Random, retry_after: str | None = None) -> float:
+        backoff = self.backoff(attempt, rng)
+        server_delay = parse_retry_after(retry_after)
+        # Retry-After is honoured up to max_delay, so a broken or hostile header cannot stall the client for hours
+        return backoff if server_delay is None else min(self.max_delay, max(backoff, server_delay))
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+class Throttle:
+    DEFAULT_RATE = 50.0
+    DEFAULT_MAX_IN_FLIGHT = 16
+
+    def __init__(
+        self,
+        rate: float | None = DEFAULT_RATE,
+        burst: int | None = None,
+        max_in_flight: int | None = DEFAULT_MAX_IN_FLIGHT,
+        retry_policy: RetryPolicy = RetryPolicy(),
+        seed: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        # Rate limits are per host, since the API and the media CDN throttle independently, while the in-flight
+        # cap is shared by everything that goes through this throttle
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.retry_policy = retry_policy
+        self.retries = 0
+        self._random = random.Random(seed)
+        self._clock = clock
+        self._sleep = sleep
+        self._in_flight: AbstractContextManager[Any] = nullcontext()
+        if max_in_flight is not None:
+            self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket | None:
+        if self.rate is None:
+            return None
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst, self._clock, self._sleep)
+            return self._buckets[host]
+
+    def _retry_delay(self, attempt: int, retry_after: str | None = None) -> float:
+        with self._lock:
+            self.retries += 1
+            return self.retry_policy.delay(attempt, self._random, retry_after)
+
+    @contextmanager
+    def request(
+        self, session: Session, url: str, metrics: Metrics = NULL_METRICS, client: str = "api", **kwargs: Any
+    ) -> Iterator[Response]:
+        # The in-flight slot is held until the caller is done with the response, so streamed bodies count too
+        bucket = self.bucket(url)
+        attempt = 0
+        while True:
+            # The token is taken before the slot, so a host that is paused or rate limited does not hold slots that
+            # requests to other hosts could use
+            if bucket is not None:
+                bucket.acquire()
+            with self._in_flight:
+                metrics.request_started(client)
+                start = time.perf_counter()
+                status = None
+                try:
+                    try:
+                        response = session.get(url, **kwargs)
+                    except (ConnectionError, Timeout) as e:
+                        if attempt >= self.retry_policy.max_retries:
+                            raise
+                        reason = type(e).__name__
+                        delay = self._retry_delay(attempt)
+                        logger.warning(f"Request to {url} failed ({e}), retrying in {delay:.2f}s")
+                    else:
+                        status = response.status_code
+                        if status not in self.retry_policy.statuses or attempt >= self.retry_policy.max_retries:
+                            try:
+                                yield response
+                            finally:
+                                response.close()
+                            return
+                        reason = str(status)
+                        delay = self._retry_delay(attempt, response.headers.get("Retry-After"))
+                        if status == 429 and bucket is not None:
+                            bucket.pause(delay)
+                        response.close()
+                        logger.warning(f"Request to {url} returned {status}, retrying in {delay:.2f}s")
+                finally:
+                    metrics.request_finished(client, status, time.perf_counter() - start)
+            metrics.retried(client, reason)
+            self._sleep(delay)
+            attempt += 1
+
+
+def add_throttle_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--rate", type=float, default=Throttle.DEFAULT_RATE, help="Requests per second per host, 0 for no limit"
+    )
+    parser.add_argument(
+        "--max-in-flight", type=int, default=Throttle.DEFAULT_MAX_IN_FLIGHT, help="Requests in flight at once"
+    )
+    parser.add_argument(
+        "--retries", type=int, default=RetryPolicy.max_retries, help="Retries on 429, 5xx and connection errors"
+    )
+
+
+def throttle_from_args(args: argparse.Namespace) -> Throttle:
+    return Throttle(
+        rate=args.rate or None,
+        max_in_flight=args.max_in_flight,
+        retry_policy=RetryPolicy(max_retries=args.retries),
+    )
+
+
+# Clients and downloaders that are not given a throttle send requests straight through, without limits or retries
+UNTHROTTLED = Throttle(rate=None, max_in_flight=None, retry_policy=RetryPolicy(max_retries=0))
@@ -0,0 +1,45 @@
+import argparse
+import importlib
+import inspect
+import sys
+from logging import INFO, basicConfig
+
+# Subcommand -> (module, summary). Modules are only imported once their subcommand runs, so commands that never
+# render do not pay for matplotlib, pandas or PIL, and --help does not pay for anything
+COMMANDS = {
+    "sync-data": ("download_data", "Download agents and maps data from Valorant API"),
+    "sync-assets": ("asset_downloader", "Download agent and map assets from Valorant API"),
+    "view": ("src.view.ViewMap", "Play back a replay on its map"),
+    "export": ("src.view.export", "Render a replay to MP4, GIF or a PNG frame sequence"),
+    "convert": ("src.replay.columnar", "Convert a replay CSV to the columnar memory-mapped format"),
+    "heatmap": ("src.replay.heatmap", "Add replays to a map's positional heatmap"),
+    "analytics": ("src.replay.analytics", "Compute per-match, per-round and per-map stats across many replays"),
+}
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="valostats",
+        description="Valorant data, asset and replay tools",
+        epilog="\n".join(f"  {command:<12} {summary}" for command, (_, summary) in COMMANDS.items()),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("command", choices=COMMANDS, metavar="command", help="One of the commands listed below")
+    parser.add_argument("arguments", nargs=argparse.REMAINDER, help="Command arguments, see <command> --help")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    basicConfig(level=INFO)
+    module = importlib.import_module(COMMANDS[args.command][0])
+    command_args = module.parse_args(args.arguments, prog=f"valostats {args.command}")
+    if inspect.iscoroutinefunction(module.main):
+        import asyncio
+
+        return asyncio.run(module.main(command_args)) or 0
+    return module.main(command_args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())